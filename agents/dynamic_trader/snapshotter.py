@@ -279,9 +279,12 @@ class DynamicSnapshotter:
                 self._saved_metar_obs[obs_key] = True
                 continue
             
-            # Save observation
+            # Save observation; observation_time_epoch (UTC seconds) spares
+            # readers from parsing observation_time_utc
+            obs_time_utc = obs.time if obs.time.tzinfo else obs.time.replace(tzinfo=ZoneInfo("UTC"))
             snapshot_data = {
                 "observation_time_utc": obs.time.isoformat(),
+                "observation_time_epoch": int(obs_time_utc.timestamp()),
                 "fetch_time_utc": datetime.now(ZoneInfo("UTC")).isoformat(),
                 "station_code": obs.station_code,
                 "event_day": event_day.isoformat(),
@@ -0,0 +1,10 @@
+"""Hermes backend API package."""
+
+import sys
+from pathlib import Path
+
+# The engine packages (core, agents, venues) live at the project root;
+# make them importable once for every module of the API
+_PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
@@ -76,9 +76,10 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Shutdown event: stop file watcher."""
+    """Shutdown event: stop file watcher and log parse workers."""
     if FILE_WATCHER_AVAILABLE and snapshot_watcher:
         snapshot_watcher.stop()
+    logs.log_service.close()
 
 
 if __name__ == "__main__":
@@ -3,16 +3,12 @@
 from fastapi import APIRouter, Query
 from typing import Optional
 from datetime import date
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-from core.feature_toggles import FeatureToggles
+from core.feature_toggles import get_feature_toggles
 
-from ..services.metar_service import MetarService
+from ..services.metar_service import metar_service
 
 router = APIRouter()
-metar_service = MetarService()
 
 
 @router.get("/zeus-vs-metar")
@@ -33,7 +29,7 @@ async def compare_zeus_vs_metar(
             pass
     
     # Load feature toggles and pass to service
-    feature_toggles = FeatureToggles.load()
+    feature_toggles = get_feature_toggles()
     
     comparison = metar_service.compare_zeus_vs_metar(
         station_code=station_code,
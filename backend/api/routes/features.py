@@ -6,12 +6,9 @@ Allows frontend to get and update feature toggle states.
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-from core.feature_toggles import FeatureToggles
-from core.station_calibration import StationCalibration
+from core.feature_toggles import FeatureToggles, get_feature_toggles
+from core.station_calibration import get_station_calibration
 
 router = APIRouter()
 
@@ -32,7 +29,7 @@ async def get_toggles():
         }
     """
     try:
-        toggles = FeatureToggles.load()
+        toggles = get_feature_toggles()
         return toggles.to_dict()
     except Exception as e:
         raise HTTPException(
@@ -81,7 +78,9 @@ async def get_calibrations():
     """Get station calibration status.
     
     Returns information about which stations have calibration models loaded
-    and whether calibration is currently enabled.
+    and whether calibration is currently enabled. The shared calibration is
+    reloaded when files in data/calibration/ change, so this reports what
+    is on disk.
     
     Returns:
         Dictionary with calibration status:
@@ -92,8 +91,8 @@ async def get_calibrations():
         }
     """
     try:
-        calibration = StationCalibration()
-        toggles = FeatureToggles.load()
+        calibration = get_station_calibration()
+        toggles = get_feature_toggles()
         
         # Get list of stations with calibrations
         stations_with_cal = []
@@ -4,12 +4,9 @@ from fastapi import APIRouter, Query
 from typing import Optional
 from datetime import date
 
-from ..services.metar_service import MetarService
-from ..services.snapshot_service import SnapshotService
+from ..services.metar_service import metar_service
 
 router = APIRouter()
-metar_service = MetarService()
-snapshot_service = SnapshotService()
 
 
 @router.get("/observations")
@@ -2,10 +2,7 @@
 
 from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Any
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from core.registry import StationRegistry
 
 router = APIRouter()
@@ -7,6 +7,7 @@ from datetime import date
 from ..services.trade_service import TradeService
 from ..services.trade_resolution_service import TradeResolutionService
 from ..models.schemas import TradeListResponse
+from ..utils.file_utils import parse_trade_date
 
 router = APIRouter()
 trade_service = TradeService()
@@ -54,7 +55,6 @@ async def get_trade_history(
     offset: Optional[int] = Query(0, description="Offset for pagination"),
 ):
     """Get trade history with filtering and pagination."""
-    from datetime import datetime
     
     start_date_obj = None
     end_date_obj = None
@@ -71,30 +71,23 @@ async def get_trade_history(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
     
-    # Get all trades
+    # Get trades in range
     all_trades = trade_service.get_trades(
-        trade_date=None,
         station_code=station_code,
+        start_date=start_date_obj,
+        end_date=end_date_obj,
+        venue=venue,
     )
     
-    # Apply filters
+    # Apply remaining filters
     filtered = []
     for trade in all_trades:
-        try:
-            trade_date = datetime.fromisoformat(trade.timestamp.replace("Z", "+00:00")).date()
-            
-            if start_date_obj and trade_date < start_date_obj:
-                continue
-            if end_date_obj and trade_date > end_date_obj:
-                continue
-            if venue and (trade.venue or "polymarket") != venue:
-                continue
-            if outcome and (trade.outcome or "pending") != outcome:
-                continue
-            
-            filtered.append(trade)
-        except (ValueError, AttributeError):
+        if parse_trade_date(trade.timestamp) is None:
+            continue
+        if outcome and (trade.outcome or "pending") != outcome:
             continue
+        
+        filtered.append(trade)
     
     # Pagination
     total = len(filtered)
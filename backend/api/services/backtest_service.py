@@ -1,20 +1,16 @@
 """Service for running backtests via API."""
 
-import sys
 import asyncio
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import date
 import json
 
-# Add project root to path to import agents
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
 from agents.backtester import Backtester, BacktestSummary
 from core.config import config
 from core.feature_toggles import FeatureToggles
 from ..utils.job_queue import JobQueue, JobStatus, job_queue
+from ..utils.path_utils import PROJECT_ROOT
 
 
 class BacktestService:
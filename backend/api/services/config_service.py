@@ -3,12 +3,9 @@
 import os
 import yaml
 import shutil
-import sys
-from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from core.config import Config, PROJECT_ROOT
 from ..utils.path_utils import PROJECT_ROOT as API_PROJECT_ROOT
 
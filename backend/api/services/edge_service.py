@@ -1,11 +1,95 @@
 """Service for retrieving current edges from decision snapshots."""
 
+import heapq
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import date, datetime
 
 from ..utils.path_utils import get_snapshots_dir
-from ..utils.file_utils import read_json_file, list_json_files, parse_timestamp
+from ..utils.file_utils import read_json_file_cached, list_json_files, parse_timestamp
+
+
+def _edge_pct(edge: Dict[str, Any]) -> float:
+    """Sort key for ranking edges."""
+    return edge.get("edge_pct", 0.0)
+
+
+def select_edges(
+    snapshots: Iterable[Dict[str, Any]],
+    station_code: Optional[str] = None,
+    event_day: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Filter, deduplicate and rank edges from parsed decision snapshots.
+    
+    This is the whole per-record hot path of ``EdgeService.get_current_edges``
+    in one self-contained function over plain dicts, so it can be profiled or
+    swapped for a compiled implementation without touching the file scan.
+    
+    Args:
+        snapshots: Decision snapshots, most recent first
+        station_code: Optional station code filter
+        event_day: Optional event day filter (ISO date string)
+        limit: Optional limit on number of edges
+        
+    Returns:
+        List of edge dictionaries sorted by edge_pct descending
+    """
+    edges = []
+    seen_keys = set()  # Track (station, event_day, bracket) to avoid duplicates
+    
+    seen_add = seen_keys.add
+    edges_append = edges.append
+    
+    for snapshot_data in snapshots:
+        station_code_snap = snapshot_data.get("station_code", "")
+        event_day_snap = snapshot_data.get("event_day", "")
+        
+        # Apply filters
+        if station_code and station_code_snap != station_code:
+            continue
+        
+        if event_day and event_day_snap != event_day:
+            continue
+        
+        # Invariant across every decision in this snapshot
+        decisions = snapshot_data.get("decisions", [])
+        city = snapshot_data.get("city", "")
+        decision_time_utc = snapshot_data.get("decision_time_utc", "")
+        
+        for decision in decisions:
+            bracket = decision.get("bracket", "")
+            key = (station_code_snap, event_day_snap, bracket)
+            
+            # Only include most recent edge for each bracket
+            if key not in seen_keys:
+                seen_add(key)
+                
+                edges_append({
+                    "station_code": station_code_snap,
+                    "city": city,
+                    "event_day": event_day_snap,
+                    "decision_time_utc": decision_time_utc,
+                    "bracket": bracket,
+                    "lower_f": decision.get("lower_f"),
+                    "upper_f": decision.get("upper_f"),
+                    "market_id": decision.get("market_id", ""),
+                    "edge": decision.get("edge", 0.0),
+                    "edge_pct": decision.get("edge_pct", 0.0),
+                    "f_kelly": decision.get("f_kelly", 0.0),
+                    "size_usd": decision.get("size_usd", 0.0),
+                    "reason": decision.get("reason", ""),
+                    "p_zeus": decision.get("p_zeus"),
+                    "p_mkt": decision.get("p_mkt"),
+                })
+    
+    # Rank by edge_pct descending (best edges first); a bounded top-k
+    # selection is cheaper than a full sort when only a few are wanted.
+    if limit:
+        return heapq.nlargest(limit, edges, key=_edge_pct)
+    
+    edges.sort(key=_edge_pct, reverse=True)
+    return edges
 
 
 class EdgeService:
@@ -54,7 +138,7 @@ class EdgeService:
                     if day_dir.exists():
                         files = list_json_files(day_dir)
                         for file_path in files:
-                            data = read_json_file(file_path)
+                            data = read_json_file_cached(file_path)
                             if data:
                                 all_decisions.append((file_path, data))
                 else:
@@ -64,7 +148,7 @@ class EdgeService:
                             continue
                         files = list_json_files(day_dir)
                         for file_path in files:
-                            data = read_json_file(file_path)
+                            data = read_json_file_cached(file_path)
                             if data:
                                 all_decisions.append((file_path, data))
         else:
@@ -88,7 +172,7 @@ class EdgeService:
                     
                     files = list_json_files(day_dir)
                     for file_path in files:
-                        data = read_json_file(file_path)
+                        data = read_json_file_cached(file_path)
                         if data:
                             all_decisions.append((file_path, data))
         
@@ -98,56 +182,12 @@ class EdgeService:
             reverse=True
         )
         
-        # Extract edges from decisions
-        edges = []
-        seen_keys = set()  # Track (station, event_day, bracket) to avoid duplicates
-        
-        for file_path, snapshot_data in all_decisions:
-            decisions = snapshot_data.get("decisions", [])
-            station_code_snap = snapshot_data.get("station_code", "")
-            event_day_snap = snapshot_data.get("event_day", "")
-            
-            # Apply filters
-            if station_code and station_code_snap != station_code:
-                continue
-            
-            if event_day and event_day_snap != event_day.isoformat():
-                continue
-            
-            for decision in decisions:
-                bracket = decision.get("bracket", "")
-                key = (station_code_snap, event_day_snap, bracket)
-                
-                # Only include most recent edge for each bracket
-                if key not in seen_keys:
-                    seen_keys.add(key)
-                    
-                    edge_data = {
-                        "station_code": station_code_snap,
-                        "city": snapshot_data.get("city", ""),
-                        "event_day": event_day_snap,
-                        "decision_time_utc": snapshot_data.get("decision_time_utc", ""),
-                        "bracket": bracket,
-                        "lower_f": decision.get("lower_f"),
-                        "upper_f": decision.get("upper_f"),
-                        "market_id": decision.get("market_id", ""),
-                        "edge": decision.get("edge", 0.0),
-                        "edge_pct": decision.get("edge_pct", 0.0),
-                        "f_kelly": decision.get("f_kelly", 0.0),
-                        "size_usd": decision.get("size_usd", 0.0),
-                        "reason": decision.get("reason", ""),
-                        "p_zeus": decision.get("p_zeus"),
-                        "p_mkt": decision.get("p_mkt"),
-                    }
-                    edges.append(edge_data)
-        
-        # Sort by edge_pct descending (best edges first)
-        edges.sort(key=lambda e: e.get("edge_pct", 0.0), reverse=True)
-        
-        if limit:
-            edges = edges[:limit]
-        
-        return edges
+        return select_edges(
+            [snapshot_data for _, snapshot_data in all_decisions],
+            station_code=station_code,
+            event_day=event_day.isoformat() if event_day else None,
+            limit=limit,
+        )
     
     def get_edges_summary(
         self,
@@ -6,11 +6,15 @@ import subprocess
 import sys
 import json
 import time
-from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..utils.path_utils import PROJECT_ROOT
 
 
@@ -23,6 +27,10 @@ class EngineService:
         self.logs_dir.mkdir(exist_ok=True)
         self.pid_file = self.logs_dir / "dynamic_paper.pid"
         self.config_file = self.logs_dir / "engine_config.json"
+        # Parsed file contents keyed by (st_mtime_ns, st_size) so polling
+        # endpoints only re-read a file after it has actually changed
+        self._cfg_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        self._pid_cache: Optional[Tuple[Tuple[int, int], Optional[int]]] = None
     
     def start_engine(
         self,
@@ -73,11 +81,10 @@ class EngineService:
             "dynamic-paper",
             "--stations",
             stations_str,
+            "--config-file",
+            str(self.config_file),
         ]
         
-        # Set environment variables for config
-        env = self._build_env(engine_config)
-        
         # Start process
         try:
             log_file = self.logs_dir / f"dynamic_paper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
@@ -86,7 +93,6 @@ class EngineService:
                     cmd,
                     stdout=f,
                     stderr=subprocess.STDOUT,
-                    env=env,
                     cwd=str(PROJECT_ROOT),
                 )
             
@@ -203,14 +209,23 @@ class EngineService:
         Returns:
             Engine configuration dictionary, or None if not running
         """
-        if not self.config_file.exists():
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
             return None
         
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cfg_cache is not None and self._cfg_cache[0] == key:
+            return self._cfg_cache[1]
+        
         try:
             with open(self.config_file, "r") as f:
-                return json.load(f)
+                config = json.load(f)
         except Exception:
             return None
+        
+        self._cfg_cache = (key, config)
+        return config
     
     def is_running(self) -> bool:
         """Check if engine is running.
@@ -238,51 +253,35 @@ class EngineService:
         Returns:
             PID or None
         """
-        if not self.pid_file.exists():
+        try:
+            st = os.stat(self.pid_file)
+        except OSError:
             return None
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if self._pid_cache is not None and self._pid_cache[0] == key:
+            return self._pid_cache[1]
+        
         try:
-            return int(self.pid_file.read_text().strip())
+            pid = int(self.pid_file.read_text().strip())
         except Exception:
-            return None
+            pid = None
+        
+        self._pid_cache = (key, pid)
+        return pid
     
     def _save_config(self, config: Dict[str, Any]) -> None:
-        """Save engine configuration to file."""
-        with open(self.config_file, "w") as f:
-            json.dump(config, f, indent=2)
-    
-    def _build_env(self, config: Dict[str, Any]) -> Dict[str, str]:
-        """Build environment variables from configuration.
-        
-        Note: For now, we'll pass config via environment variables.
-        Later stages will improve this.
+        """Save engine configuration to file.
         
-        Args:
-            config: Engine configuration dictionary
-            
-        Returns:
-            Environment variables dictionary
+        Writes to a temporary file and renames it over the target so readers
+        never observe a partially written config.
         """
-        env = os.environ.copy()
-        
-        # Set trading config
-        trading = config["trading"]
-        env["EDGE_MIN"] = str(trading.get("edge_min", 0.05))
-        env["FEE_BP"] = str(trading.get("fee_bp", 50))
-        env["SLIPPAGE_BP"] = str(trading.get("slippage_bp", 30))
-        env["KELLY_CAP"] = str(trading.get("kelly_cap", 0.10))
-        env["PER_MARKET_CAP"] = str(trading.get("per_market_cap", 500.0))
-        env["LIQUIDITY_MIN_USD"] = str(trading.get("liquidity_min_usd", 1000.0))
-        env["DAILY_BANKROLL_CAP"] = str(trading.get("daily_bankroll_cap", 3000.0))
-        
-        # Set probability model config
-        prob = config["probability_model"]
-        env["MODEL_MODE"] = prob.get("model_mode", "spread")
-        env["ZEUS_LIKELY_PCT"] = str(prob.get("zeus_likely_pct", 0.80))
-        env["ZEUS_POSSIBLE_PCT"] = str(prob.get("zeus_possible_pct", 0.95))
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2).encode("utf-8")
         
-        # Set dynamic trading config
-        env["DYNAMIC_INTERVAL_SECONDS"] = str(config["interval_seconds"])
-        env["DYNAMIC_LOOKAHEAD_DAYS"] = str(config["lookahead_days"])
-        
-        return env
-
+        tmp_file = self.config_file.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, self.config_file)
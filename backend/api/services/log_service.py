@@ -1,16 +1,217 @@
 """Service for reading and parsing activity logs with advanced filtering."""
 
+import heapq
+import itertools
+import json
+import mmap
+import multiprocessing
+import operator
+import os
 import re
-import sys
+import sqlite3
+from collections import deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Set
-from datetime import datetime, date, timedelta
+from typing import Callable, Iterable, Iterator, List, Optional, Dict, Any, Set, Tuple
+from datetime import date, timedelta
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from core.registry import StationRegistry
 
 from ..utils.path_utils import get_logs_dir
-from ..utils.file_utils import parse_timestamp
+
+
+# Compiled once at import; these run on every line of every log file
+_TS_RE = re.compile(r'\[(?P<day>\d{4}-\d{2}-\d{2})[\sT](?P<time>\d{2}:\d{2}:\d{2})\]')
+# Timestamp, level and message (minus the trailing file.py:line) in one pass
+_LINE_RE = re.compile(
+    r'\[(?P<day>\d{4}-\d{2}-\d{2})[\sT](?P<time>\d{2}:\d{2}:\d{2})\]\s+'
+    r'(?P<level>[A-Z]+)\s+(?P<msg>.+?)(?:\s+[a-zA-Z_]+\.py:\d+)?$'
+)
+_WORD_CHAR_RE = re.compile(r'\w')
+# Message cleanup and key-info patterns used to format messages for humans
+# File references (e.g. "fetchers.py:72"), repeated level names and long
+# file paths, cleaned up in one pass; see _clean_match
+_CLEAN_RE = re.compile(
+    r'(?P<file_ref>\s+[a-zA-Z_]+\.py:\d+\s*)'
+    r'|(?P<level>\b(?:INFO|DEBUG|WARNING|ERROR|CRITICAL)(?:\s+[a-zA-Z_]+\.py:\d+\s*|\s+))'
+    r'|(?P<user_path>/Users/[^\s]+)'
+    r'|(?P<csv_path>data/[^\s]+\.csv)'
+    r'|(?P<json_path>data/[^\s]+\.json)'
+)
+_CLEAN_REPLACEMENTS = {
+    "file_ref": " ",
+    "level": "",
+    "user_path": "...",
+    "csv_path": "trade file",
+    "json_path": "snapshot",
+}
+# Every _CLEAN_RE match contains one of these; most messages have none
+_CLEAN_TRIGGERS = (".py:", "INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL", "/Users/", "data/")
+# Every _extract_key_info event needs one of these in the lowercased
+# message (or an ERROR level), so one scan rules most messages out. The
+# branches after it stay plain substring tests: a named-group union of all
+# keywords, iterated once, measured several times slower than them
+_KEY_INFO_RE = re.compile(
+    r'cycle|zeus|polymarket|brackets|metar|mapped probabilities|mapping forecast'
+    r'|edge|placing|placed|📄|recorded|error|found event|saved'
+)
+# Rank of each key-info event by its leading emoji: trade > edge > error
+# > other
+_EVENT_PRIORITY = {
+    emoji: rank
+    for rank, emoji in enumerate(("📝", "✅", "❌", "🔄", "💰", "🧮", "🌡️", "🌤️", "💾", "🔍"))
+}
+_CYCLE_RE = re.compile(r'CYCLE\s+(\d+)')
+_POINTS_RE = re.compile(r'(\d+)\s+points?')
+_BRACKETS_RE = re.compile(r'(\d+)\s+temperature\s+brackets?')
+_PRICES_RE = re.compile(r'(\d+)/(\d+)\s+prices?')
+_METAR_OBS_RE = re.compile(r'(\d+)\s+valid\s+METAR')
+_MODEL_RE = re.compile(r'(spread|bands)\s+model')
+_PEAK_RE = re.compile(r'peak\s*=\s*\[(\d+),\s*(\d+)\)')
+_PROB_RE = re.compile(r'p\s*=\s*([\d.]+)')
+_EDGE_RE = re.compile(r'\[(\d+)-(\d+)°F\)[^:]*edge[=:]\s*([\d.]+)')
+# Size following a bracket: up to the next "$" and the number after it
+_SIZE_RE = re.compile(r'[^$]*\$?([\d.]+)')
+_TRADE_DETAIL_RE = re.compile(r'\[(\d+-\d+°F)\):\s*\$([\d.]+)\s*@[^e]*edge=([\d.]+)%')
+_PLACING_RE = re.compile(r'📄\s*Placing\s+(\d+)\s+paper\s+trades?')
+_RECORDED_RE = re.compile(r'✅\s*Recorded\s+(\d+)\s+paper\s+trades?')
+_PAPER_TRADES_RE = re.compile(r'(\d+)\s+paper\s+trades?')
+# LogEntry fields indexed per file for equality filters
+_INDEXED_FIELDS = ("station_code", "level", "action_type", "event_day")
+# Any date in raw file bytes, including T-style timestamps
+_DATE_BYTES_RE = re.compile(rb'(?<!\d)(\d{4}-\d{2}-\d{2})(?!\d)')
+
+
+@dataclass(slots=True)
+class LogEntry:
+    """A parsed log entry."""
+    
+    timestamp: Optional[str] = None
+    log_file: str = ""
+    level: Optional[str] = None
+    message: str = ""
+    station_code: Optional[str] = None
+    event_day: Optional[str] = None
+    action_type: Optional[str] = None
+    # Timestamp as the integer YYYYMMDDHHMMSS (0 if missing), so sorting
+    # compares ints in C; not part of the API dictionary
+    sort_key: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary for API responses."""
+        return {
+            "timestamp": self.timestamp,
+            "log_file": self.log_file,
+            "level": self.level,
+            "message": self.message,
+            "station_code": self.station_code,
+            "event_day": self.event_day,
+            "action_type": self.action_type,
+        }
+
+
+# LogEntry field values in declaration order, as stored in the parse
+# state database (sort_key is derived from the timestamp)
+_STORED_FIELDS = tuple(field.name for field in fields(LogEntry) if field.name != "sort_key")
+_entry_row = operator.attrgetter(*_STORED_FIELDS)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> Optional[date]:
+    """Parse an ISO date string, or None if it isn't a real date.
+    
+    Cached: the same few dates repeat across every line of a log file.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _is_valid_clock(value: str) -> bool:
+    """Check an HH:MM:SS time of day (e.g. no hour 24 or leap second)."""
+    return value[:2] < "24" and value[3:5] < "60" and value[6:] < "60"
+
+
+def _clean_match(match: re.Match) -> str:
+    """Replacement for a _CLEAN_RE match."""
+    return _CLEAN_REPLACEMENTS[match.lastgroup]
+
+
+def _bracket_size(message: str, bracket: str) -> Optional[str]:
+    """Find the size quoted after a bracket (e.g. "58-59°F") in a message.
+    
+    Tries each occurrence of the bracket in turn, like searching for the
+    bracket followed by _SIZE_RE, but without building a regex per bracket.
+    """
+    start = message.find(bracket)
+    while start >= 0:
+        size_match = _SIZE_RE.match(message, start + len(bracket))
+        if size_match:
+            return size_match.group(1)
+        start = message.find(bracket, start + 1)
+    return None
+
+
+def _event_priority(event: str) -> int:
+    """Rank of a formatted key-info event, lowest first (see _EVENT_PRIORITY)."""
+    return _EVENT_PRIORITY.get(event.split(" ", 1)[0], 999)
+
+
+def _usable_cpu_count() -> int:
+    """Number of CPUs this process may run on (e.g. within a container)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _timestamp_sort_key(timestamp: Optional[str]) -> int:
+    """LogEntry.sort_key for an ISO timestamp (YYYY-MM-DDTHH:MM:SS)."""
+    if not timestamp:
+        return 0
+    return int(
+        timestamp[:4] + timestamp[5:7] + timestamp[8:10]
+        + timestamp[11:13] + timestamp[14:16] + timestamp[17:19]
+    )
+
+
+# Sort key for ordering entries by timestamp (missing sorts last)
+_sort_key = operator.attrgetter("sort_key")
+
+
+def _fields_equal(values: Dict[str, str]) -> Callable[[LogEntry], bool]:
+    """Build one predicate testing several LogEntry fields for equality.
+    
+    The fields are fetched together by a single attrgetter and compared
+    as one tuple, instead of calling a separate predicate per field.
+    """
+    getter = operator.attrgetter(*values)
+    expected = tuple(values.values()) if len(values) > 1 else next(iter(values.values()))
+    return lambda entry: getter(entry) == expected
+
+
+def _filter_entries(
+    entries: Iterable[LogEntry],
+    predicates: List[Callable[[LogEntry], bool]],
+) -> Iterator[LogEntry]:
+    """Lazily yield the entries that match every predicate.
+    
+    The predicates are chained as filter() stages, so no per-entry loop
+    over them runs in Python; each stage only sees what the previous one
+    passed, so cheaper predicates should come first.
+    """
+    matching = iter(entries)
+    for predicate in predicates:
+        matching = filter(predicate, matching)
+    return matching
 
 
 class LogService:
@@ -29,26 +230,204 @@ class LogService:
         "error": ["error", "failed", "exception"],
     }
     
+    # Each action keyword maps to (priority, action_type), where priority
+    # is the position of its action in ACTION_PATTERNS; built once per class
+    _ACTION_KEYWORDS = {
+        pattern: (priority, action_type)
+        for priority, (action_type, patterns) in enumerate(ACTION_PATTERNS.items())
+        for pattern in patterns
+    }
+    # Longest first, so a match reports the whole keyword
+    _ACTION_RE = re.compile("|".join(
+        re.escape(pattern)
+        for pattern in sorted(_ACTION_KEYWORDS, key=len, reverse=True)
+    ))
+    
+    # Maximum number of parsed log files kept in memory
+    PARSE_CACHE_SIZE = 64
+    
+    # Bytes before the resume offset compared to detect a replaced file
+    FINGERPRINT_BYTES = 64
+    
+    # Uncached log files are parsed in worker processes once there are
+    # several of them totalling at least this many bytes
+    PARALLEL_PARSE_MIN_BYTES = 4 * 1024 * 1024
+    
+    # Initial window read back from the end of a file for a limited read
+    TAIL_READ_BYTES = 64 * 1024
+    
+    # SQLite file in the logs directory that keeps parse states across
+    # restarts (hidden, so it isn't listed as a log); None disables it
+    INDEX_DB_NAME = ".log_index.db"
+    
+    # Version of the parse states saved there; bump it whenever parsing
+    # changes (_parse_log_line, _enrich_fields, _feed_log_lines, ...) so
+    # states saved by older code are dropped instead of served
+    INDEX_PARSER_VERSION = 2
+    
     def __init__(self):
         """Initialize log service."""
         self.logs_dir = get_logs_dir()
         self.registry = StationRegistry()
+        self._known_stations = frozenset(
+            station.station_code for station in self.registry.list_all()
+        )
+        # City name -> station code (or None), see _station_for_city
+        self._city_station_codes: Dict[str, Optional[str]] = {}
+        # Station codes, dates and "City →" prefixes, see _parse_log_line.
+        # Every branch starts with a letter or digit and the city branch
+        # only consumes the name, so codes inside "City (CODE) →" are
+        # still found. Station codes must be whole tokens (not "KLGAS")
+        self._fields_re = re.compile(
+            r"(?<![A-Za-z0-9])(?P<station>"
+            + "|".join(sorted(map(re.escape, self._known_stations)))
+            + r")(?![A-Za-z0-9])"
+            r"|(?P<date>\d{4}-\d{2}-\d{2})\b"
+            r"|(?P<city>[A-Z][a-z]+)(?=(?P<city_detail>\s+\([^)]+\))?\s*→)"
+        )
+        self._action_automaton = self._build_action_automaton()
+        # Parse state per log file path, see _parse_log_file
+        self._parse_cache: Dict[str, Dict[str, Any]] = {}
+        # Created on first use and reused across requests
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # (logs dir mtime, sorted log files), see get_log_files
+        self._dir_index: Optional[Tuple[int, List[Path]]] = None
+        # Path -> (signature, fingerprint, dates), see _scan_dates_in_file
+        self._date_scan_cache: Dict[str, Tuple[Tuple[int, int], bytes, Set[str]]] = {}
+        # Opened on first use, see _get_index_db
+        self._index_db: Optional[sqlite3.Connection] = None
+        self._index_db_failed = False
+    
+    def _build_action_automaton(self):
+        """Build an Aho-Corasick automaton over all action keywords.
+        
+        Returns:
+            Automaton with each keyword mapped to (priority, action_type),
+            or None if pyahocorasick is not installed
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for pattern, value in self._ACTION_KEYWORDS.items():
+            automaton.add_word(pattern, value)
+        automaton.make_automaton()
+        return automaton
+    
+    def _classify_action(self, line_lower: str) -> Optional[str]:
+        """Determine the action type of a lowercased log message.
+        
+        The first action in ACTION_PATTERNS with any keyword present wins.
+        
+        Args:
+            line_lower: Lowercased log message
+            
+        Returns:
+            Action type, or None if no keyword matches
+        """
+        if self._action_automaton is not None:
+            # Single pass over the text; keep the highest-priority hit
+            best = None
+            for _, (priority, action_type) in self._action_automaton.iter(line_lower):
+                if best is None or priority < best[0]:
+                    best = (priority, action_type)
+                    if priority == 0:
+                        break
+            return best[1] if best else None
+        
+        # One regex over all keywords instead of a substring scan per
+        # keyword; searching again from just after each match start also
+        # finds keywords that overlap the previous one
+        action_re = self._ACTION_RE
+        action_keywords = self._ACTION_KEYWORDS
+        best = None
+        match = action_re.search(line_lower)
+        while match:
+            priority, action_type = action_keywords[match.group()]
+            if best is None or priority < best[0]:
+                best = (priority, action_type)
+                if priority == 0:
+                    break
+            match = action_re.search(line_lower, match.start() + 1)
+        return best[1] if best else None
+    
+    def _station_for_city(self, city_name: str) -> Optional[str]:
+        """Find the station for a city name from a log message.
+        
+        The first registry station whose city equals or contains the name
+        wins. Results are memoized, since the same few city names repeat
+        on every cycle.
+        
+        Args:
+            city_name: City name, e.g. "London" or "New York (Airport)"
+            
+        Returns:
+            Station code, or None if no station matches
+        """
+        try:
+            return self._city_station_codes[city_name]
+        except KeyError:
+            pass
+        
+        code = None
+        for station in self.registry.list_all():
+            if station.city == city_name or city_name in station.city:
+                code = station.station_code
+                break
+        self._city_station_codes[city_name] = code
+        return code
     
     def get_log_files(self) -> List[Path]:
         """Get all log files in the logs directory.
         
+        The listing is cached until the directory's own mtime changes,
+        i.e. until a file is added, removed or renamed, so polling doesn't
+        stat every log file on each request. Appending to a file doesn't
+        reorder the cached list.
+        
         Returns:
             List of log file paths, sorted by modification time (newest first)
         """
-        if not self.logs_dir.exists():
+        try:
+            dir_mtime = self.logs_dir.stat().st_mtime_ns
+        except OSError:
             return []
         
-        log_files = list(self.logs_dir.glob("*.log"))
+        if self._dir_index is not None and self._dir_index[0] == dir_mtime:
+            return list(self._dir_index[1])
+        
+        # scandir yields type info with the listing, and stat results
+        # without another path lookup (free on Windows)
+        try:
+            with os.scandir(self.logs_dir) as it:
+                found = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if entry.name.endswith(".log")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except OSError:
+            return []
         # Sort by modification time, newest first
-        log_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return log_files
+        found.sort(key=lambda item: item[0], reverse=True)
+        log_files = [Path(path) for _, path in found]
+        self._dir_index = (dir_mtime, log_files)
+        
+        # Drop parse states of log files that were deleted or rotated away
+        listed = {path for _, path in found}
+        for cache_key in list(self._parse_cache):
+            if Path(cache_key).parent == self.logs_dir and cache_key not in listed:
+                del self._parse_cache[cache_key]
+        self._prune_persisted_states(listed)
+        return list(log_files)
     
-    def _parse_log_line(self, line: str, log_file: Path) -> Optional[Dict[str, Any]]:
+    def _parse_log_line(
+        self,
+        line: str,
+        log_file: Path,
+        timestamp_match: Optional[re.Match] = None,
+    ) -> Optional[LogEntry]:
         """Parse a single log line into structured data.
         
         Handles Rich console output format:
@@ -58,197 +437,738 @@ class LogService:
         Args:
             line: Raw log line
             log_file: Path to log file
+            timestamp_match: Header match (_LINE_RE or _TS_RE) already found
+                by the caller, so the line is not scanned a second time
             
         Returns:
-            Parsed log entry dictionary or None if parsing fails
+            Parsed log entry or None if parsing fails
         """
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             return None
         
-        entry = {
-            "timestamp": None,
-            "log_file": log_file.name,
-            "level": None,
-            "message": line.strip(),
-            "station_code": None,
-            "event_day": None,
-            "action_type": None,
-        }
+        # Without a timestamp (continuation line) the message is just the
+        # stripped line
+        entry = LogEntry(log_file=log_file.name, message=stripped)
         
         # Try to extract timestamp
         # Format: [YYYY-MM-DD HH:MM:SS] INFO     message
-        timestamp_match = re.search(r'\[(\d{4}-\d{2}-\d{2}[\sT]\d{2}:\d{2}:\d{2})\]', line)
+        if timestamp_match is None and line[:1] == "[":
+            timestamp_match = _LINE_RE.match(line) or _TS_RE.match(line)
         if timestamp_match:
-            ts_str = timestamp_match.group(1).replace(" ", "T")
-            timestamp = parse_timestamp(ts_str)
-            if timestamp:
-                entry["timestamp"] = timestamp.isoformat()
+            # Date and time are captured separately, so a valid pair already
+            # is the ISO timestamp; no datetime round trip per line
+            day = timestamp_match["day"]
+            clock = timestamp_match["time"]
+            if _parse_date(day) and _is_valid_clock(clock):
+                entry.timestamp = f"{day}T{clock}"
+                entry.sort_key = _timestamp_sort_key(entry.timestamp)
             
-            # Extract log level (comes right after timestamp bracket)
-            # Format: ] INFO     message
-            level_match = re.search(r'\]\s+([A-Z]+)\s+', line)
-            if level_match:
-                level = level_match.group(1).upper()
+            # Level comes right after the timestamp bracket, then the
+            # message up to the file:line suffix (if present)
+            if timestamp_match.re is _LINE_RE:
+                level = timestamp_match["level"]
                 if level in self.LOG_LEVELS:
-                    entry["level"] = level
-            
-            # Extract message (everything after level, before file:line)
-            # Remove file:line suffix if present
-            message_match = re.search(r'\]\s+[A-Z]+\s+(.+?)(?:\s+[a-zA-Z_]+\.py:\d+)?$', line)
-            if message_match:
-                entry["message"] = message_match.group(1).strip()
-        else:
-            # No timestamp - this is a continuation line
-            # Just use the stripped line as message
-            entry["message"] = line.strip()
-        
-        # Try to extract station code (common patterns: EGLC, KLGA, etc.)
-        station_match = re.search(r'\b([A-Z]{4})\b', entry["message"])
-        if station_match:
-            code = station_match.group(1)
-            # Common station codes are 4 letters
-            if len(code) == 4 and code.isalpha():
-                entry["station_code"] = code
-        
-        # Also try to extract station code from city name (e.g., "London → 2025-11-19")
-        # Pattern: "City → YYYY-MM-DD" or "City → event"
-        city_pattern = r'([A-Z][a-z]+(?:\s+\([^)]+\))?)\s*→'
-        city_match = re.search(city_pattern, entry["message"])
-        if city_match and not entry["station_code"]:
-            city_name = city_match.group(1).strip()
-            # Try to find station by city name
-            for station in self.registry.list_all():
-                if station.city == city_name or city_name in station.city:
-                    entry["station_code"] = station.station_code
-                    break
+                    entry.level = level
+                entry.message = timestamp_match["msg"].strip()
         
-        # Try to extract event day (YYYY-MM-DD format)
-        date_match = re.search(r'\b(\d{4}-\d{2}-\d{2})\b', entry["message"])
-        if date_match:
-            date_str = date_match.group(1)
-            try:
-                # Validate it's a real date
-                date.fromisoformat(date_str)
-                entry["event_day"] = date_str
-            except ValueError:
-                pass
+        self._enrich_fields(entry)
         
-        # Also try to extract event day from timestamp if not found in message
-        if not entry["event_day"] and entry["timestamp"]:
-            try:
-                ts = datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00"))
-                entry["event_day"] = ts.date().isoformat()
-            except (ValueError, AttributeError):
-                pass
+        # Also take the event day from the timestamp (its date part) if not
+        # found in message
+        if not entry.event_day and entry.timestamp:
+            entry.event_day = entry.timestamp[:10]
         
-        # Try to determine action type
-        line_lower = entry["message"].lower()
-        for action_type, patterns in self.ACTION_PATTERNS.items():
-            if any(pattern in line_lower for pattern in patterns):
-                entry["action_type"] = action_type
+        return entry
+    
+    def _enrich_fields(self, entry: LogEntry) -> None:
+        """Set station code, event day and action type from an entry's message.
+        
+        Args:
+            entry: Log entry to update in place
+        """
+        entry.station_code = None
+        entry.event_day = None
+        
+        # One scan over the message for the earliest known station code,
+        # the first date and the first "City →" (e.g. "London → 2025-11-19")
+        message = entry.message
+        city_name = None
+        date_str = None
+        for match in self._fields_re.finditer(message):
+            field = match.lastgroup
+            if field == "station":
+                if entry.station_code is None:
+                    entry.station_code = match["station"]
+            elif field == "date":
+                # Dates must start at a word boundary
+                start = match.start()
+                if date_str is None and not (start and _WORD_CHAR_RE.match(message, start - 1)):
+                    date_str = match["date"]
+            elif city_name is None:
+                city_name = match["city"] + (match["city_detail"] or "")
+            if entry.station_code and date_str:
                 break
         
-        return entry
+        # Fall back to the station of the city name
+        if city_name and not entry.station_code:
+            entry.station_code = self._station_for_city(city_name.strip())
+        
+        # Event day from the message (YYYY-MM-DD format), if a real date
+        if date_str and _parse_date(date_str):
+            entry.event_day = date_str
+        
+        # Try to determine action type
+        entry.action_type = self._classify_action(entry.message.lower())
     
     def read_log_file(
         self,
         log_file: Path,
         limit: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[LogEntry]:
         """Read and parse log entries from a file.
         
         Handles multi-line log entries by grouping continuation lines
         with their timestamped parent line.
         
+        With a limit, a file that isn't cached yet is only read from the
+        end until the newest ``limit`` entries are known (see _tail_parse).
+        
         Args:
             log_file: Path to log file
             limit: Optional limit on number of entries
             
         Returns:
-            List of parsed log entry dictionaries
+            List of parsed log entries
         """
-        if not log_file.exists():
+        self._restore_parse_states([log_file])
+        if limit and str(log_file) not in self._parse_cache:
+            return self._tail_parse(log_file, limit) or []
+        
+        state = self._read_parse_state(log_file)
+        if state is None:
             return []
         
-        try:
-            with open(log_file, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-            
-            entries = []
-            current_entry = None
-            continuation_lines = []
+        entries = state["sorted"]
+        if limit:
+            return entries[:limit]
+        return list(entries)
+    
+    def _read_parse_state(self, log_file: Path) -> Optional[Dict[str, Any]]:
+        """Get the up-to-date parse state of a log file.
+        
+        Unchanged files are served from the cache; files that have only
+        grown since the last read are parsed from where that read stopped.
+        New parse results are also persisted (see _persist_parse_state).
+        
+        Args:
+            log_file: Path to log file
             
-            for line in lines:
-                # Check if this line has a timestamp (new log entry)
-                has_timestamp = bool(re.search(r'\[(\d{4}-\d{2}-\d{2}[\sT]\d{2}:\d{2}:\d{2})\]', line))
+        Returns:
+            Parse state (see _parse_log_file), or None if the file can't
+            be read
+        """
+        try:
+            st = log_file.stat()
+        except OSError:
+            return None
+        
+        cache_key = str(log_file)
+        signature = (st.st_mtime_ns, st.st_size)
+        state = self._parse_cache.pop(cache_key, None)
+        if state is None or state["signature"] != signature:
+            state = self._parse_log_file(log_file, state, st.st_size)
+            if state is None:
+                return None
+            state["signature"] = signature
+            self._persist_parse_state(cache_key, state)
+        self._store_parse_state(cache_key, state)
+        return state
+    
+    def _store_parse_state(self, cache_key: str, state: Dict[str, Any]) -> None:
+        """Cache a parse state as most recently used, evicting beyond PARSE_CACHE_SIZE."""
+        self._parse_cache.pop(cache_key, None)
+        self._parse_cache[cache_key] = state
+        while len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            del self._parse_cache[next(iter(self._parse_cache))]
+    
+    def _prefetch_uncached(self, log_files: List[Path]) -> None:
+        """Ask the kernel to start reading log files that aren't cached yet.
+        
+        With several cold files, each is otherwise read only when the
+        sequential parse reaches it. Issuing all read-ahead hints up front
+        lets the reads overlap with each other and with parsing. This is a
+        no-op where posix_fadvise is unavailable (e.g. macOS, Windows).
+        
+        Args:
+            log_files: Log files about to be read
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        
+        pending = [f for f in log_files if str(f) not in self._parse_cache]
+        if len(pending) < 2:
+            return
+        
+        for log_file in pending:
+            try:
+                fd = os.open(log_file, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    
+    def _parse_uncached_in_parallel(self, log_files: List[Path]) -> None:
+        """Parse log files that aren't cached yet across worker processes.
+        
+        Each file parses independently, so first reads of many large logs
+        are spread over all cores. Small workloads are left to
+        read_log_file, where process start-up and pickling would cost more
+        than they save. Files that grow meanwhile are caught up by the next
+        read_log_file from the parsed offset.
+        
+        Args:
+            log_files: Log files about to be read
+        """
+        pending = []
+        total_size = 0
+        for log_file in log_files:
+            if str(log_file) in self._parse_cache:
+                continue
+            try:
+                st = log_file.stat()
+            except OSError:
+                continue
+            pending.append((log_file, (st.st_mtime_ns, st.st_size)))
+            total_size += st.st_size
+        
+        if len(pending) < 2 or total_size < self.PARALLEL_PARSE_MIN_BYTES:
+            return
+        
+        # Largest first, so one big file isn't left running alone at the end
+        pending.sort(key=lambda item: item[1][1], reverse=True)
+        
+        if self._executor is None:
+            # Not forked from the server process, which has watcher and
+            # event loop threads running; see close() for the shutdown
+            self._executor = ProcessPoolExecutor(
+                max_workers=_usable_cpu_count(),
+                mp_context=multiprocessing.get_context(_WORKER_START_METHOD),
+            )
+        
+        try:
+            states = list(self._executor.map(
+                _parse_log_file_worker,
+                [log_file for log_file, _ in pending],
+            ))
+        except (BrokenExecutor, OSError):
+            # Fall back to parsing in this process
+            self._executor = None
+            return
+        
+        for (log_file, signature), state in zip(pending, states):
+            if state is not None:
+                state["signature"] = signature
+                self._persist_parse_state(str(log_file), state)
+                self._store_parse_state(str(log_file), state)
+    
+    def close(self) -> None:
+        """Stop the parse worker processes and close the parse state database.
+        
+        Both are opened again on next use.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._index_db is not None:
+            self._index_db.close()
+            self._index_db = None
+    
+    def _get_index_db(self) -> Optional[sqlite3.Connection]:
+        """Open the parse state database in the logs directory.
+        
+        Returns:
+            Connection, or None if persistence is disabled or the database
+            can't be opened (e.g. a read-only logs directory)
+        """
+        if self._index_db is not None or self._index_db_failed or not self.INDEX_DB_NAME:
+            return self._index_db
+        
+        try:
+            db = sqlite3.connect(
+                str(self.logs_dir / self.INDEX_DB_NAME), check_same_thread=False
+            )
+            # It's only a cache: no rollback journal files appearing in the
+            # logs directory, and no fsync per write
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            with db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS files ("
+                    "path TEXT PRIMARY KEY, offset INTEGER, fingerprint BLOB, "
+                    "continuation TEXT, stored INTEGER)"
+                )
+                # seq is the position in the state's entries; -1 is the
+                # still-open last entry
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "path TEXT, seq INTEGER, timestamp TEXT, log_file TEXT, "
+                    "level TEXT, message TEXT, station_code TEXT, event_day TEXT, "
+                    "action_type TEXT, PRIMARY KEY (path, seq))"
+                )
+                (version,) = db.execute("PRAGMA user_version").fetchone()
+                if version != self.INDEX_PARSER_VERSION:
+                    db.execute("DELETE FROM entries")
+                    db.execute("DELETE FROM files")
+                    # PRAGMA doesn't take parameters
+                    db.execute(f"PRAGMA user_version = {int(self.INDEX_PARSER_VERSION)}")
+        except sqlite3.Error:
+            self._index_db_failed = True
+            return None
+        
+        self._index_db = db
+        return db
+    
+    def _persist_parse_state(self, cache_key: str, state: Dict[str, Any]) -> None:
+        """Save a parse state of a file in the logs directory.
+        
+        Only entries finished since the last save are written, so a growing
+        log costs a few rows per read rather than a rewrite. Failures are
+        ignored; the state is then just parsed again after a restart.
+        
+        Args:
+            cache_key: Path of the log file
+            state: Parse state after _parse_log_file
+        """
+        if Path(cache_key).parent != self.logs_dir:
+            return
+        db = self._get_index_db()
+        if db is None:
+            return
+        
+        entries = state["entries"]
+        # States parsed from scratch (new, truncated or rotated files) have
+        # nothing saved yet
+        stored = state.get("stored", 0)
+        current = state["current"]
+        try:
+            with db:
+                if not stored:
+                    db.execute("DELETE FROM entries WHERE path = ?", (cache_key,))
+                db.execute("DELETE FROM entries WHERE path = ? AND seq = -1", (cache_key,))
+                db.executemany(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (cache_key, seq) + _entry_row(entry)
+                        for seq, entry in enumerate(entries[stored:], stored)
+                    ] + ([(cache_key, -1) + _entry_row(current)] if current else []),
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                    (
+                        cache_key,
+                        state["offset"],
+                        state["fingerprint"],
+                        json.dumps(state["continuation"]),
+                        len(entries),
+                    ),
+                )
+        except sqlite3.Error:
+            return
+        state["stored"] = len(entries)
+    
+    def _restore_parse_states(self, log_files: List[Path]) -> None:
+        """Load persisted parse states of log files that aren't cached yet.
+        
+        A restored state still has to be checked against its file: the
+        next _read_parse_state confirms the fingerprint and parses only
+        what was appended since it was saved.
+        
+        Args:
+            log_files: Log files about to be read
+        """
+        pending = [
+            str(f) for f in log_files
+            if str(f) not in self._parse_cache and f.parent == self.logs_dir
+        ]
+        if not pending:
+            return
+        db = self._get_index_db()
+        if db is None:
+            return
+        
+        try:
+            for cache_key in pending:
+                row = db.execute(
+                    "SELECT offset, fingerprint, continuation, stored FROM files WHERE path = ?",
+                    (cache_key,),
+                ).fetchone()
+                if row is None:
+                    continue
                 
-                if has_timestamp:
-                    # Save previous entry if it exists
-                    if current_entry:
-                        # Append continuation lines to message
-                        if continuation_lines:
-                            full_message = current_entry["message"]
-                            for cont_line in continuation_lines:
-                                cont_msg = cont_line.strip()
-                                if cont_msg:
-                                    full_message += " " + cont_msg
-                            
-                            # Re-parse to extract station code and event day from full message
-                            updated_entry = self._parse_log_line(full_message, log_file)
-                            # Preserve timestamp and level from original entry
-                            if current_entry.get("timestamp"):
-                                updated_entry["timestamp"] = current_entry.get("timestamp")
-                            if current_entry.get("level"):
-                                updated_entry["level"] = current_entry.get("level")
-                            current_entry = updated_entry
+                offset, fingerprint, continuation, stored = row
+                state = self._new_parse_state()
+                state.update(
+                    offset=offset,
+                    fingerprint=fingerprint,
+                    continuation=json.loads(continuation),
+                    stored=stored,
+                    signature=None,
+                )
+                entries = state["entries"]
+                for seq, *values in db.execute(
+                    "SELECT seq, timestamp, log_file, level, message, station_code, "
+                    "event_day, action_type FROM entries WHERE path = ? ORDER BY seq",
+                    (cache_key,),
+                ):
+                    entry = LogEntry(*values)
+                    entry.sort_key = _timestamp_sort_key(entry.timestamp)
+                    if seq < 0:
+                        state["current"] = entry
+                    else:
+                        entries.append(entry)
+                if len(entries) != stored:
+                    continue
+                self._store_parse_state(cache_key, state)
+        except (sqlite3.Error, ValueError):
+            return
+    
+    def _prune_persisted_states(self, listed: Set[str]) -> None:
+        """Delete persisted parse states of log files no longer listed.
+        
+        Args:
+            listed: Paths of the log files currently in the logs directory
+        """
+        if self._index_db is None:
+            return
+        
+        try:
+            with self._index_db as db:
+                gone = [
+                    (path,)
+                    for (path,) in db.execute("SELECT path FROM files")
+                    if path not in listed
+                ]
+                db.executemany("DELETE FROM files WHERE path = ?", gone)
+                db.executemany("DELETE FROM entries WHERE path = ?", gone)
+        except sqlite3.Error:
+            pass
+    
+    def _parse_log_file(
+        self,
+        log_file: Path,
+        state: Optional[Dict[str, Any]],
+        size: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Parse a log file, resuming from a previous parse state.
+        
+        The state records the byte offset after the last complete line
+        consumed, the finished entries, and the still-open last entry with
+        its continuation lines. If the file shrank or its content before
+        the offset changed (truncated or rotated) it is parsed again from
+        the start.
+        
+        Args:
+            log_file: Path to log file
+            state: Parse state from a previous call, or None
+            size: Current file size in bytes
+            
+        Returns:
+            Updated parse state with "sorted" holding all entries newest
+            first and "index" the same entries by field value, or None if
+            the file can't be read
+        """
+        if state is None or size < state["offset"]:
+            state = self._new_parse_state()
+        
+        try:
+            with open(log_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    # Empty files can't be mapped
+                    state = self._new_parse_state()
+                    partial = b""
+                else:
+                    # Lines are read straight out of the page cache through
+                    # a read-only mapping, without a read buffer
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # Compare the last few consumed bytes to confirm this
+                        # is still the same file and not one rewritten past
+                        # our offset
+                        offset = state["offset"]
+                        fingerprint = state["fingerprint"]
+                        if mm[offset - len(fingerprint):offset] == fingerprint:
+                            mm.seek(offset)
                         else:
-                            # No continuation lines, just use current_entry as-is
-                            pass
+                            state = self._new_parse_state()
                         
-                        entries.append(current_entry)
-                    
-                    # Start new entry
-                    current_entry = self._parse_log_line(line, log_file)
-                    continuation_lines = []
-                else:
-                    # Continuation line - add to current entry's message
-                    if current_entry:
-                        continuation_lines.append(line)
-                    else:
-                        # Orphaned continuation line - create minimal entry
-                        entry = self._parse_log_line(line, log_file)
-                        if entry:
-                            entries.append(entry)
+                        partial = self._feed_log_lines(
+                            state, iter(mm.readline, b""), log_file
+                        )
+        except (OSError, ValueError):
+            return None
+        
+        entries = self._finish_entries(state, partial, log_file)
+        
+        # Per-field indexes for the equality filters of get_activity_logs;
+        # each list keeps the newest-first order
+        index: Dict[str, Dict[str, List[LogEntry]]] = {
+            field: {} for field in _INDEXED_FIELDS
+        }
+        for entry in entries:
+            for field, by_value in index.items():
+                value = getattr(entry, field)
+                if value is not None:
+                    by_value.setdefault(value, []).append(entry)
+        
+        state["sorted"] = entries
+        state["index"] = index
+        return state
+    
+    def _finish_entries(
+        self,
+        state: Dict[str, Any],
+        partial: bytes,
+        log_file: Path,
+    ) -> List[LogEntry]:
+        """Collect the entries of a parse state, newest first.
+        
+        The state itself is left untouched, so it can be resumed later.
+        
+        Args:
+            state: Parse state after _feed_log_lines
+            partial: Unfinished last line returned by _feed_log_lines
+            log_file: Path to log file
             
-            # Don't forget the last entry
-            if current_entry:
-                if continuation_lines:
-                    full_message = current_entry["message"]
-                    for cont_line in continuation_lines:
-                        cont_msg = cont_line.strip()
-                        if cont_msg:
-                            full_message += " " + cont_msg
-                    current_entry["message"] = full_message
+        Returns:
+            Entries with a message, sorted by timestamp descending
+        """
+        # A partially written last line is parsed for this result only;
+        # it is re-read from the file once it has been finished
+        tail = self._new_parse_state()
+        tail["current"] = replace(state["current"]) if state["current"] else None
+        tail["continuation"] = list(state["continuation"])
+        if partial:
+            self._feed_log_lines(tail, [partial + b"\n"], log_file)
+        
+        # Filter out entries with no meaningful content (messages are
+        # already stripped) while collecting, so the finished entries are
+        # copied once rather than concatenated and then filtered
+        entries = [
+            e for e in itertools.chain(state["entries"], tail["entries"]) if e.message
+        ]
+        
+        # Don't forget the last entry
+        current_entry = tail["current"]
+        if current_entry:
+            if tail["continuation"]:
+                current_entry.message = " ".join(
+                    [current_entry.message] + [c for c in tail["continuation"] if c]
+                )
+            if current_entry.message:
                 entries.append(current_entry)
+        
+        # Sort by timestamp descending (newest first)
+        entries.sort(key=_sort_key, reverse=True)
+        return entries
+    
+    def _tail_parse(self, log_file: Path, limit: int) -> Optional[List[LogEntry]]:
+        """Parse only the newest entries of a log file.
+        
+        Parses a window at the end of the file, starting at its first
+        timestamped line, and doubles the window until it holds more than
+        ``limit`` entries and its oldest entry is older than the newest
+        ``limit``. Log lines are appended in time order, so nothing before
+        the window can sort among them.
+        
+        Args:
+            log_file: Path to log file
+            limit: Number of entries wanted
             
-            # Filter out entries with no meaningful content
-            entries = [
-                e for e in entries
-                if e.get("message") and len(e["message"].strip()) > 0
-            ]
+        Returns:
+            Up to ``limit`` entries newest first, or None if the file
+            can't be read
+        """
+        try:
+            with open(log_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    size = len(mm)
+                    window = self.TAIL_READ_BYTES
+                    while True:
+                        start = self._entry_start(mm, size - window)
+                        state = self._new_parse_state()
+                        mm.seek(start)
+                        partial = self._feed_log_lines(
+                            state, iter(mm.readline, b""), log_file
+                        )
+                        entries = self._finish_entries(state, partial, log_file)
+                        if start == 0:
+                            return entries[:limit]
+                        
+                        oldest = min(
+                            (e.sort_key for e in entries if e.sort_key), default=0
+                        )
+                        if (
+                            len(entries) > limit
+                            and oldest
+                            and entries[limit - 1].sort_key > oldest
+                        ):
+                            return entries[:limit]
+                        window *= 2
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _entry_start(mm: mmap.mmap, position: int) -> int:
+        """Find where the first timestamped line at or after a position starts.
+        
+        Lines before it belong to an entry that started earlier, so a
+        parse can't begin with them. Returns 0 for positions at or before
+        the start of the file and the file size if no such line follows.
+        
+        Args:
+            mm: Mapped log file
+            position: Byte offset to search from
             
-            # Sort by timestamp descending (newest first)
-            entries.sort(
-                key=lambda e: e["timestamp"] or "",
-                reverse=True
-            )
+        Returns:
+            Byte offset of a line start
+        """
+        if position <= 0:
+            return 0
+        
+        start = mm.rfind(b"\n", 0, position) + 1
+        mm.seek(start)
+        for line in iter(mm.readline, b""):
+            if line[:1] == b"[" and _TS_RE.match(line.decode("utf-8", errors="ignore")):
+                return start
+            start += len(line)
+        return start
+    
+    @staticmethod
+    def _new_parse_state() -> Dict[str, Any]:
+        """Create an empty parse state for a log file."""
+        return {
+            "offset": 0,
+            "fingerprint": b"",
+            "entries": [],
+            "current": None,
+            "continuation": [],
+        }
+    
+    def _feed_log_lines(
+        self,
+        state: Dict[str, Any],
+        lines: Iterable[bytes],
+        log_file: Path,
+    ) -> bytes:
+        """Parse raw log lines into a parse state.
+        
+        Handles multi-line log entries by grouping continuation lines
+        with their timestamped parent line. An entry is only finished once
+        the next timestamped line arrives.
+        
+        Args:
+            state: Parse state to update in place
+            lines: Raw lines, each ending in b"\n" except possibly the last
+            log_file: Path to log file
+            
+        Returns:
+            Trailing line without a newline (not consumed), or b""
+        """
+        entries = state["entries"]
+        current_entry = state["current"]
+        continuation_lines = state["continuation"]
+        
+        # This loop runs once per line of every log file, so the callables
+        # it uses are bound to locals up front
+        parse_line = self._parse_log_line
+        enrich_fields = self._enrich_fields
+        append_entry = entries.append
+        line_match = _LINE_RE.match
+        ts_match = _TS_RE.match
+        
+        consumed = 0
+        # Every consumed line is at least one byte long, so the last
+        # FINGERPRINT_BYTES lines always cover the new fingerprint; it is
+        # only assembled once, after the loop
+        recent_lines = deque(maxlen=self.FINGERPRINT_BYTES)
+        remember_line = recent_lines.append
+        partial = b""
+        
+        for raw_line in lines:
+            if not raw_line.endswith(b"\n"):
+                partial = raw_line
+                break
+            consumed += len(raw_line)
+            remember_line(raw_line)
+            line = raw_line.decode("utf-8", errors="ignore")
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
             
-            if limit:
-                entries = entries[:limit]
+            # Check if this line has a timestamp (new log entry);
+            # timestamps always start the line, so anchor the match, and
+            # skip the regexes entirely for lines that can't be one
+            if line[:1] == "[":
+                timestamp_match = line_match(line) or ts_match(line)
+            else:
+                timestamp_match = None
             
-            return entries
-        except IOError:
-            return []
+            if timestamp_match:
+                # Save previous entry if it exists
+                if current_entry:
+                    # Append continuation lines to message
+                    if continuation_lines:
+                        full_message = " ".join(
+                            [current_entry.message] + [c for c in continuation_lines if c]
+                        ).strip()
+                        
+                        if full_message[:1] == "[":
+                            # Could read as a header itself: re-parse the
+                            # full message like a line
+                            updated_entry = parse_line(full_message, log_file)
+                            # Preserve timestamp and level from original entry
+                            if current_entry.timestamp:
+                                updated_entry.timestamp = current_entry.timestamp
+                                updated_entry.sort_key = current_entry.sort_key
+                            if current_entry.level:
+                                updated_entry.level = current_entry.level
+                            current_entry = updated_entry
+                        else:
+                            # Extract station code, event day and action from
+                            # the full message; the event day doesn't fall
+                            # back to the timestamp here, as it never has
+                            current_entry.message = full_message
+                            enrich_fields(current_entry)
+                    
+                    append_entry(current_entry)
+                
+                # Start new entry
+                current_entry = parse_line(line, log_file, timestamp_match)
+                continuation_lines = []
+            else:
+                # Continuation line - add to current entry's message
+                # (stripped once here, joined when the entry is finished)
+                if current_entry:
+                    continuation_lines.append(line.strip())
+                else:
+                    # Orphaned continuation line - create minimal entry
+                    entry = parse_line(line, log_file)
+                    if entry:
+                        append_entry(entry)
+        
+        state["current"] = current_entry
+        state["continuation"] = continuation_lines
+        state["offset"] += consumed
+        if recent_lines:
+            state["fingerprint"] = (
+                state["fingerprint"] + b"".join(recent_lines)
+            )[-self.FINGERPRINT_BYTES:]
+        return partial
     
     def _format_message_for_humans(self, entry: Dict[str, Any]) -> str:
         """Format a log message for human readability.
@@ -265,20 +1185,14 @@ class LogService:
         if not message:
             return ""
         
-        # Remove file paths (e.g., "fetchers.py:72", "discovery.py:301")
-        message = re.sub(r'\s+[a-zA-Z_]+\.py:\d+\s*', ' ', message)
-        
-        # Remove duplicate log level prefixes (INFO, ERROR, etc.)
-        message = re.sub(r'\b(INFO|DEBUG|WARNING|ERROR|CRITICAL)\s+', '', message)
-        
-        # Remove long file paths
-        message = re.sub(r'/Users/[^\s]+', '...', message)
-        message = re.sub(r'data/[^\s]+\.csv', 'trade file', message)
-        message = re.sub(r'data/[^\s]+\.json', 'snapshot', message)
+        # Remove file references (e.g., "fetchers.py:72"), duplicate log
+        # level prefixes and long file paths, skipping the scan when none
+        # can be present
+        if any(map(message.__contains__, _CLEAN_TRIGGERS)):
+            message = _CLEAN_RE.sub(_clean_match, message)
         
-        # Clean up common patterns
-        message = re.sub(r'\s+', ' ', message)  # Multiple spaces to single
-        message = message.strip()
+        # Multiple spaces to single, trimmed
+        message = " ".join(message.split())
         
         # Extract and format key information
         formatted = self._extract_key_info(message, entry)
@@ -296,6 +1210,9 @@ class LogService:
             Formatted message or None if no key info found
         """
         msg_lower = message.lower()
+        if entry.get("level") != "ERROR" and not _KEY_INFO_RE.search(msg_lower):
+            return None
+        
         action_type = entry.get("action_type", "")
         
         # Build a list of key events found in this message
@@ -303,7 +1220,7 @@ class LogService:
         
         # Cycle start
         if "cycle" in msg_lower and ("starting" in msg_lower or "CYCLE" in message):
-            cycle_match = re.search(r'CYCLE\s+(\d+)', message)
+            cycle_match = _CYCLE_RE.search(message)
             if cycle_match:
                 events.append(f"🔄 Cycle {cycle_match.group(1)} started")
             else:
@@ -311,7 +1228,7 @@ class LogService:
         
         # Zeus forecast fetch
         if "zeus" in msg_lower and ("fetched" in msg_lower or "points" in msg_lower or "parsed" in msg_lower):
-            points_match = re.search(r'(\d+)\s+points?', message)
+            points_match = _POINTS_RE.search(message)
             station = entry.get("station_code", "")
             if points_match:
                 events.append(f"🌡️  Zeus forecast: {points_match.group(1)} data points for {station}")
@@ -320,11 +1237,11 @@ class LogService:
         
         # Polymarket fetch
         if "polymarket" in msg_lower or ("brackets" in msg_lower and "temperature" in msg_lower):
-            brackets_match = re.search(r'(\d+)\s+temperature\s+brackets?', message)
+            brackets_match = _BRACKETS_RE.search(message)
             if brackets_match:
                 events.append(f"💰 Found {brackets_match.group(1)} temperature brackets")
             elif "prices" in msg_lower:
-                prices_match = re.search(r'(\d+)/(\d+)\s+prices?', message)
+                prices_match = _PRICES_RE.search(message)
                 if prices_match:
                     events.append(f"💰 Fetched {prices_match.group(1)}/{prices_match.group(2)} market prices")
             else:
@@ -332,7 +1249,7 @@ class LogService:
         
         # METAR fetch
         if "metar" in msg_lower:
-            obs_match = re.search(r'(\d+)\s+valid\s+METAR', message)
+            obs_match = _METAR_OBS_RE.search(message)
             if obs_match:
                 events.append(f"🌤️  Retrieved {obs_match.group(1)} METAR observation(s)")
             else:
@@ -340,24 +1257,23 @@ class LogService:
         
         # Probability mapping
         if "mapped probabilities" in msg_lower or "mapping forecast" in msg_lower:
-            model_match = re.search(r'(spread|bands)\s+model', msg_lower)
+            model_match = _MODEL_RE.search(msg_lower)
             model = model_match.group(1).title() if model_match else "Spread"
-            peak_match = re.search(r'peak\s*=\s*\[(\d+),\s*(\d+)\)', message)
-            prob_match = re.search(r'p\s*=\s*([\d.]+)', message)
+            peak_match = _PEAK_RE.search(message)
+            prob_match = _PROB_RE.search(message)
             if peak_match and prob_match:
                 events.append(f"🧮 Probabilities ({model}): Peak {peak_match.group(1)}-{peak_match.group(2)}°F at {float(prob_match.group(1))*100:.1f}%")
             else:
                 events.append(f"🧮 Calculated probabilities ({model} model)")
         
-        # Edge found - extract all edges
-        edge_matches = list(re.finditer(r'\[(\d+)-(\d+)°F\)[^:]*edge[=:]\s*([\d.]+)', message))
-        if edge_matches:
-            for match in edge_matches:
+        # Edge found - extract all edges (every match spells out "edge")
+        if "edge" in message:
+            for match in _EDGE_RE.finditer(message):
                 bracket = f"{match.group(1)}-{match.group(2)}°F"
                 edge_pct = float(match.group(3)) * 100
                 # Try to find size for this bracket
-                size_match = re.search(rf'{re.escape(bracket)}[^$]*\$?([\d.]+)', message)
-                size = f" (${size_match.group(1)})" if size_match else ""
+                size_str = _bracket_size(message, bracket)
+                size = f" (${size_str})" if size_str else ""
                 events.append(f"✅ Edge: {bracket} → {edge_pct:.2f}%{size}")
         
         # Trade placement - extract detailed trade information (HIGH PRIORITY)
@@ -365,14 +1281,14 @@ class LogService:
             # Extract individual trade details: [bracket]: $size @ edge=edge%
             # Pattern handles whitespace/file paths between @ and edge=
             # After cleaning, format is: [58-59°F): $300.00 @ ... edge=26.16%
-            trade_details = re.findall(r'\[(\d+-\d+°F)\):\s*\$([\d.]+)\s*@[^e]*edge=([\d.]+)%', message)
+            trade_details = _TRADE_DETAIL_RE.findall(message)
             
             if trade_details:
                 # Found individual trade details - format them nicely
                 trade_lines = []
                 
                 # Check for "Placing X paper trades" message
-                placing_match = re.search(r'📄\s*Placing\s+(\d+)\s+paper\s+trades?', message)
+                placing_match = _PLACING_RE.search(message)
                 if placing_match:
                     trade_lines.append(f"📄 Placing {placing_match.group(1)} paper trades")
                 
@@ -381,7 +1297,7 @@ class LogService:
                     trade_lines.append(f"📝 [{bracket}): ${size} @ edge={edge}%")
                 
                 # Check for "Recorded" message
-                recorded_match = re.search(r'✅\s*Recorded\s+(\d+)\s+paper\s+trades?', message)
+                recorded_match = _RECORDED_RE.search(message)
                 if recorded_match:
                     trade_lines.append(f"✅ Recorded {recorded_match.group(1)} paper trades")
                 
@@ -390,7 +1306,7 @@ class LogService:
                     return "\n".join(trade_lines)
             else:
                 # No individual details, just show count
-                trade_match = re.search(r'(\d+)\s+paper\s+trades?', message)
+                trade_match = _PAPER_TRADES_RE.search(message)
                 if trade_match:
                     events.append(f"📝 Placed {trade_match.group(1)} paper trade(s)")
                 else:
@@ -398,7 +1314,7 @@ class LogService:
         
         # Trade recorded (if not already captured above)
         if "recorded" in msg_lower and "trade" in msg_lower and "✅" not in message:
-            trade_match = re.search(r'(\d+)\s+paper\s+trades?', message)
+            trade_match = _PAPER_TRADES_RE.search(message)
             if trade_match:
                 events.append(f"💾 Recorded {trade_match.group(1)} trade(s)")
             else:
@@ -425,13 +1341,9 @@ class LogService:
         
         # Return the most important event, or combine if multiple
         if events:
-            # Prioritize: trade > edge > error > other
-            priority_order = ["📝", "✅", "❌", "🔄", "💰", "🧮", "🌡️", "🌤️", "💾", "🔍"]
-            events_sorted = sorted(events, key=lambda e: min([priority_order.index(emoji) for emoji in priority_order if emoji in e] + [999]))
-            
             # If multiple events, show the most important one
             if len(events) > 1:
-                return events_sorted[0] + f" (+{len(events)-1} more)"
+                return min(events, key=_event_priority) + f" (+{len(events)-1} more)"
             return events[0]
         
         # Default: return cleaned message
@@ -463,88 +1375,80 @@ class LogService:
             Dictionary with logs, count, total, and pagination info
         """
         log_files = self.get_log_files()
+        self._restore_parse_states(log_files)
+        self._prefetch_uncached(log_files)
+        self._parse_uncached_in_parallel(log_files)
         
-        all_entries = []
-        
-        # Read all log files
-        for log_file in log_files:
-            entries = self.read_log_file(log_file, limit=None)
-            all_entries.extend(entries)
-        
-        # Apply filters
-        filtered_entries = all_entries
+        # Build filters; exact-match filters are collected as field values,
+        # which are tested together and can also be looked up in the
+        # per-file indexes
+        predicates: List[Callable[[LogEntry], bool]] = []
+        lookups: Dict[str, str] = {}
         
         # Filter by station code
         if station_code:
-            filtered_entries = [
-                e for e in filtered_entries
-                if e.get("station_code") == station_code.upper()
-            ]
+            lookups["station_code"] = station_code.upper()
         
         # Filter by event day
         if event_day:
             today = date.today()
             
             if event_day == "today":
-                target_date = today.isoformat()
-                filtered_entries = [
-                    e for e in filtered_entries
-                    if e.get("event_day") == target_date
-                ]
+                lookups["event_day"] = today.isoformat()
             elif event_day == "tomorrow":
-                target_date = (today + timedelta(days=1)).isoformat()
-                filtered_entries = [
-                    e for e in filtered_entries
-                    if e.get("event_day") == target_date
-                ]
+                lookups["event_day"] = (today + timedelta(days=1)).isoformat()
+            # Event days are always valid YYYY-MM-DD strings, which sort
+            # the same as the dates they represent; a missing one compares
+            # as "", below any date
             elif event_day == "past_3_days":
-                cutoff_date = (today - timedelta(days=3))
-                filtered_entries = [
-                    e for e in filtered_entries
-                    if e.get("event_day") and date.fromisoformat(e["event_day"]) >= cutoff_date
-                ]
+                cutoff_iso = (today - timedelta(days=3)).isoformat()
+                predicates.append(lambda e: (e.event_day or "") >= cutoff_iso)
             elif event_day == "future":
-                filtered_entries = [
-                    e for e in filtered_entries
-                    if e.get("event_day") and date.fromisoformat(e["event_day"]) > today
-                ]
+                today_iso = today.isoformat()
+                predicates.append(lambda e: (e.event_day or "") > today_iso)
             else:
-                # Specific date (YYYY-MM-DD)
-                try:
-                    date.fromisoformat(event_day)  # Validate
-                    filtered_entries = [
-                        e for e in filtered_entries
-                        if e.get("event_day") == event_day
-                    ]
-                except ValueError:
-                    pass  # Invalid date format, ignore filter
+                # Specific date (YYYY-MM-DD); invalid formats are ignored
+                if _parse_date(event_day):
+                    lookups["event_day"] = event_day
         
         # Filter by action type
         if action_type:
-            filtered_entries = [
-                e for e in filtered_entries
-                if e.get("action_type") == action_type.lower()
-            ]
+            lookups["action_type"] = action_type.lower()
         
         # Filter by log level
         if log_level:
-            filtered_entries = [
-                e for e in filtered_entries
-                if e.get("level") == log_level.upper()
-            ]
+            lookups["level"] = log_level.upper()
         
-        # Sort by timestamp descending (newest first)
-        filtered_entries.sort(
-            key=lambda e: e["timestamp"] or "",
-            reverse=True
-        )
+        if lookups:
+            predicates.insert(0, _fields_equal(lookups))
         
-        total = len(filtered_entries)
+        # Start each file from its smallest matching index list (or all
+        # entries if no exact-match filter is given)
+        candidates = []
+        for log_file in log_files:
+            state = self._read_parse_state(log_file)
+            if state is None:
+                continue
+            entries = state["sorted"]
+            for field, value in lookups.items():
+                indexed = state["index"][field].get(value, [])
+                if len(indexed) < len(entries):
+                    entries = indexed
+            candidates.append(entries)
         
-        # Apply pagination
-        paginated_entries = filtered_entries[offset:]
-        if limit:
-            paginated_entries = paginated_entries[:limit]
+        # Each file's entries are already sorted newest first, so a k-way
+        # merge gives the global order without re-sorting everything
+        merged_entries = heapq.merge(*candidates, key=_sort_key, reverse=True)
+        
+        # Apply pagination to the lazily filtered stream, so only the
+        # requested page is materialized; the rest is just counted to keep
+        # the total exact
+        filtered_entries = _filter_entries(merged_entries, predicates)
+        skipped = sum(1 for _ in itertools.islice(filtered_entries, offset))
+        paginated_entries = list(itertools.islice(filtered_entries, limit or None))
+        total = skipped + len(paginated_entries) + sum(1 for _ in filtered_entries)
+        
+        paginated_entries = [entry.to_dict() for entry in paginated_entries]
         
         # Format messages for human readability if requested
         if human_readable:
@@ -568,6 +1472,9 @@ class LogService:
     def get_available_dates(self) -> List[str]:
         """Get list of dates that have log entries.
         
+        Dates are scanned from the raw log files rather than parsed entries,
+        see _scan_dates_in_file.
+        
         Returns:
             List of date strings (YYYY-MM-DD), sorted descending (newest first)
         """
@@ -576,30 +1483,86 @@ class LogService:
         dates: Set[str] = set()
         
         for log_file in log_files:
-            entries = self.read_log_file(log_file, limit=None)
-            for entry in entries:
-                event_day = entry.get("event_day")
-                if event_day:
-                    dates.add(event_day)
+            dates.update(self._scan_dates_in_file(log_file))
+        
+        # Forget scans of files that are gone
+        listed = {str(log_file) for log_file in log_files}
+        for cache_key in list(self._date_scan_cache):
+            if cache_key not in listed:
+                del self._date_scan_cache[cache_key]
         
-        # Also extract dates from log file names (e.g., dynamic_paper_20251113_125727.log)
+        # Also extract dates from log file names (e.g., dynamic_paper_20251113_125727.log):
+        # the first underscore-separated part of the stem that is 8 digits
         for log_file in log_files:
-            # Try to extract date from filename
-            date_match = re.search(r'(\d{8})', log_file.name)
-            if date_match:
-                date_str = date_match.group(1)
-                try:
+            for part in log_file.stem.split("_"):
+                if len(part) == 8 and part.isdigit():
                     # Convert YYYYMMDD to YYYY-MM-DD
-                    formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                    date.fromisoformat(formatted_date)  # Validate
-                    dates.add(formatted_date)
-                except (ValueError, IndexError):
-                    pass
+                    formatted_date = f"{part[:4]}-{part[4:6]}-{part[6:]}"
+                    if _parse_date(formatted_date):
+                        dates.add(formatted_date)
+                    break
         
         # Sort descending (newest first)
         sorted_dates = sorted(dates, reverse=True)
         return sorted_dates
     
+    def _scan_dates_in_file(self, log_file: Path) -> Set[str]:
+        """Find all valid dates in a log file without parsing its entries.
+        
+        A single regex pass over the raw (memory-mapped) bytes. Every
+        entry's event day is either a date in its message or its timestamp
+        date, so this covers all of them; it can also include dates that
+        only appear later in a message.
+        
+        Results are cached per file. An unchanged file isn't read again,
+        and a file that only had whole lines appended is scanned from just
+        before its previous end.
+        
+        Args:
+            log_file: Path to log file
+            
+        Returns:
+            Set of date strings (YYYY-MM-DD)
+        """
+        cache_key = str(log_file)
+        cached = self._date_scan_cache.get(cache_key)
+        try:
+            with open(log_file, "rb") as f:
+                st = os.fstat(f.fileno())
+                signature = (st.st_mtime_ns, st.st_size)
+                if cached is not None and cached[0] == signature:
+                    return cached[2]
+                
+                if st.st_size == 0:
+                    self._date_scan_cache[cache_key] = (signature, b"", set())
+                    return set()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    size = len(mm)
+                    start = 0
+                    dates: Set[str] = set()
+                    if cached is not None:
+                        (_, old_size), fingerprint, old_dates = cached
+                        # Resume only after a complete line of the same file;
+                        # the overlap catches a date cut by the old end
+                        if (
+                            fingerprint.endswith(b"\n")
+                            and old_size <= size
+                            and mm[old_size - len(fingerprint):old_size] == fingerprint
+                        ):
+                            start = max(0, old_size - 10)
+                            dates = set(old_dates)
+                    found = set(_DATE_BYTES_RE.findall(mm, start))
+                    fingerprint = mm[max(0, size - self.FINGERPRINT_BYTES):size]
+        except (OSError, ValueError):
+            return set()
+        
+        for date_bytes in found:
+            date_str = date_bytes.decode("ascii")
+            if _parse_date(date_str):
+                dates.add(date_str)
+        self._date_scan_cache[cache_key] = ((st.st_mtime_ns, size), fingerprint, dates)
+        return dates
+    
     # Legacy methods for backward compatibility
     def get_recent_logs(
         self,
@@ -667,3 +1630,29 @@ class LogService:
             limit=limit,
         )
         return result["logs"]
+
+
+# Start method of parse worker processes (forkserver isn't available on
+# every platform)
+_WORKER_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Per-process service used by _parse_log_file_worker
+_worker_service: Optional[LogService] = None
+
+
+def _parse_log_file_worker(log_file: Path) -> Optional[Dict[str, Any]]:
+    """Fully parse one log file in a worker process.
+    
+    Args:
+        log_file: Path to log file
+        
+    Returns:
+        Parse state (see LogService._parse_log_file), or None if the file
+        can't be read
+    """
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = LogService()
+    return _worker_service._parse_log_file(log_file, None, 0)
@@ -8,22 +8,155 @@ Snapshots are stored in: data/snapshots/dynamic/metar/{station}/{event_day}/
 Each observation is saved with its observation_time_utc for historical accuracy.
 """
 
-from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timezone
 from functools import lru_cache
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
+from operator import itemgetter
+
+import numpy as np
 
 from ..services.snapshot_service import SnapshotService
 from ..utils.file_utils import parse_timestamp
 
+from core import units
+from core.station_calibration import get_station_calibration
+
+
+class ObservationSummary(NamedTuple):
+    """Daily high and observation count of a station's event day."""
+    
+    high: Optional[float]  # temp_F, None if no observation of the day has one
+    count: int  # Observations in the day's snapshots
+
+
+def _build_bracket_index(
+    decisions: List[Dict[str, Any]],
+) -> Tuple[List[float], List[Tuple[float, float, Optional[str]]]]:
+    """Sort the bounded brackets of decisions by lower bound for _find_bracket.
+    
+    Args:
+        decisions: Decisions of a decision snapshot
+        
+    Returns:
+        Tuple of (lower bounds, (lower, upper, bracket) per bound), sorted
+        by lower bound; decisions missing a bound are left out
+    """
+    get = dict.get
+    brackets = []
+    for decision in decisions:
+        lower = get(decision, "lower_f")
+        upper = get(decision, "upper_f")
+        if lower is not None and upper is not None:
+            brackets.append((lower, upper, get(decision, "bracket")))
+    brackets.sort(key=itemgetter(0))
+    return [lower for lower, _, _ in brackets], brackets
+
+
+def _find_bracket(
+    bracket_index: Tuple[List[float], List[Tuple[float, float, Optional[str]]]],
+    value: float,
+) -> Optional[str]:
+    """Find the bracket [lower, upper) containing a temperature.
+    
+    Brackets are disjoint, so only the one with the greatest lower bound
+    not above the value can contain it; it is found by binary search.
+    
+    Args:
+        bracket_index: Index from _build_bracket_index
+        value: Temperature in Fahrenheit
+        
+    Returns:
+        Bracket name, or None if no bracket contains the value
+    """
+    lowers, brackets = bracket_index
+    position = bisect_right(lowers, value) - 1
+    if position >= 0:
+        lower, upper, bracket = brackets[position]
+        if lower <= value < upper:
+            return bracket
+    return None
+
+
+@lru_cache(maxsize=16384)
+def _utc_epoch(observation_time_utc: str) -> Optional[int]:
+    """Parse an observation time into UTC epoch seconds (naive times are UTC).
+    
+    Args:
+        observation_time_utc: ISO format observation time
+        
+    Returns:
+        Epoch seconds, or None if the time can't be parsed
+    """
+    obs_time = parse_timestamp(observation_time_utc)
+    if obs_time is None:
+        return None
+    if obs_time.tzinfo is None:
+        obs_time = obs_time.replace(tzinfo=timezone.utc)
+    return int(obs_time.timestamp())
+
+
+def _observation_epoch(obs: Dict[str, Any]) -> Optional[int]:
+    """Get the time of a METAR observation in UTC epoch seconds.
+    
+    Snapshots store observation_time_epoch when written. For older ones it
+    is parsed from observation_time_utc; the parse is memoized rather than
+    stored on the snapshot, as snapshots are cached and shared between
+    requests.
+    
+    Args:
+        obs: METAR observation snapshot
+        
+    Returns:
+        Epoch seconds, or None if the observation time can't be parsed
+    """
+    epoch = obs.get("observation_time_epoch")
+    if epoch is None:
+        epoch = _utc_epoch(obs.get("observation_time_utc") or "")
+    return epoch
+
+
+def _observation_sort_key(obs: Dict[str, Any]) -> float:
+    """Sort key of a METAR observation (unparseable times sort first)."""
+    epoch = _observation_epoch(obs)
+    return epoch if epoch is not None else float("-inf")
+
+
+def _max_temp_f(points: List[Dict[str, Any]]) -> Optional[float]:
+    """Get the highest temp_F of forecast points without collecting them.
+    
+    Args:
+        points: Zeus timeseries points
+        
+    Returns:
+        Highest temp_F, or None if no point has one
+    """
+    get = dict.get
+    temps_f = (get(point, "temp_F") for point in points)
+    return max((temp_f for temp_f in temps_f if temp_f is not None), default=None)
+
 
 class MetarService:
     """Backend service for METAR data access."""
     
+    # Maximum number of (station, day) daily highs kept in memory
+    DAILY_HIGH_CACHE_SIZE = 1024
+    
+    # Seconds a daily high of a day that is still open (today or later,
+    # UTC) is reused before it's recomputed
+    DAILY_HIGH_TTL_SECONDS = 600
+    
     def __init__(self):
         """Initialize METAR service."""
         self.snapshot_service = SnapshotService()
-        # Cache for daily highs (key: (station_code, event_day), value: temp_F)
-        self._daily_high_cache: Dict[tuple[str, str], float] = {}
+        # Cache for daily highs (key: (station_code, event_day),
+        # value: (expires_at, snapshot signature, ObservationSummary));
+        # expires_at is None for closed days, whose observations no longer
+        # change
+        self._daily_high_cache: Dict[
+            Tuple[str, str], Tuple[Optional[float], tuple, ObservationSummary]
+        ] = {}
     
     def get_observations(
         self,
@@ -45,9 +178,7 @@ class MetarService:
         )
         
         # Sort by observation time
-        snapshots.sort(
-            key=lambda s: parse_timestamp(s.get("observation_time_utc", "")) or datetime.min
-        )
+        snapshots.sort(key=_observation_sort_key)
         
         return snapshots
     
@@ -70,57 +201,96 @@ class MetarService:
         if event_day is None:
             event_day = date.today()
         
+        summary = self._get_observation_summary(station_code, event_day, use_cache)
+        if summary.high is None:
+            return None
+        
+        return round(summary.high, 1)
+    
+    def _get_observation_summary(
+        self,
+        station_code: str,
+        event_day: date,
+        use_cache: bool = True,
+    ) -> ObservationSummary:
+        """Get the (cached) observation summary of a station's event day.
+        
+        Args:
+            station_code: Station code (e.g., "EGLC")
+            event_day: Event day
+            use_cache: Whether to use cache
+            
+        Returns:
+            Observation summary
+        """
         cache_key = (station_code, event_day.isoformat())
         
-        # Check cache
-        if use_cache and cache_key in self._daily_high_cache:
-            return self._daily_high_cache[cache_key]
+        # Check cache; an entry is stale once it expires or a snapshot was
+        # added since it was computed
+        if use_cache:
+            signature = self.snapshot_service.get_metar_signature(station_code, event_day)
+            cached = self._daily_high_cache.pop(cache_key, None) if signature is not None else None
+            if cached is not None:
+                expires_at, cached_signature, cached_summary = cached
+                if cached_signature == signature and (
+                    expires_at is None or time.monotonic() < expires_at
+                ):
+                    # Re-insert as most recently used
+                    self._daily_high_cache[cache_key] = cached
+                    return cached_summary
+        
+        summary = self._scan_observations(station_code, event_day)
+        
+        # Cache result (unless a snapshot may still be being written)
+        if use_cache and signature is not None:
+            self._store_daily_high(cache_key, event_day, signature, summary)
+        
+        return summary
+    
+    def _scan_observations(self, station_code: str, event_day: date) -> ObservationSummary:
+        """Summarize a station's METAR observations for an event day in one pass.
         
-        # Get observations
-        observations = self.get_observations(
+        The observations are only filtered and maxed, so they are neither
+        sorted nor collected into intermediate lists.
+        
+        Args:
+            station_code: Station code (e.g., "EGLC")
+            event_day: Event day
+            
+        Returns:
+            Observation summary
+        """
+        observations = self.snapshot_service.get_metar_snapshots(
             station_code=station_code,
             event_day=event_day,
         )
         
-        if not observations:
-            return None
-        
-        # CRITICAL: Filter to only include observations within event day (00:00-23:59 UTC)
+        # CRITICAL: Only include observations within event day (00:00-23:59 UTC)
         # This ensures we don't include late-night observations from previous day
-        filtered_observations = []
+        day_start = int(
+            datetime(event_day.year, event_day.month, event_day.day, tzinfo=timezone.utc).timestamp()
+        )
+        day_end = day_start + 86400
+        
+        # Snapshots are plain dicts; binding dict.get saves a method
+        # lookup per field
+        get = dict.get
+        daily_high = None
         for obs in observations:
-            obs_time_str = obs.get("observation_time_utc", "")
-            if not obs_time_str:
+            temp_f = get(obs, "temp_F")
+            if temp_f is None:
                 continue
             
-            obs_time = parse_timestamp(obs_time_str)
-            if obs_time is None:
+            epoch = get(obs, "observation_time_epoch")
+            if epoch is None:
+                epoch = _observation_epoch(obs)
+            if epoch is None or not day_start <= epoch < day_end:
                 continue
             
-            # Only include if observation date matches event day (UTC)
-            if obs_time.date() == event_day:
-                filtered_observations.append(obs)
-        
-        if not filtered_observations:
-            return None
-        
-        # Extract temperatures from filtered observations
-        temps = [
-            obs.get("temp_F")
-            for obs in filtered_observations
-            if obs.get("temp_F") is not None
-        ]
-        
-        if not temps:
-            return None
-        
-        daily_high = max(temps)
+            if daily_high is None or temp_f > daily_high:
+                daily_high = temp_f
         
-        # Cache result
-        if use_cache:
-            self._daily_high_cache[cache_key] = daily_high
-        
-        return round(daily_high, 1)
+        return ObservationSummary(high=daily_high, count=len(observations))
     
     def compare_zeus_vs_metar(
         self,
@@ -141,10 +311,11 @@ class MetarService:
         if event_day is None:
             event_day = date.today()
         
-        # Get METAR daily high
-        metar_high = self.get_daily_high(station_code, event_day)
-        if metar_high is None:
+        # Get METAR daily high (and the observation count, from the same scan)
+        metar_summary = self._get_observation_summary(station_code, event_day)
+        if metar_summary.high is None:
             return None
+        metar_high = round(metar_summary.high, 1)
         
         # Get latest Zeus forecast for this event day
         zeus_snapshots = self.snapshot_service.get_zeus_snapshots(
@@ -165,70 +336,62 @@ class MetarService:
         
         # Apply calibration if enabled
         if feature_toggles and feature_toggles.station_calibration:
-            from core.station_calibration import StationCalibration
-            from core import units
-            from datetime import datetime
-            
-            calibration = StationCalibration()
+            calibration = get_station_calibration()
             
-            # Extract temps and timestamps, apply calibration
-            calibrated_temps_f = []
+            # Extract temps and timestamps
+            temps_k = []
+            timestamps = []
+            get = dict.get
             for point in timeseries:
                 # Try to get temp_K first (preferred), fall back to temp_F
-                temp_k = point.get("temp_K")
+                temp_k = get(point, "temp_K")
                 if temp_k is None:
                     # Convert from temp_F if temp_K not available
-                    temp_f = point.get("temp_F")
+                    temp_f = get(point, "temp_F")
                     if temp_f is None:
                         continue
                     temp_k = units.fahrenheit_to_kelvin(temp_f)
                 
                 # Get timestamp
-                time_utc_str = point.get("time_utc")
+                time_utc_str = get(point, "time_utc")
                 if not time_utc_str:
                     continue
                 
-                try:
-                    # Parse timestamp (handle both with and without timezone)
-                    if time_utc_str.endswith("Z"):
-                        timestamp = datetime.fromisoformat(time_utc_str.replace("Z", "+00:00"))
-                    else:
-                        timestamp = datetime.fromisoformat(time_utc_str)
-                except (ValueError, AttributeError):
+                # Parse timestamp (handle both with and without timezone);
+                # parse_timestamp is memoized, as in
+                # SnapshotService._apply_calibration_to_snapshot
+                if isinstance(time_utc_str, str):
+                    timestamp = parse_timestamp(time_utc_str)
+                    if timestamp is None:
+                        continue
+                elif isinstance(time_utc_str, datetime):
+                    timestamp = time_utc_str
+                else:
                     continue
                 
-                # Apply calibration
-                temp_c = units.kelvin_to_celsius(temp_k)
-                temp_c_corrected = calibration.apply(temp_c, station_code, timestamp)
-                temp_k_corrected = units.celsius_to_kelvin(temp_c_corrected)
-                temp_f_corrected = units.kelvin_to_fahrenheit(temp_k_corrected)
-                
-                calibrated_temps_f.append(temp_f_corrected)
+                temps_k.append(temp_k)
+                timestamps.append(timestamp)
             
-            if calibrated_temps_f:
-                zeus_high = max(calibrated_temps_f)
+            if temps_k:
+                # Apply calibration to all points at once; the unit
+                # conversions are plain arithmetic, so they work on arrays
+                temps_c = units.kelvin_to_celsius(np.array(temps_k, dtype=np.float64))
+                temps_c_corrected = calibration.apply_batch(temps_c, station_code, timestamps)
+                temps_k_corrected = units.celsius_to_kelvin(temps_c_corrected)
+                temps_f_corrected = units.kelvin_to_fahrenheit(temps_k_corrected)
+                
+                zeus_high = float(temps_f_corrected.max())
             else:
                 # Fallback to original method if calibration failed
-                zeus_temps = [
-                    point.get("temp_F")
-                    for point in timeseries
-                    if point.get("temp_F") is not None
-                ]
-                if not zeus_temps:
+                zeus_high = _max_temp_f(timeseries)
+                if zeus_high is None:
                     return None
-                zeus_high = max(zeus_temps)
         else:
             # No calibration - use original method
-            zeus_temps = [
-                point.get("temp_F")
-                for point in timeseries
-                if point.get("temp_F") is not None
-            ]
+            zeus_high = _max_temp_f(timeseries)
             
-            if not zeus_temps:
+            if zeus_high is None:
                 return None
-            
-            zeus_high = max(zeus_temps)
         
         # Calculate error
         error_f = zeus_high - metar_high
@@ -248,23 +411,10 @@ class MetarService:
         if decision_snapshots:
             decisions = decision_snapshots[0].get("decisions", [])
             if decisions:
-                # Find bracket for Zeus prediction
-                for decision in decisions:
-                    lower = decision.get("lower_f")
-                    upper = decision.get("upper_f")
-                    if lower is not None and upper is not None:
-                        if lower <= zeus_high < upper:
-                            zeus_bracket = decision.get("bracket")
-                            break
-                
-                # Find bracket for METAR actual
-                for decision in decisions:
-                    lower = decision.get("lower_f")
-                    upper = decision.get("upper_f")
-                    if lower is not None and upper is not None:
-                        if lower <= metar_high < upper:
-                            metar_bracket = decision.get("bracket")
-                            break
+                # Find brackets for Zeus prediction and METAR actual
+                bracket_index = _build_bracket_index(decisions)
+                zeus_bracket = _find_bracket(bracket_index, zeus_high)
+                metar_bracket = _find_bracket(bracket_index, metar_high)
         
         return {
             "station_code": station_code,
@@ -277,10 +427,30 @@ class MetarService:
             "metar_bracket": metar_bracket,
             "brackets_match": zeus_bracket == metar_bracket if zeus_bracket and metar_bracket else None,
             "zeus_forecast_time": zeus_snapshot.get("fetch_time_utc"),
-            "metar_observation_count": len(self.get_observations(station_code, event_day)),
+            "metar_observation_count": metar_summary.count,
         }
     
+    def _store_daily_high(
+        self,
+        cache_key: Tuple[str, str],
+        event_day: date,
+        signature: tuple,
+        summary: ObservationSummary,
+    ) -> None:
+        """Cache a summary as most recently used, evicting beyond DAILY_HIGH_CACHE_SIZE."""
+        if event_day < datetime.now(timezone.utc).date():
+            expires_at = None
+        else:
+            expires_at = time.monotonic() + self.DAILY_HIGH_TTL_SECONDS
+        self._daily_high_cache[cache_key] = (expires_at, signature, summary)
+        while len(self._daily_high_cache) > self.DAILY_HIGH_CACHE_SIZE:
+            del self._daily_high_cache[next(iter(self._daily_high_cache))]
+    
     def clear_cache(self):
         """Clear the daily high cache."""
         self._daily_high_cache.clear()
 
+
+# Global METAR service instance (shared by the METAR and comparison routes
+# so they share its caches)
+metar_service = MetarService()
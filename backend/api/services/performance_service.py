@@ -1,15 +1,15 @@
 """Service for calculating performance metrics."""
 
-import sys
-from pathlib import Path
+import math
 from typing import List, Dict, Any, Optional
-from datetime import date, datetime
+from datetime import date
 from collections import defaultdict
-import statistics
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+import numpy as np
+
 from ..services.trade_service import TradeService
 from ..models.schemas import Trade
+from ..utils.file_utils import parse_trade_date
 
 
 class PerformanceService:
@@ -44,51 +44,68 @@ class PerformanceService:
             mode=mode,
         )
         
-        # Basic counts
+        # Counts, P&L totals and the station grouping, accumulated in one
+        # pass over the trades
         total_trades = len(trades)
-        resolved_trades = [t for t in trades if t.outcome and t.outcome != "pending"]
-        pending_trades = [t for t in trades if t.outcome == "pending" or not t.outcome]
-        
-        wins = [t for t in resolved_trades if t.outcome == "win"]
-        losses = [t for t in resolved_trades if t.outcome == "loss"]
-        
-        win_rate = (len(wins) / len(resolved_trades) * 100) if resolved_trades else 0.0
+        resolved_count = 0
+        wins = 0
+        losses = 0
+        total_risk = 0
+        total_pnl = 0
+        realized_pnls = []
+        trades_by_station = defaultdict(list)
+        for trade in trades:
+            total_risk += trade.size_usd
+            trades_by_station[trade.station_code].append(trade)
+            
+            outcome = trade.outcome
+            if outcome and outcome != "pending":
+                resolved_count += 1
+                if outcome == "win":
+                    wins += 1
+                elif outcome == "loss":
+                    losses += 1
+                
+                realized_pnl = trade.realized_pnl
+                if realized_pnl is not None:
+                    total_pnl += realized_pnl
+                    realized_pnls.append(realized_pnl)
         
-        # P&L metrics
-        total_risk = sum(t.size_usd for t in trades)
-        total_pnl = sum(t.realized_pnl or 0 for t in resolved_trades)
+        win_rate = (wins / resolved_count * 100) if resolved_count else 0.0
         roi = (total_pnl / total_risk * 100) if total_risk > 0 else 0.0
         
-        # Average edge
-        avg_edge = statistics.mean([t.edge_pct for t in trades]) if trades else 0.0
+        # Average edge (aggregates below run over float arrays in NumPy
+        # rather than per element in Python)
+        edge_values = np.fromiter((t.edge_pct for t in trades), dtype=np.float64, count=total_trades)
+        avg_edge = float(edge_values.mean()) if total_trades else 0.0
         
         # Largest win/loss
-        pnl_values = [t.realized_pnl for t in resolved_trades if t.realized_pnl is not None]
-        largest_win = max(pnl_values) if pnl_values else 0.0
-        largest_loss = min(pnl_values) if pnl_values else 0.0
+        pnl_values = np.array(realized_pnls, dtype=np.float64)
+        largest_win = float(pnl_values.max()) if pnl_values.size else 0.0
+        largest_loss = float(pnl_values.min()) if pnl_values.size else 0.0
         
-        # Sharpe ratio (simplified: mean return / std dev)
-        if len(pnl_values) > 1:
-            mean_return = statistics.mean(pnl_values)
-            std_dev = statistics.stdev(pnl_values)
+        # Sharpe ratio (simplified: mean return / sample std dev); the std dev
+        # reuses the mean, as ndarray.std would compute it again
+        if pnl_values.size > 1:
+            mean_return = float(pnl_values.mean())
+            deviations = pnl_values - mean_return
+            std_dev = math.sqrt(float(deviations @ deviations) / (pnl_values.size - 1))
             sharpe_ratio = (mean_return / std_dev) if std_dev > 0 else 0.0
         else:
             sharpe_ratio = 0.0
         
         # Breakdown by station
-        by_station = {}
-        stations = set(t.station_code for t in trades)
-        for station in stations:
-            station_trades = [t for t in trades if t.station_code == station]
-            station_metrics = self._calculate_metrics_for_trades(station_trades)
-            by_station[station] = station_metrics
+        by_station = {
+            station: self._calculate_metrics_for_trades(station_trades)
+            for station, station_trades in trades_by_station.items()
+        }
         
         return {
             "total_trades": total_trades,
-            "resolved_trades": len(resolved_trades),
-            "pending_trades": len(pending_trades),
-            "wins": len(wins),
-            "losses": len(losses),
+            "resolved_trades": resolved_count,
+            "pending_trades": total_trades - resolved_count,
+            "wins": wins,
+            "losses": losses,
             "win_rate": round(win_rate, 2),
             "total_risk": round(total_risk, 2),
             "total_pnl": round(total_pnl, 2),
@@ -108,44 +125,44 @@ class PerformanceService:
         mode: str,
     ) -> List[Trade]:
         """Get trades in date range."""
-        all_trades = self.trade_service.get_trades(
-            trade_date=None,
+        trades = self.trade_service.get_trades(
             station_code=station_code,
+            start_date=start_date,
+            end_date=end_date,
         )
         
-        filtered = []
-        for trade in all_trades:
-            try:
-                trade_date = datetime.fromisoformat(trade.timestamp.replace("Z", "+00:00")).date()
-                
-                if start_date and trade_date < start_date:
-                    continue
-                if end_date and trade_date > end_date:
-                    continue
-                
-                filtered.append(trade)
-            except (ValueError, AttributeError):
-                continue
-        
-        return filtered
+        # Drop trades without a valid timestamp (already done with a range)
+        if start_date or end_date:
+            return trades
+        return [t for t in trades if parse_trade_date(t.timestamp) is not None]
     
     def _calculate_metrics_for_trades(self, trades: List[Trade]) -> Dict[str, Any]:
         """Calculate metrics for a list of trades."""
-        resolved = [t for t in trades if t.outcome and t.outcome != "pending"]
-        wins = [t for t in resolved if t.outcome == "win"]
-        losses = [t for t in resolved if t.outcome == "loss"]
+        resolved_count = 0
+        wins = 0
+        losses = 0
+        total_risk = 0
+        total_pnl = 0
+        for trade in trades:
+            total_risk += trade.size_usd
+            
+            outcome = trade.outcome
+            if outcome and outcome != "pending":
+                resolved_count += 1
+                total_pnl += trade.realized_pnl or 0
+                if outcome == "win":
+                    wins += 1
+                elif outcome == "loss":
+                    losses += 1
         
-        win_rate = (len(wins) / len(resolved) * 100) if resolved else 0.0
-        total_risk = sum(t.size_usd for t in trades)
-        total_pnl = sum(t.realized_pnl or 0 for t in resolved)
+        win_rate = (wins / resolved_count * 100) if resolved_count else 0.0
         roi = (total_pnl / total_risk * 100) if total_risk > 0 else 0.0
         
         return {
             "trades": len(trades),
-            "wins": len(wins),
-            "losses": len(losses),
+            "wins": wins,
+            "losses": losses,
             "win_rate": round(win_rate, 2),
             "pnl": round(total_pnl, 2),
             "roi": round(roi, 2),
         }
-
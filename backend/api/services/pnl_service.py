@@ -1,14 +1,11 @@
 """Service for aggregating P&L across trades."""
 
-import sys
-from pathlib import Path
 from typing import List, Dict, Any, Optional
-from datetime import date, timedelta, datetime
-from collections import defaultdict
+from datetime import date, timedelta
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from ..services.trade_service import TradeService
 from ..models.schemas import Trade
+from ..utils.file_utils import parse_trade_date
 
 
 class PnLService:
@@ -46,54 +43,94 @@ class PnLService:
             mode=mode,
         )
         
-        # Calculate totals
-        total_pnl = sum(t.realized_pnl or 0 for t in trades)
-        total_risk = sum(t.size_usd for t in trades)
-        roi = (total_pnl / total_risk * 100) if total_risk > 0 else 0.0
-        
-        # Breakdown by station
-        by_station = defaultdict(lambda: {"pnl": 0.0, "risk": 0.0, "trades": 0})
-        for trade in trades:
-            by_station[trade.station_code]["pnl"] += trade.realized_pnl or 0
-            by_station[trade.station_code]["risk"] += trade.size_usd
-            by_station[trade.station_code]["trades"] += 1
+        # Periods run from their start date through today
+        today = date.today()
+        period_starts = {
+            "today": today,
+            "week": today - timedelta(days=7),
+            "month": today - timedelta(days=30),
+            "year": today - timedelta(days=365),
+        }
         
-        for station in by_station:
-            station_roi = (by_station[station]["pnl"] / by_station[station]["risk"] * 100) if by_station[station]["risk"] > 0 else 0.0
-            by_station[station]["roi"] = round(station_roi, 2)
-            by_station[station]["pnl"] = round(by_station[station]["pnl"], 2)
-            by_station[station]["risk"] = round(by_station[station]["risk"], 2)
+        # Accumulate totals and every breakdown in a single pass. Station and
+        # venue totals live in parallel lists, indexed by a slot per
+        # station or venue, and period totals in lists parallel to the
+        # period starts, instead of in a dict per group
+        total_pnl = 0
+        total_risk = 0
+        station_slots: Dict[str, int] = {}
+        venue_slots: Dict[str, int] = {}
+        slot_pnl: List[float] = []
+        slot_risk: List[float] = []
+        slot_trades: List[int] = []
+        period_start_dates = list(period_starts.values())
+        widest_first = sorted(range(len(period_start_dates)), key=period_start_dates.__getitem__)
+        period_pnl = [0] * len(period_starts)
+        period_risk = [0] * len(period_starts)
         
-        # Breakdown by venue
-        by_venue = defaultdict(lambda: {"pnl": 0.0, "risk": 0.0, "trades": 0})
         for trade in trades:
-            venue_name = trade.venue or "polymarket"
-            by_venue[venue_name]["pnl"] += trade.realized_pnl or 0
-            by_venue[venue_name]["risk"] += trade.size_usd
-            by_venue[venue_name]["trades"] += 1
+            pnl = trade.realized_pnl or 0
+            risk = trade.size_usd
+            
+            total_pnl += pnl
+            total_risk += risk
+            
+            # Breakdown by station and venue
+            for slots, key in (
+                (station_slots, trade.station_code),
+                (venue_slots, trade.venue or "polymarket"),
+            ):
+                slot = slots.get(key)
+                if slot is None:
+                    slot = slots[key] = len(slot_trades)
+                    slot_pnl.append(0.0)
+                    slot_risk.append(0.0)
+                    slot_trades.append(0)
+                slot_pnl[slot] += pnl
+                slot_risk[slot] += risk
+                slot_trades[slot] += 1
+            
+            # Breakdown by period (only trades with a date pass the range
+            # filter). Periods are nested, so they're checked from the
+            # widest, and a trade too old for one is too old for the rest
+            trade_date = parse_trade_date(trade.timestamp)
+            if trade_date <= today:
+                for index in widest_first:
+                    if trade_date < period_start_dates[index]:
+                        break
+                    period_pnl[index] += pnl
+                    period_risk[index] += risk
         
-        for venue_name in by_venue:
-            venue_roi = (by_venue[venue_name]["pnl"] / by_venue[venue_name]["risk"] * 100) if by_venue[venue_name]["risk"] > 0 else 0.0
-            by_venue[venue_name]["roi"] = round(venue_roi, 2)
-            by_venue[venue_name]["pnl"] = round(by_venue[venue_name]["pnl"], 2)
-            by_venue[venue_name]["risk"] = round(by_venue[venue_name]["risk"], 2)
+        roi = (total_pnl / total_risk * 100) if total_risk > 0 else 0.0
+        
+        by_station, by_venue = (
+            {
+                key: {
+                    "pnl": round(slot_pnl[slot], 2),
+                    "risk": round(slot_risk[slot], 2),
+                    "trades": slot_trades[slot],
+                    "roi": round(
+                        (slot_pnl[slot] / slot_risk[slot] * 100) if slot_risk[slot] > 0 else 0.0,
+                        2,
+                    ),
+                }
+                for key, slot in slots.items()
+            }
+            for slots in (station_slots, venue_slots)
+        )
         
-        # Breakdown by period
-        today = date.today()
         by_period = {
-            "today": self._get_pnl_for_period(trades, today, today),
-            "week": self._get_pnl_for_period(trades, today - timedelta(days=7), today),
-            "month": self._get_pnl_for_period(trades, today - timedelta(days=30), today),
-            "year": self._get_pnl_for_period(trades, today - timedelta(days=365), today),
-            "all_time": self._get_pnl_for_period(trades, None, None),
+            period: self._summarize_period(period_pnl[index], period_risk[index])
+            for index, period in enumerate(period_starts)
         }
+        by_period["all_time"] = self._summarize_period(total_pnl, total_risk)
         
         return {
             "total_pnl": round(total_pnl, 2),
             "total_risk": round(total_risk, 2),
             "roi": round(roi, 2),
-            "by_station": dict(by_station),
-            "by_venue": dict(by_venue),
+            "by_station": by_station,
+            "by_venue": by_venue,
             "by_period": by_period,
         }
     
@@ -106,54 +143,20 @@ class PnLService:
         mode: str,
     ) -> List[Trade]:
         """Get trades in date range with filters."""
-        # Get all trades (no date filter from service)
-        all_trades = self.trade_service.get_trades(
-            trade_date=None,
+        trades = self.trade_service.get_trades(
             station_code=station_code,
+            start_date=start_date,
+            end_date=end_date,
+            venue=venue,
         )
         
-        # Filter by date range
-        filtered = []
-        for trade in all_trades:
-            try:
-                trade_date = datetime.fromisoformat(trade.timestamp.replace("Z", "+00:00")).date()
-                
-                if start_date and trade_date < start_date:
-                    continue
-                if end_date and trade_date > end_date:
-                    continue
-                if venue and (trade.venue or "polymarket") != venue:
-                    continue
-                
-                filtered.append(trade)
-            except (ValueError, AttributeError):
-                continue
-        
-        return filtered
+        # Drop trades without a valid timestamp (already done with a range)
+        if start_date or end_date:
+            return trades
+        return [t for t in trades if parse_trade_date(t.timestamp) is not None]
     
-    def _get_pnl_for_period(
-        self,
-        trades: List[Trade],
-        start_date: Optional[date],
-        end_date: Optional[date],
-    ) -> Dict[str, float]:
-        """Get P&L for a specific period."""
-        period_trades = []
-        for trade in trades:
-            try:
-                trade_date = datetime.fromisoformat(trade.timestamp.replace("Z", "+00:00")).date()
-                
-                if start_date and trade_date < start_date:
-                    continue
-                if end_date and trade_date > end_date:
-                    continue
-                
-                period_trades.append(trade)
-            except (ValueError, AttributeError):
-                continue
-        
-        pnl = sum(t.realized_pnl or 0 for t in period_trades)
-        risk = sum(t.size_usd for t in period_trades)
+    def _summarize_period(self, pnl: float, risk: float) -> Dict[str, float]:
+        """Get the rounded P&L, risk and ROI of a period's totals."""
         roi = (pnl / risk * 100) if risk > 0 else 0.0
         
         return {
@@ -161,4 +164,3 @@ class PnLService:
             "risk": round(risk, 2),
             "roi": round(roi, 2),
         }
-
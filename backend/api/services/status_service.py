@@ -1,25 +1,56 @@
 """Service for checking system status and trading engine state."""
 
+import os
+import re
 import subprocess
-import sys
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
-# Add project root to path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
 from core.config import config
 from ..utils.path_utils import PROJECT_ROOT
 
+# Decision snapshot file names, e.g. 2025-11-17_20-15-30.json
+_DECISION_NAME_RE = re.compile(r'\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}\.json')
+
+
+def _pid_exists(pid: int) -> bool:
+    """Check whether a process exists, without spawning ps.
+    
+    Signal 0 only checks that the process can be signalled.
+    
+    Args:
+        pid: Process ID
+        
+    Returns:
+        True if the process exists
+    """
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except (ProcessLookupError, OverflowError):
+        return False
+    except PermissionError:
+        # Exists, but belongs to another user
+        return True
+    return True
+
 
 class StatusService:
     """Service for checking system status and trading engine state."""
     
+    # Seconds the last cycle time is reused before decisions are walked again
+    LAST_CYCLE_TTL_SECONDS = 5
+    
     def __init__(self):
         """Initialize status service."""
         self.logs_dir = PROJECT_ROOT / "logs"
         self.pid_file = self.logs_dir / "dynamic_paper.pid"
+        # Last cycle time cache: ((decisions dir, its mtime_ns), last cycle
+        # time, expires_at)
+        self._last_cycle_cache: Optional[Tuple[tuple, Optional[datetime], float]] = None
     
     def check_trading_engine_running(self) -> bool:
         """Check if dynamic trading engine is running.
@@ -32,15 +63,10 @@ class StatusService:
         
         try:
             pid = int(self.pid_file.read_text().strip())
-            # Check if process exists
-            result = subprocess.run(
-                ["ps", "-p", str(pid)],
-                capture_output=True,
-                timeout=2,
-            )
-            return result.returncode == 0
-        except (ValueError, subprocess.TimeoutExpired, FileNotFoundError):
+        except (ValueError, FileNotFoundError):
             return False
+        
+        return _pid_exists(pid)
     
     def get_trading_engine_status(self) -> Dict[str, Any]:
         """Get detailed trading engine status.
@@ -92,30 +118,56 @@ class StatusService:
             Datetime of last cycle, or None if not found
         """
         decisions_dir = PROJECT_ROOT / "data" / "snapshots" / "dynamic" / "decisions"
-        if not decisions_dir.exists():
+        try:
+            mtime_ns = decisions_dir.stat().st_mtime_ns
+        except OSError:
             return None
         
-        latest_time = None
+        # Reuse the last walk while the decisions directory is unchanged and
+        # the TTL hasn't passed (new snapshots land in event day
+        # subdirectories, which don't change its mtime)
+        cache_key = (decisions_dir, mtime_ns)
+        cached = self._last_cycle_cache
+        if cached is not None and cached[0] == cache_key and time.monotonic() < cached[2]:
+            return cached[1]
+        
+        latest_time = self._scan_last_cycle_time(decisions_dir)
+        self._last_cycle_cache = (
+            cache_key,
+            latest_time,
+            time.monotonic() + self.LAST_CYCLE_TTL_SECONDS,
+        )
+        return latest_time
+    
+    def _scan_last_cycle_time(self, decisions_dir: Path) -> Optional[datetime]:
+        """Find the timestamp of the most recent decision snapshot.
         
-        # Find the most recent decision snapshot
-        for station_dir in decisions_dir.iterdir():
-            if not station_dir.is_dir():
+        Args:
+            decisions_dir: Decision snapshots directory
+            
+        Returns:
+            Datetime of last cycle, or None if not found
+        """
+        # Snapshot names are zero padded timestamps, so the lexicographic max
+        # is the latest one and only it needs parsing
+        latest_name = None
+        for station_entry in os.scandir(decisions_dir):
+            if not station_entry.is_dir():
                 continue
-            for event_day_dir in station_dir.iterdir():
-                if not event_day_dir.is_dir():
+            for day_entry in os.scandir(station_entry.path):
+                if not day_entry.is_dir():
                     continue
-                for snapshot_file in event_day_dir.glob("*.json"):
-                    try:
-                        # Extract timestamp from filename (e.g., 2025-11-17_20-15-30.json)
-                        timestamp_str = snapshot_file.stem
-                        # Parse: 2025-11-17_20-15-30
-                        cycle_time = datetime.strptime(timestamp_str, "%Y-%m-%d_%H-%M-%S")
-                        if latest_time is None or cycle_time > latest_time:
-                            latest_time = cycle_time
-                    except (ValueError, IndexError):
-                        continue
+                for entry in os.scandir(day_entry.path):
+                    name = entry.name
+                    if (latest_name is None or name > latest_name) and _DECISION_NAME_RE.fullmatch(name):
+                        latest_name = name
         
-        return latest_time
+        if latest_name is None:
+            return None
+        try:
+            return datetime.strptime(latest_name[:-5], "%Y-%m-%d_%H-%M-%S")
+        except ValueError:
+            return None
     
     def _calculate_next_cycle_time(self, last_cycle: Optional[datetime], interval_seconds: int) -> Optional[datetime]:
         """Calculate when the next cycle should run.
@@ -132,6 +184,42 @@ class StatusService:
         
         return last_cycle + timedelta(seconds=interval_seconds)
     
+    def _count_recent_snapshots(self, directory: str, since: float) -> int:
+        """Count the snapshot files under a directory modified since a time.
+        
+        Walks the tree with os.scandir, whose entries already know whether
+        they're directories, instead of rglob building a Path per entry.
+        Like rglob, symlinked directories aren't descended into.
+        
+        Every *.json file is stat'ed: some snapshots (e.g. Polymarket
+        midpoints and books) are rewritten in place, which doesn't change
+        their directory's mtime. The walk is serial: one thread per top
+        level directory measured no faster, with a warm or a cold page
+        cache.
+        
+        Args:
+            directory: Directory to walk
+            since: Epoch seconds files must be modified after
+            
+        Returns:
+            Number of recent *.json files
+        """
+        count = 0
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        try:
+                            if entry.stat().st_mtime > since:
+                                count += 1
+                        except OSError:
+                            pass
+                    if entry.is_dir(follow_symlinks=False):
+                        count += self._count_recent_snapshots(entry.path, since)
+        except OSError:
+            pass
+        return count
+    
     def get_system_status(self) -> Dict[str, Any]:
         """Get overall system status.
         
@@ -168,17 +256,10 @@ class StatusService:
         trades_dir = data_dir / "trades"
         
         # Count recent snapshots (last 24 hours)
-        snapshot_count = 0
-        if snapshots_dir.exists():
-            for snapshot_file in snapshots_dir.rglob("*.json"):
-                # Check if file was modified in last 24 hours
-                try:
-                    mtime = snapshot_file.stat().st_mtime
-                    age_seconds = datetime.now().timestamp() - mtime
-                    if age_seconds < 86400:  # 24 hours
-                        snapshot_count += 1
-                except (OSError, ValueError):
-                    pass
+        snapshot_count = self._count_recent_snapshots(
+            str(snapshots_dir),
+            datetime.now().timestamp() - 86400,
+        )
         
         status = {
             "timestamp": datetime.utcnow().isoformat(),
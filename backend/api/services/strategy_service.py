@@ -1,13 +1,15 @@
 """Service for managing strategy documentation and changelog."""
 
 import json
-import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..utils.path_utils import PROJECT_ROOT
 
@@ -23,6 +25,9 @@ class StrategyService:
         self.docs_file = self.strategy_dir / "strategy_documentation.json"
         self.changelog_file = self.strategy_dir / "changelog.json"
         
+        # Parsed JSON files (key: file path, value: ((mtime_ns, size), data))
+        self._json_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        
         # Initialize files if they don't exist
         self._ensure_files_exist()
     
@@ -52,17 +57,47 @@ class StrategyService:
         self._write_json(self.changelog_file, default_changelog)
     
     def _read_json(self, file_path: Path) -> Dict[str, Any]:
-        """Read JSON file."""
+        """Read JSON file.
+        
+        The parsed data is reused until the file changes, so it's shared
+        between callers and must not be modified.
+        """
         try:
-            with open(file_path, "r") as f:
-                return json.load(f)
+            stat = file_path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            
+            cached = self._json_cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            
+            content = file_path.read_bytes()
+            data = None
+            if ORJSON_AVAILABLE:
+                try:
+                    data = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # Not strict JSON (such as NaN), which json accepts
+                    pass
+            if data is None:
+                data = json.loads(content)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             raise ValueError(f"Failed to read {file_path}: {e}")
+        
+        self._json_cache[file_path] = (signature, data)
+        return data
     
     def _write_json(self, file_path: Path, data: Dict[str, Any]):
-        """Write JSON file."""
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        """Write JSON file (the data is kept as its parsed contents)."""
+        # Serialized first and written in one call; json.dump would write
+        # every token separately
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(data, indent=2).encode("utf-8")
+        file_path.write_bytes(content)
+        
+        stat = file_path.stat()
+        self._json_cache[file_path] = ((stat.st_mtime_ns, stat.st_size), data)
     
     def get_strategy_documentation(self) -> Dict[str, Any]:
         """Get current strategy documentation.
@@ -98,8 +133,9 @@ class StrategyService:
         if type_filter:
             entries = [e for e in entries if e.get("type") == type_filter]
         
-        # Sort by date (newest first)
-        entries.sort(key=lambda x: x.get("date", ""), reverse=True)
+        # Sort by date (newest first), into a new list as the entries are
+        # shared with the cache
+        entries = sorted(entries, key=lambda x: x.get("date", ""), reverse=True)
         
         # Apply limit
         if limit:
@@ -156,11 +192,8 @@ class StrategyService:
         if author:
             entry["author"] = author
         
-        # Add to changelog
-        if "entries" not in changelog:
-            changelog["entries"] = []
-        
-        changelog["entries"].append(entry)
+        # Add to a copy of the changelog, as the parsed one is shared
+        changelog = {**changelog, "entries": [*changelog.get("entries", []), entry]}
         
         # Write back
         self._write_json(self.changelog_file, changelog)
@@ -1,12 +1,10 @@
 """Service for resolving paper trade outcomes and calculating P&L."""
 
-import sys
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
 from collections import defaultdict
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from venues.polymarket.resolution import PolyResolution
 from venues.polymarket.discovery import PolyDiscovery
 from core.registry import StationRegistry
@@ -171,12 +169,13 @@ class TradeResolutionService:
         # Update with resolved outcomes
         for trade in resolved_trades:
             key = f"{trade.timestamp}_{trade.market_id}"
-            if key in existing_trades:
-                existing_trades[key]["outcome"] = trade.outcome or ""
-                existing_trades[key]["realized_pnl"] = str(trade.realized_pnl) if trade.realized_pnl is not None else ""
-                existing_trades[key]["venue"] = trade.venue or "polymarket"
-                existing_trades[key]["resolved_at"] = trade.resolved_at or ""
-                existing_trades[key]["winner_bracket"] = trade.winner_bracket or ""
+            row = existing_trades.get(key)
+            if row is not None:
+                row["outcome"] = trade.outcome or ""
+                row["realized_pnl"] = str(trade.realized_pnl) if trade.realized_pnl is not None else ""
+                row["venue"] = trade.venue or "polymarket"
+                row["resolved_at"] = trade.resolved_at or ""
+                row["winner_bracket"] = trade.winner_bracket or ""
         
         # Write updated CSV
         fieldnames = [
@@ -1,26 +1,37 @@
 """Service for reading trade CSV files."""
 
+import re
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from datetime import date, datetime
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, datetime, timedelta
 
 from ..utils.path_utils import get_trades_dir
-from ..utils.file_utils import read_csv_file, parse_timestamp
+from ..utils.file_utils import read_csv_file, parse_timestamp, parse_trade_date
 from ..models.schemas import Trade
 
 
+# Trade directories are named after their date (YYYY-MM-DD)
+_DATE_DIR_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
 class TradeService:
     """Service for reading paper trade CSV files."""
     
     def __init__(self):
         """Initialize trade service."""
         self.trades_dir = get_trades_dir()
+        # Trades built from each CSV file (key: file path, value:
+        # ((mtime_ns, size), trades))
+        self._file_trades: Dict[Path, Tuple[Tuple[int, int], List[Trade]]] = {}
     
     def get_trades(
         self,
         trade_date: Optional[date] = None,
         station_code: Optional[str] = None,
         limit: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        venue: Optional[str] = None,
     ) -> List[Trade]:
         """Get trades from CSV files.
         
@@ -28,6 +39,9 @@ class TradeService:
             trade_date: Optional date filter (YYYY-MM-DD)
             station_code: Optional station code filter
             limit: Optional limit on number of trades
+            start_date: Optional first trade date (by timestamp)
+            end_date: Optional last trade date (by timestamp)
+            venue: Optional venue filter (trades without one are "polymarket")
             
         Returns:
             List of Trade objects
@@ -40,25 +54,61 @@ class TradeService:
             if not csv_file.exists():
                 return []
             
-            rows = read_csv_file(csv_file)
+            trades = list(self._read_trades(csv_file))
         else:
-            # Read from all date directories
-            rows = []
-            for date_dir in sorted(self.trades_dir.iterdir(), reverse=True):
-                if not date_dir.is_dir():
-                    continue
-                
+            # Read from all date directories in range
+            trades = []
+            for date_dir in self._get_date_dirs(start_date, end_date):
                 csv_file = date_dir / "paper_trades.csv"
                 if csv_file.exists():
-                    rows.extend(read_csv_file(csv_file))
+                    trades.extend(self._read_trades(csv_file))
         
-        # Convert to Trade objects
-        trades = []
-        for row in rows:
-            # Filter by station if specified
-            if station_code and row.get("station_code") != station_code:
-                continue
+        if station_code:
+            trades = [t for t in trades if t.station_code == station_code]
+        if venue:
+            trades = [t for t in trades if (t.venue or "polymarket") == venue]
+        if start_date or end_date:
+            trades = [
+                t for t in trades
+                if self._in_date_range(t.timestamp, start_date, end_date)
+            ]
+        
+        # Sort by timestamp descending (most recent first)
+        trades.sort(key=lambda t: t.timestamp, reverse=True)
+        
+        if limit:
+            trades = trades[:limit]
+        
+        return trades
+    
+    def _read_trades(self, csv_file: Path) -> List[Trade]:
+        """Read the trades of a CSV file, reusing them while it's unchanged.
+        
+        Building Trade models (with validation) costs far more than any
+        aggregation over them, so each file's trades are built once and
+        kept until the file is rewritten or appended to. The Trade objects
+        are shared between calls and must not be modified; code that
+        updates trades (TradeResolutionService) uses its own TradeService.
+        
+        Args:
+            csv_file: Paper trades CSV file
             
+        Returns:
+            Trades of the file (invalid rows are skipped); the list is
+            shared too, so callers copy it before changing it
+        """
+        try:
+            stat = csv_file.stat()
+        except OSError:
+            return []
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._file_trades.get(csv_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        trades = []
+        for row in read_csv_file(csv_file):
             try:
                 trade = Trade(
                     timestamp=row.get("timestamp", ""),
@@ -87,13 +137,61 @@ class TradeService:
                 # Skip invalid rows
                 continue
         
-        # Sort by timestamp descending (most recent first)
-        trades.sort(key=lambda t: t.timestamp, reverse=True)
+        self._file_trades[csv_file] = (signature, trades)
+        return trades
+    
+    def _get_date_dirs(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> List[Path]:
+        """Get the trade date directories that can hold trades in a range.
         
-        if limit:
-            trades = trades[:limit]
+        Directories are named after the local date trades were written on,
+        which can be a day off the (UTC) trade timestamps, so a day's margin
+        is kept on either side of the range.
         
-        return trades
+        Args:
+            start_date: Optional first trade date
+            end_date: Optional last trade date
+            
+        Returns:
+            Directories, most recent first
+        """
+        first_dir = (start_date - timedelta(days=1)).isoformat() if start_date else None
+        last_dir = (end_date + timedelta(days=1)).isoformat() if end_date else None
+        
+        date_dirs = []
+        for date_dir in sorted(self.trades_dir.iterdir(), reverse=True):
+            if not date_dir.is_dir():
+                continue
+            
+            # Only prune directories named after a date
+            if _DATE_DIR_RE.match(date_dir.name):
+                if first_dir and date_dir.name < first_dir:
+                    continue
+                if last_dir and date_dir.name > last_dir:
+                    continue
+            
+            date_dirs.append(date_dir)
+        
+        return date_dirs
+    
+    @staticmethod
+    def _in_date_range(
+        timestamp: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> bool:
+        """Check whether a trade timestamp falls within a date range."""
+        trade_date = parse_trade_date(timestamp)
+        if trade_date is None:
+            return False
+        if start_date and trade_date < start_date:
+            return False
+        if end_date and trade_date > end_date:
+            return False
+        return True
     
     def get_trade_summary(
         self,
@@ -39,8 +39,7 @@ class WebSocketService:
         """
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
-        if websocket in self.connection_metadata:
-            del self.connection_metadata[websocket]
+        self.connection_metadata.pop(websocket, None)
     
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """Send a message to a specific WebSocket connection.
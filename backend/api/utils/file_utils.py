@@ -2,30 +2,82 @@
 
 import json
 import csv
+import os
+from fnmatch import fnmatchcase
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from datetime import datetime, date
 
+# orjson builds plain dicts directly; parsers with a lazy document (such as
+# simdjson) would need converting back, as snapshots are cached, modified
+# and returned whole
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def read_json_file(file_path: Path) -> Optional[Dict[str, Any]]:
     """Read a JSON file and return its contents.
     
+    The file is read in one call and parsed with orjson when it's
+    installed. Files orjson rejects but the json module accepts (such as
+    the NaN that json.dump writes for missing values) are parsed with json.
+    
     Args:
         file_path: Path to JSON file
         
     Returns:
         Dictionary with file contents, or None if file doesn't exist or is invalid
     """
-    if not file_path.exists():
+    # A plain read: copying the bytes is a few percent of the parse even
+    # for multi-megabyte files, so parsing from an mmap measured no faster
+    try:
+        content = file_path.read_bytes()
+    except IOError:
         return None
     
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    
     try:
-        with open(file_path, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        return json.loads(content)
+    except json.JSONDecodeError:
         return None
 
 
+def read_json_file_cached(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Read a JSON file, reusing the parsed contents while it's unchanged.
+    
+    Snapshot files aren't modified once written, so repeat reads are
+    served from memory, keyed by the file's modification time and size.
+    The returned object is shared between callers and must not be
+    modified; copy it first.
+    
+    Args:
+        file_path: Path to JSON file
+        
+    Returns:
+        Dictionary with file contents, or None if file doesn't exist or is invalid
+    """
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return _read_json_file_version(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=2048)
+def _read_json_file_version(path_str: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Read one version of a JSON file (see read_json_file_cached)."""
+    return read_json_file(Path(path_str))
+
+
 def read_csv_file(file_path: Path) -> List[Dict[str, Any]]:
     """Read a CSV file and return list of dictionaries.
     
@@ -56,16 +108,27 @@ def list_json_files(directory: Path, pattern: str = "*.json") -> List[Path]:
     Returns:
         List of Path objects, sorted by filename
     """
-    if not directory.exists():
+    # One scandir pass; a missing directory is caught rather than checked
+    try:
+        with os.scandir(directory) as entries:
+            if pattern == "*.json":
+                names = [entry.name for entry in entries if entry.name.endswith(".json")]
+            else:
+                names = [entry.name for entry in entries if fnmatchcase(entry.name, pattern)]
+    except OSError:
         return []
     
-    files = list(directory.glob(pattern))
-    return sorted(files)
+    names.sort()
+    return [directory / name for name in names]
 
 
+@lru_cache(maxsize=8192)
 def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
     """Parse ISO format timestamp string.
     
+    Memoized: the same snapshot and trade timestamps are parsed again on
+    every request, and the returned datetimes are immutable.
+    
     Args:
         timestamp_str: ISO format timestamp string
         
@@ -81,3 +144,22 @@ def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
     except (ValueError, AttributeError):
         return None
 
+
+@lru_cache(maxsize=16384)
+def parse_trade_date(timestamp_str: str) -> Optional[date]:
+    """Parse the (UTC) date of a trade timestamp.
+    
+    Memoized like parse_timestamp, as every trade's date is looked up
+    for each date filter applied to it. The timestamp goes straight to
+    the C parser, which reads a trailing "Z" itself since Python 3.11.
+    
+    Args:
+        timestamp_str: ISO format timestamp string (may end in "Z")
+        
+    Returns:
+        date object or None if parsing fails
+    """
+    try:
+        return datetime.fromisoformat(timestamp_str).date()
+    except (ValueError, TypeError):
+        return None
@@ -43,9 +43,10 @@ class SnapshotFileHandler(FileSystemEventHandler):
         # Avoid processing the same file multiple times
         import time
         current_time = time.time()
-        if file_path in self.last_processed:
+        last_processed = self.last_processed.get(file_path)
+        if last_processed is not None:
             # Only process if file was modified more than 1 second ago
-            if current_time - self.last_processed[file_path] < 1.0:
+            if current_time - last_processed < 1.0:
                 return
         
         self.last_processed[file_path] = current_time
@@ -0,0 +1,77 @@
+"""Tests for edge service."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from backend.api.services.edge_service import select_edges
+
+
+@pytest.fixture
+def snapshots():
+    """Decision snapshots, most recent first."""
+    return [
+        {
+            "station_code": "EGLC",
+            "city": "London",
+            "event_day": "2025-11-13",
+            "decision_time_utc": "2025-11-13T12:15:00Z",
+            "decisions": [
+                {"bracket": "50-51", "edge_pct": 4.0, "size_usd": 10.0},
+                {"bracket": "52-53", "edge_pct": 9.0, "size_usd": 25.0},
+            ],
+        },
+        {
+            "station_code": "EGLC",
+            "city": "London",
+            "event_day": "2025-11-13",
+            "decision_time_utc": "2025-11-13T12:00:00Z",
+            "decisions": [
+                {"bracket": "50-51", "edge_pct": 20.0, "size_usd": 50.0},
+            ],
+        },
+        {
+            "station_code": "KLGA",
+            "city": "New York",
+            "event_day": "2025-11-14",
+            "decision_time_utc": "2025-11-13T11:00:00Z",
+            "decisions": [
+                {"bracket": "40-41", "edge_pct": 6.0, "size_usd": 15.0},
+            ],
+        },
+    ]
+
+
+class TestSelectEdges:
+    """Test edge selection kernel."""
+    
+    def test_keeps_most_recent_edge_per_bracket(self, snapshots):
+        """Older decisions for the same bracket are dropped."""
+        edges = select_edges(snapshots)
+        
+        eglc_50 = [e for e in edges if e["bracket"] == "50-51"]
+        assert len(eglc_50) == 1
+        assert eglc_50[0]["edge_pct"] == 4.0
+        assert eglc_50[0]["decision_time_utc"] == "2025-11-13T12:15:00Z"
+        assert eglc_50[0]["city"] == "London"
+    
+    def test_sorted_by_edge_pct(self, snapshots):
+        """Edges are ranked best first."""
+        edges = select_edges(snapshots)
+        
+        assert [e["edge_pct"] for e in edges] == [9.0, 6.0, 4.0]
+    
+    def test_filters(self, snapshots):
+        """Station and event day filters apply per snapshot."""
+        assert [e["bracket"] for e in select_edges(snapshots, station_code="KLGA")] == ["40-41"]
+        assert len(select_edges(snapshots, event_day="2025-11-13")) == 2
+        assert select_edges(snapshots, station_code="KLGA", event_day="2025-11-13") == []
+    
+    def test_limit(self, snapshots):
+        """Limit returns the top edges in rank order."""
+        edges = select_edges(snapshots, limit=2)
+        
+        assert [e["edge_pct"] for e in edges] == [9.0, 6.0]
@@ -76,6 +76,7 @@ class TestEngineService:
         """Test configuration is saved correctly."""
         engine_service._save_config(sample_config)
         assert engine_service.config_file.exists()
+        assert not engine_service.config_file.with_suffix(".json.tmp").exists()
         
         import json
         with open(engine_service.config_file, "r") as f:
@@ -92,22 +93,35 @@ class TestEngineService:
         config = engine_service.get_engine_config()
         assert config == sample_config
     
-    def test_build_env(self, engine_service, sample_config):
-        """Test environment variables are built correctly."""
-        env = engine_service._build_env(sample_config)
+    def test_get_engine_config_cached_until_file_changes(self, engine_service, sample_config):
+        """Test get_engine_config only re-reads the file after it changes."""
+        engine_service._save_config(sample_config)
+        first = engine_service.get_engine_config()
+    
+        with patch("builtins.open", side_effect=AssertionError("config re-read")):
+            assert engine_service.get_engine_config() is first
+    
+        updated = dict(sample_config, stations=["EGLC", "KLGA", "KJFK"])
+        engine_service._save_config(updated)
+        assert engine_service.get_engine_config() == updated
+    
+    @patch("backend.api.services.engine_service.subprocess.Popen")
+    def test_start_engine_passes_config_file(self, mock_popen, engine_service, sample_config):
+        """Test engine process reads its config from the saved config file."""
+        mock_popen.return_value = MagicMock(pid=12345)
+        
+        engine_service.start_engine(
+            stations=sample_config["stations"],
+            interval_seconds=sample_config["interval_seconds"],
+            lookahead_days=sample_config["lookahead_days"],
+            trading_config=sample_config["trading"],
+            probability_model_config=sample_config["probability_model"],
+        )
         
-        assert env["EDGE_MIN"] == "0.05"
-        assert env["FEE_BP"] == "50"
-        assert env["SLIPPAGE_BP"] == "30"
-        assert float(env["KELLY_CAP"]) == 0.10  # Check value, not exact string
-        assert env["PER_MARKET_CAP"] == "500.0"
-        assert env["LIQUIDITY_MIN_USD"] == "1000.0"
-        assert env["DAILY_BANKROLL_CAP"] == "3000.0"
-        assert env["MODEL_MODE"] == "spread"
-        assert float(env["ZEUS_LIKELY_PCT"]) == 0.80
-        assert float(env["ZEUS_POSSIBLE_PCT"]) == 0.95
-        assert env["DYNAMIC_INTERVAL_SECONDS"] == "900"
-        assert env["DYNAMIC_LOOKAHEAD_DAYS"] == "2"
+        cmd = mock_popen.call_args.args[0]
+        assert cmd[cmd.index("--config-file") + 1] == str(engine_service.config_file)
+        assert "env" not in mock_popen.call_args.kwargs
+        assert engine_service.get_engine_config()["trading"] == sample_config["trading"]
     
     @patch("backend.api.services.engine_service.subprocess.Popen")
     def test_start_engine_success(self, mock_popen, engine_service, sample_config):
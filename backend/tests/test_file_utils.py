@@ -0,0 +1,40 @@
+"""Tests for file utilities."""
+
+import os
+from unittest.mock import patch
+
+from api.utils.file_utils import read_json_file, read_json_file_cached
+
+
+class TestReadJsonFile:
+    """Test JSON file reading."""
+    
+    def test_read_json_file(self, tmp_path):
+        """Valid files are parsed; missing and invalid ones give None."""
+        (tmp_path / "valid.json").write_text('{"temp_F": 59.1, "raw": "EGLC 131220Z"}')
+        (tmp_path / "invalid.json").write_text('{"temp_F": ')
+        
+        assert read_json_file(tmp_path / "valid.json") == {"temp_F": 59.1, "raw": "EGLC 131220Z"}
+        assert read_json_file(tmp_path / "invalid.json") is None
+        assert read_json_file(tmp_path / "missing.json") is None
+    
+    def test_read_json_file_nan(self, tmp_path):
+        """NaN written by json.dump is still read."""
+        (tmp_path / "nan.json").write_text('{"temp_K": NaN}')
+        
+        data = read_json_file(tmp_path / "nan.json")
+        assert data["temp_K"] != data["temp_K"]
+    
+    def test_read_json_file_cached(self, tmp_path):
+        """Cached contents are reused until the file changes."""
+        path = tmp_path / "snapshot.json"
+        path.write_text('{"temp_F": 59.1}')
+        first = read_json_file_cached(path)
+        
+        with patch("api.utils.file_utils.read_json_file", side_effect=AssertionError("re-read")):
+            assert read_json_file_cached(path) is first
+        
+        path.write_text('{"temp_F": 60.4}')
+        os.utime(path, ns=(0, 0))
+        assert read_json_file_cached(path) == {"temp_F": 60.4}
+        assert read_json_file_cached(tmp_path / "missing.json") is None
@@ -1,11 +1,12 @@
 """Tests for LogService."""
 
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 from datetime import date, datetime
 
-from api.services.log_service import LogService
+from api.services.log_service import LogService, _DATE_BYTES_RE, _parse_date
 
 
 class TestLogService:
@@ -21,14 +22,40 @@ class TestLogService:
         service = LogService()
         
         # Test with timestamp and station code
-        line = "[2025-11-13 12:00:00] | INFO | Processing station EGLC"
+        line = "[2025-11-13 12:00:00] INFO     Processing station EGLC     fetchers.py:72"
         entry = service._parse_log_line(line, Path("test.log"))
         
         assert entry is not None
-        assert "EGLC" in entry.get("message", "")
-        assert entry.get("station_code") == "EGLC"
-        assert entry.get("level") == "INFO"
-        assert entry.get("timestamp") is not None
+        assert entry.message == "Processing station EGLC"
+        assert entry.station_code == "EGLC"
+        assert entry.level == "INFO"
+        assert entry.timestamp is not None
+    
+    def test_parse_log_line_known_station_only(self):
+        """Test station extraction ignores 4-letter words that are not stations."""
+        service = LogService()
+        
+        line = "[2025-11-13 12:00:00] INFO     ZEUS data for KLGA ready     fetchers.py:72"
+        entry = service._parse_log_line(line, Path("test.log"))
+        
+        assert entry.station_code == "KLGA"
+        assert entry.level == "INFO"
+        assert entry.message == "ZEUS data for KLGA ready"
+        
+        line = "[2025-11-13 12:00:00] INFO     WARN: nothing to do"
+        entry = service._parse_log_line(line, Path("test.log"))
+        
+        assert entry.station_code is None
+        
+        # Station codes inside longer tokens aren't stations
+        for token in ("XEGLCX", "KLGAS", "1EGLC", "EGLC2"):
+            line = f"[2025-11-13 12:00:00] INFO     Token {token} seen"
+            entry = service._parse_log_line(line, Path("test.log"))
+            assert entry.station_code is None, token
+        
+        line = "[2025-11-13 12:00:00] INFO     London (EGLC) → 2025-11-13"
+        entry = service._parse_log_line(line, Path("test.log"))
+        assert entry.station_code == "EGLC"
     
     def test_parse_log_line_with_event_day(self):
         """Test parsing log line with event day."""
@@ -38,7 +65,7 @@ class TestLogService:
         entry = service._parse_log_line(line, Path("test.log"))
         
         assert entry is not None
-        assert entry.get("event_day") == "2025-11-13"
+        assert entry.event_day == "2025-11-13"
     
     def test_parse_log_line_action_type(self):
         """Test parsing action type from log line."""
@@ -49,137 +76,455 @@ class TestLogService:
         entry = service._parse_log_line(line, Path("test.log"))
         
         assert entry is not None
-        assert entry.get("action_type") == "trade"
+        assert entry.action_type == "trade"
         
         # Test fetch action
         line = "[2025-11-13 12:00:00] | INFO | Fetching Zeus forecast"
         entry = service._parse_log_line(line, Path("test.log"))
         
         assert entry is not None
-        assert entry.get("action_type") == "fetch"
+        assert entry.action_type == "fetch"
+    
+    def test_parse_log_line_ignores_invalid_dates(self):
+        """Test a date-shaped but invalid string is not taken as event day."""
+        service = LogService()
+        
+        entry = service._parse_log_line(
+            "[2025-11-13 12:00:00] INFO     Skipping 2025-13-45 for EGLC",
+            Path("test.log"),
+        )
+        assert entry.event_day == "2025-11-13"
+        assert _parse_date("2025-13-45") is None
+        assert _parse_date("2025-11-14") == date(2025, 11, 14)
+    
+    def test_station_for_city_memoized(self):
+        """Test city names resolve to stations once and are then looked up."""
+        service = LogService()
+        
+        entry = service._parse_log_line("[2025-11-13 12:00:00] INFO     London → 2025-11-14", Path("test.log"))
+        assert entry.station_code == "EGLC"
+        assert service._station_for_city("Atlantis") is None
+        
+        with patch.object(service.registry, "list_all", side_effect=AssertionError("registry scanned")):
+            assert service._station_for_city("London") == "EGLC"
+            assert service._station_for_city("Atlantis") is None
+    
+    def test_classify_action_priority(self):
+        """Test earlier ACTION_PATTERNS entries win, with or without pyahocorasick."""
+        service = LogService()
+        
+        for automaton in (service._action_automaton, None):
+            service._action_automaton = automaton
+            assert service._classify_action("saved trade to ledger") == "trade"
+            assert service._classify_action("edge found after fetching") == "fetch"
+            assert service._classify_action("snapshot failed") == "snapshot"
+            # Overlapping keywords: "trade" starts inside "snapshot"
+            assert service._classify_action("snapshotrade") == "trade"
+            assert service._classify_action("nothing to see") is None
+    
+    def test_format_message_for_humans_cleanup(self):
+        """Test file references, level names and paths are cleaned up."""
+        service = LogService()
+        message = (
+            "INFO     Moved  data/trades/2025-11-13/paper_trades.csv and "
+            "data/snapshots/x.json from /Users/me/hermes   fetchers.py:72"
+        )
+        assert service._format_message_for_humans({"message": message}) == (
+            "Moved trade file and snapshot from ..."
+        )
+        assert service._format_message_for_humans({"message": "ERROR  discovery.py:301 Done"}) == "Done"
+    
+    def test_extract_key_info(self):
+        """Test key events are ranked and unrelated messages are skipped."""
+        service = LogService()
+        assert service._extract_key_info("Loaded 9 stations from registry", {}) is None
+        assert service._extract_key_info("Request failed: 404", {"level": "ERROR"}) == (
+            "❌ API Error: Resource not found (404)"
+        )
+        assert service._extract_key_info(
+            "Saved Zeus snapshot, error in cache", {"station_code": "EGLC"}
+        ) == "❌ Error occurred (+1 more)"
     
-    def test_get_activity_logs_filter_by_station(self):
+    def test_get_activity_logs_filter_by_station(self, tmp_path):
         """Test filtering logs by station code."""
         service = LogService()
+        service.logs_dir = tmp_path
+        (tmp_path / "test.log").write_text(
+            "[2025-11-13 12:00:00] INFO     Processing EGLC\n"
+            "[2025-11-13 12:01:00] INFO     Processing KLGA\n"
+        )
         
-        with patch.object(service, "get_log_files") as mock_files:
-            mock_file = MagicMock()
-            mock_file.name = "test.log"
-            mock_file.exists.return_value = True
-            mock_files.return_value = [mock_file]
-            
-            with patch.object(service, "read_log_file") as mock_read:
-                mock_read.return_value = [
-                    {
-                        "timestamp": "2025-11-13T12:00:00",
-                        "log_file": "test.log",
-                        "station_code": "EGLC",
-                        "message": "Processing EGLC",
-                    },
-                    {
-                        "timestamp": "2025-11-13T12:01:00",
-                        "log_file": "test.log",
-                        "station_code": "KLGA",
-                        "message": "Processing KLGA",
-                    },
-                ]
-                
-                result = service.get_activity_logs(station_code="EGLC")
-                
-                assert result["count"] == 1
-                assert result["logs"][0]["station_code"] == "EGLC"
-    
-    def test_get_activity_logs_filter_by_event_day_today(self):
+        result = service.get_activity_logs(station_code="eglc")
+        
+        assert result["count"] == 1
+        assert result["total"] == 1
+        assert result["logs"][0]["station_code"] == "EGLC"
+    
+    def test_get_activity_logs_filter_by_event_day_today(self, tmp_path):
         """Test filtering logs by event day (today)."""
         service = LogService()
+        service.logs_dir = tmp_path
         
         today = date.today().isoformat()
+        (tmp_path / "test.log").write_text(
+            f"[2025-11-13 12:00:00] INFO     Today's event {today}\n"
+            "[2025-11-13 12:01:00] INFO     Yesterday's event 2025-11-12\n"
+        )
         
-        with patch.object(service, "get_log_files") as mock_files:
-            mock_file = MagicMock()
-            mock_file.name = "test.log"
-            mock_file.exists.return_value = True
-            mock_files.return_value = [mock_file]
-            
-            with patch.object(service, "read_log_file") as mock_read:
-                mock_read.return_value = [
-                    {
-                        "timestamp": "2025-11-13T12:00:00",
-                        "log_file": "test.log",
-                        "event_day": today,
-                        "message": "Today's event",
-                    },
-                    {
-                        "timestamp": "2025-11-13T12:01:00",
-                        "log_file": "test.log",
-                        "event_day": "2025-11-12",
-                        "message": "Yesterday's event",
-                    },
-                ]
-                
-                result = service.get_activity_logs(event_day="today")
-                
-                assert result["count"] >= 0  # May be 0 if today has no logs
-                # All returned logs should be for today
-                for log in result["logs"]:
-                    if log.get("event_day"):
-                        assert log["event_day"] == today
-    
-    def test_get_activity_logs_pagination(self):
+        result = service.get_activity_logs(event_day="today")
+        
+        assert result["count"] == 1
+        assert result["logs"][0]["event_day"] == today
+    
+    def test_get_activity_logs_combined_filters(self, tmp_path):
+        """Test several exact-match filters together across files."""
+        service = LogService()
+        service.logs_dir = tmp_path
+        (tmp_path / "a.log").write_text(
+            "[2025-11-13 12:00:00] ERROR    Fetch failed for EGLC\n"
+            "[2025-11-13 12:01:00] INFO     Fetching forecast for EGLC\n"
+            "[2025-11-13 12:02:00] ERROR    Fetch failed for KLGA\n"
+        )
+        (tmp_path / "b.log").write_text(
+            "[2025-11-13 12:03:00] ERROR    Fetching forecast for EGLC\n"
+            "[2025-11-13 12:04:00] ERROR    Trade error for EGLC\n"
+        )
+        
+        result = service.get_activity_logs(
+            station_code="EGLC",
+            action_type="fetch",
+            log_level="ERROR",
+            event_day="2025-11-13",
+            human_readable=False,
+        )
+        
+        assert [e["timestamp"] for e in result["logs"]] == [
+            "2025-11-13T12:03:00",
+            "2025-11-13T12:00:00",
+        ]
+        assert result["total"] == 2
+    
+    def test_get_activity_logs_pagination(self, tmp_path):
         """Test pagination in activity logs."""
         service = LogService()
+        service.logs_dir = tmp_path
+        # Create 10 log entries
+        (tmp_path / "test.log").write_text("".join(
+            f"[2025-11-13 12:{i:02d}:00] INFO     Log entry {i}\n"
+            for i in range(10)
+        ))
+        
+        # Get first page
+        result1 = service.get_activity_logs(limit=5, offset=0)
+        assert result1["count"] == 5
+        assert result1["total"] == 10
+        assert result1["has_more"] is True
+        
+        # Get second page
+        result2 = service.get_activity_logs(limit=5, offset=5)
+        assert result2["count"] == 5
+        assert result2["total"] == 10
+        assert result2["has_more"] is False
+        
+        # Past the end
+        result3 = service.get_activity_logs(limit=5, offset=20)
+        assert result3["count"] == 0
+        assert result3["total"] == 10
+    
+    def test_get_activity_logs_merges_files_newest_first(self, tmp_path):
+        """Test entries from several log files are interleaved by timestamp."""
+        service = LogService()
+        service.logs_dir = tmp_path
+        (tmp_path / "dynamic_paper_20251113_120000.log").write_text(
+            "[2025-11-13 12:00:00] INFO     Fetching forecast for EGLC\n"
+            "[2025-11-13 12:02:00] INFO     Fetching forecast for KLGA\n"
+        )
+        (tmp_path / "dynamic_paper_20251113_120100.log").write_text(
+            "[2025-11-13 12:01:00] INFO     Placed trade for EGLC\n"
+            "[2025-11-13 12:03:00] INFO     Placed trade for KLGA\n"
+        )
+        
+        result = service.get_activity_logs(human_readable=False)
+        
+        assert [e["timestamp"] for e in result["logs"]] == [
+            "2025-11-13T12:03:00",
+            "2025-11-13T12:02:00",
+            "2025-11-13T12:01:00",
+            "2025-11-13T12:00:00",
+        ]
+    
+    def test_get_activity_logs_parses_files_in_parallel(self, tmp_path):
+        """Test uncached files parsed in worker processes match a serial parse."""
+        for minute in range(3):
+            (tmp_path / f"dynamic_paper_20251113_12{minute:02d}00.log").write_text(
+                f"[2025-11-13 12:{minute:02d}:00] INFO     Fetching forecast for EGLC\n"
+                f"[2025-11-13 12:{minute:02d}:30] INFO     Placed trade for KLGA\n"
+                "                    [58-59°F): $300.00 @ edge=26.16%\n"
+            )
+        serial = LogService()
+        serial.logs_dir = tmp_path
+        service = LogService()
+        service.logs_dir = tmp_path
+        service.PARALLEL_PARSE_MIN_BYTES = 0
+        
+        try:
+            service._parse_uncached_in_parallel(service.get_log_files())
+            assert len(service._parse_cache) == 3
+            
+            with patch.object(service, "_parse_log_file", side_effect=AssertionError("parsed serially")):
+                result = service.get_activity_logs()
+        finally:
+            service.close()
+        
+        assert service._executor is None
+        assert result == serial.get_activity_logs()
+        assert result["total"] == 6
+    
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available")
+    def test_prefetch_uncached_hints_cold_files(self, tmp_path):
+        """Test read-ahead is requested for every log file not parsed yet."""
+        service = LogService()
+        log_files = []
+        for minute in range(3):
+            log_file = tmp_path / f"dynamic_paper_20251113_12{minute:02d}00.log"
+            log_file.write_text(f"[2025-11-13 12:{minute:02d}:00] INFO     Fetching forecast\n")
+            log_files.append(log_file)
+        service.read_log_file(log_files[0])
         
-        with patch.object(service, "get_log_files") as mock_files:
-            mock_file = MagicMock()
-            mock_file.name = "test.log"
-            mock_file.exists.return_value = True
-            mock_files.return_value = [mock_file]
+        with patch("api.services.log_service.os.posix_fadvise") as fadvise:
+            service._prefetch_uncached(log_files)
+            assert fadvise.call_count == 2
             
-            with patch.object(service, "read_log_file") as mock_read:
-                # Create 10 mock log entries
-                mock_read.return_value = [
-                    {
-                        "timestamp": f"2025-11-13T12:{i:02d}:00",
-                        "log_file": "test.log",
-                        "message": f"Log entry {i}",
-                    }
-                    for i in range(10)
-                ]
-                
-                # Get first page
-                result1 = service.get_activity_logs(limit=5, offset=0)
-                assert result1["count"] == 5
-                assert result1["total"] == 10
-                assert result1["has_more"] is True
-                
-                # Get second page
-                result2 = service.get_activity_logs(limit=5, offset=5)
-                assert result2["count"] == 5
-                assert result2["total"] == 10
-                assert result2["has_more"] is False
-    
-    def test_get_available_dates(self):
+            fadvise.reset_mock()
+            service._prefetch_uncached(log_files[:2])
+            fadvise.assert_not_called()
+    
+    def test_get_available_dates(self, tmp_path):
         """Test getting available dates."""
         service = LogService()
+        service.logs_dir = tmp_path
+        (tmp_path / "dynamic_paper_20251112_125727.log").write_text(
+            "[2025-11-13T12:00:00] INFO     Fetching forecast for EGLC\n"
+            "[2025-11-13 12:01:00] INFO     London → 2025-11-14\n"
+            "[2025-11-13 12:02:00] INFO     Skipping 2025-13-45\n"
+        )
+        
+        with patch.object(service, "read_log_file", side_effect=AssertionError("parsed")):
+            dates = service.get_available_dates()
+        
+        assert dates == ["2025-11-14", "2025-11-13", "2025-11-12"]
+    
+    def test_get_available_dates_scans_only_appended_lines(self, tmp_path):
+        """Test date scans are cached and resume after appended lines."""
+        service = LogService()
+        service.logs_dir = tmp_path
+        log_file = tmp_path / "dynamic_paper_20251112_125727.log"
+        log_file.write_text("[2025-11-13 12:00:00] INFO     London → 2025-11-14\n")
+        assert service.get_available_dates() == ["2025-11-14", "2025-11-13", "2025-11-12"]
+        
+        with patch("api.services.log_service.mmap.mmap", side_effect=AssertionError("re-scanned")):
+            assert service.get_available_dates() == ["2025-11-14", "2025-11-13", "2025-11-12"]
+        
+        size = log_file.stat().st_size
+        with open(log_file, "a") as f:
+            f.write("[2025-11-15 09:00:00] INFO     Fetching forecast\n")
+        with patch("api.services.log_service._DATE_BYTES_RE", wraps=_DATE_BYTES_RE) as date_re:
+            assert service.get_available_dates()[0] == "2025-11-15"
+        assert date_re.findall.call_args.args[1] == size - 10
+        
+        # Rewritten: scanned again from the start
+        log_file.write_text("[2025-11-16 09:00:00] INFO     Fetching forecast for KLGA\n")
+        assert service.get_available_dates() == ["2025-11-16", "2025-11-12"]
+    
+    def test_get_log_files_cached_until_directory_changes(self, tmp_path):
+        """Test the log directory is only listed again after files are added."""
+        service = LogService()
+        service.logs_dir = tmp_path
+        first = tmp_path / "dynamic_paper_20251113_120000.log"
+        first.write_text("[2025-11-13 12:00:00] INFO     Fetching forecast for EGLC\n")
+        
+        assert service.get_log_files() == [first]
+        
+        with patch("api.services.log_service.os.scandir", side_effect=AssertionError("listed again")):
+            assert service.get_log_files() == [first]
+        
+        second = tmp_path / "dynamic_paper_20251113_130000.log"
+        second.write_text("[2025-11-13 13:00:00] INFO     Fetching forecast for KLGA\n")
+        os.utime(first, ns=(0, 0))
+        assert service.get_log_files() == [second, first]
+    
+    def test_read_log_file_cached_until_modified(self, tmp_path):
+        """Test unchanged log files are not re-parsed."""
+        service = LogService()
+        log_file = tmp_path / "dynamic_paper_20251113_120000.log"
+        log_file.write_text("[2025-11-13 12:00:00] INFO     Fetching Zeus forecast for EGLC\n")
+        
+        first = service.read_log_file(log_file)
+        assert len(first) == 1
+        
+        with patch.object(service, "_parse_log_file", side_effect=AssertionError("re-parsed")):
+            assert service.read_log_file(log_file) == first
+        
+        with open(log_file, "a") as f:
+            f.write("[2025-11-13 12:01:00] INFO     Placed trade for KLGA\n")
+        
+        entries = service.read_log_file(log_file)
+        assert [e.station_code for e in entries] == ["KLGA", "EGLC"]
+    
+    def test_read_log_file_limit_reads_tail(self, tmp_path):
+        """Test a limited read of an uncached file parses only its end."""
+        service = LogService()
+        service.TAIL_READ_BYTES = 128
+        log_file = tmp_path / "dynamic_paper_20251113_120000.log"
+        with open(log_file, "w") as f:
+            for minute in range(60):
+                f.write(f"[2025-11-13 12:{minute:02d}:00] INFO     Fetching forecast for EGLC\n")
+                f.write("                    with a continuation line\n")
+        
+        fed = []
+        feed_log_lines = service._feed_log_lines
+        
+        def record_lines(state, lines, log_file):
+            lines = list(lines)
+            fed.append(lines)
+            return feed_log_lines(state, lines, log_file)
+        
+        with patch.object(service, "_feed_log_lines", side_effect=record_lines):
+            entries = service.read_log_file(log_file, limit=3)
+        
+        assert entries == LogService().read_log_file(log_file)[:3]
+        assert entries[0].message == "Fetching forecast for EGLC with a continuation line"
+        assert len(fed[-1]) < 120
+        assert str(log_file) not in service._parse_cache
+    
+    def test_parse_cache_evicts_least_recently_used_and_deleted(self, tmp_path):
+        """Test cache hits refresh an entry and deleted files are dropped."""
+        service = LogService()
+        service.logs_dir = tmp_path
+        service.PARSE_CACHE_SIZE = 2
+        log_files = []
+        for minute in range(3):
+            log_file = tmp_path / f"dynamic_paper_20251113_12{minute:02d}00.log"
+            log_file.write_text(f"[2025-11-13 12:{minute:02d}:00] INFO     Fetching forecast\n")
+            log_files.append(log_file)
+        
+        service.read_log_file(log_files[0])
+        service.read_log_file(log_files[1])
+        service.read_log_file(log_files[0])
+        service.read_log_file(log_files[2])
+        assert set(service._parse_cache) == {str(log_files[0]), str(log_files[2])}
+        
+        service.get_log_files()
+        log_files[2].unlink()
+        service.get_log_files()
+        assert set(service._parse_cache) == {str(log_files[0])}
+    
+    def test_parse_states_persist_across_instances(self, tmp_path):
+        """Test a new service resumes from parse states saved in the logs dir."""
+        log_file = tmp_path / "dynamic_paper_20251113_120000.log"
+        log_file.write_text(
+            "[2025-11-13 12:00:00] INFO     Fetching forecast for EGLC\n"
+            "[2025-11-13 12:01:00] INFO     📄 Placing 1 paper trades\n"
+            "                    [58-59°F): $300.00 @ edge=26.16%\n"
+        )
+        first = LogService()
+        first.logs_dir = tmp_path
+        entries = first.get_activity_logs(human_readable=False)["logs"]
+        assert first.get_log_files() == [log_file]
         
-        with patch.object(service, "get_log_files") as mock_files:
-            mock_file = MagicMock()
-            mock_file.name = "dynamic_paper_20251113_125727.log"
-            mock_file.exists.return_value = True
-            mock_files.return_value = [mock_file]
+        def read_recording_lines(service, read):
+            fed = []
+            feed_log_lines = service._feed_log_lines
             
-            with patch.object(service, "read_log_file") as mock_read:
-                mock_read.return_value = [
-                    {
-                        "timestamp": "2025-11-13T12:00:00",
-                        "log_file": "test.log",
-                        "event_day": "2025-11-13",
-                        "message": "Test",
-                    },
-                ]
-                
-                dates = service.get_available_dates()
-                
-                assert isinstance(dates, list)
-                assert "2025-11-13" in dates
-
+            def record_lines(state, lines, log_file):
+                lines = list(lines)
+                fed.extend(lines)
+                return feed_log_lines(state, lines, log_file)
+            
+            with patch.object(service, "_feed_log_lines", side_effect=record_lines):
+                return read(), fed
+        
+        second = LogService()
+        second.logs_dir = tmp_path
+        result, fed = read_recording_lines(
+            second, lambda: second.get_activity_logs(human_readable=False)
+        )
+        assert result["logs"] == entries
+        assert fed == []
+        
+        with open(log_file, "a") as f:
+            f.write("[2025-11-13 12:02:00] INFO     Cycle complete for KLGA\n")
+        third = LogService()
+        third.logs_dir = tmp_path
+        entries, fed = read_recording_lines(third, lambda: third.read_log_file(log_file))
+        assert fed == [b"[2025-11-13 12:02:00] INFO     Cycle complete for KLGA\n"]
+        
+        uncached = LogService()
+        uncached.INDEX_DB_NAME = None
+        assert entries == uncached.read_log_file(log_file)
+        
+        log_file.unlink()
+        third.get_log_files()
+        assert third._get_index_db().execute("SELECT COUNT(*) FROM entries").fetchone() == (0,)
+    
+    def test_parse_states_from_other_parser_version_dropped(self, tmp_path):
+        """Test parse states saved by a different parser version aren't restored."""
+        log_file = tmp_path / "dynamic_paper_20251113_120000.log"
+        log_file.write_text("[2025-11-13 12:00:00] INFO     Fetching forecast for EGLC\n")
+        first = LogService()
+        first.logs_dir = tmp_path
+        entries = first.read_log_file(log_file)
+        first.close()
+        
+        same = LogService()
+        same.logs_dir = tmp_path
+        same._restore_parse_states([log_file])
+        assert str(log_file) in same._parse_cache
+        same.close()
+        
+        newer = LogService()
+        newer.logs_dir = tmp_path
+        newer.INDEX_PARSER_VERSION = LogService.INDEX_PARSER_VERSION + 1
+        db = newer._get_index_db()
+        assert db.execute("SELECT COUNT(*) FROM files").fetchone() == (0,)
+        assert db.execute("SELECT COUNT(*) FROM entries").fetchone() == (0,)
+        newer._restore_parse_states([log_file])
+        assert newer._parse_cache == {}
+        assert newer.read_log_file(log_file) == entries
+    
+    def test_read_log_file_parses_only_appended_lines(self, tmp_path):
+        """Test a grown log file is parsed from where the last read stopped."""
+        service = LogService()
+        log_file = tmp_path / "dynamic_paper_20251113_120000.log"
+        log_file.write_text(
+            "[2025-11-13 12:00:00] INFO     📄 Placing 1 paper trades\n"
+            "                    [58-59°F): $300.00 @ edge=26.16%\n"
+            "[2025-11-13 12:01:00] INFO     Fetching"
+        )
+        service.read_log_file(log_file)
+        offset = service._parse_cache[str(log_file)]["offset"]
+        
+        with open(log_file, "a") as f:
+            f.write(" Zeus forecast\n                    for EGLC\n")
+        
+        fed = []
+        feed_log_lines = service._feed_log_lines
+        
+        def record_lines(state, lines, log_file):
+            lines = list(lines)
+            fed.append(lines)
+            return feed_log_lines(state, lines, log_file)
+        
+        with patch.object(service, "_feed_log_lines", side_effect=record_lines):
+            entries = service.read_log_file(log_file)
+        assert fed[0][0].startswith(b"[2025-11-13 12:01:00]")
+        assert service._parse_cache[str(log_file)]["offset"] > offset
+        
+        assert entries == LogService().read_log_file(log_file)
+        assert entries[0].message == "Fetching Zeus forecast for EGLC"
+        assert entries[1].message == "📄 Placing 1 paper trades [58-59°F): $300.00 @ edge=26.16%"
+        
+        # Rewritten in place: parsed again from the start
+        log_file.write_text("[2025-11-13 13:00:00] INFO     Cycle complete for KLGA, nothing to trade\n")
+        entries = service.read_log_file(log_file)
+        assert [e.station_code for e in entries] == ["KLGA"]
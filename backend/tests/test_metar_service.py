@@ -0,0 +1,198 @@
+"""Tests for METAR service."""
+
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from api.services.metar_service import (
+    MetarService,
+    ObservationSummary,
+    _build_bracket_index,
+    _find_bracket,
+    _max_temp_f,
+    _observation_epoch,
+)
+from core.feature_toggles import FeatureToggles
+from core.station_calibration import StationCalibration
+
+
+EVENT_DAY = date(2025, 11, 13)
+
+
+def write_observation(snapshots_dir, name, observation_time_utc, temp_f):
+    """Write one METAR observation snapshot."""
+    day_dir = snapshots_dir / "metar" / "EGLC" / EVENT_DAY.isoformat()
+    day_dir.mkdir(parents=True, exist_ok=True)
+    (day_dir / name).write_text(json.dumps({
+        "station_code": "EGLC",
+        "observation_time_utc": observation_time_utc,
+        "temp_F": temp_f,
+    }))
+
+
+@pytest.fixture
+def metar_service(tmp_path):
+    """Create METAR service reading snapshots from a temporary directory."""
+    service = MetarService()
+    service.snapshot_service.snapshots_dir = tmp_path
+    service.snapshot_service.SNAPSHOT_SETTLE_NS = 0
+    write_observation(tmp_path, "1200.json", "2025-11-13T12:00:00+00:00", 58.2)
+    write_observation(tmp_path, "1300.json", "2025-11-13T13:00:00+00:00", 59.1)
+    # Late observation of the previous day must not count
+    write_observation(tmp_path, "2350.json", "2025-11-12T23:50:00+00:00", 61.0)
+    return service
+
+
+class TestDailyHighCache:
+    """Test caching of daily highs."""
+    
+    def test_daily_high(self, metar_service):
+        """Daily high only uses observations of the event day."""
+        assert metar_service.get_daily_high("EGLC", EVENT_DAY) == 59.1
+    
+    def test_observation_summary(self, metar_service):
+        """One scan gives the daily high and counts every loaded observation."""
+        summary = metar_service._scan_observations("EGLC", EVENT_DAY)
+        assert summary == ObservationSummary(high=59.1, count=3)
+    
+    def test_cached_until_snapshot_added(self, metar_service, tmp_path):
+        """A cached high is reused until a new observation is saved."""
+        assert metar_service.get_daily_high("EGLC", EVENT_DAY) == 59.1
+        
+        with patch.object(metar_service, "_scan_observations", side_effect=AssertionError("re-read")):
+            assert metar_service.get_daily_high("EGLC", EVENT_DAY) == 59.1
+        
+        write_observation(tmp_path, "1400.json", "2025-11-13T14:00:00+00:00", 60.4)
+        assert metar_service.get_daily_high("EGLC", EVENT_DAY) == 60.4
+    
+    def test_open_day_expires(self, metar_service):
+        """Highs of days that are still open expire after the TTL."""
+        with patch("api.services.metar_service.datetime") as mock_datetime:
+            mock_datetime.now.return_value.date.return_value = EVENT_DAY
+            metar_service.get_daily_high("EGLC", EVENT_DAY)
+        
+        expires_at, _, _ = metar_service._daily_high_cache[("EGLC", EVENT_DAY.isoformat())]
+        assert expires_at is not None
+        
+        with patch("api.services.metar_service.time.monotonic", return_value=expires_at):
+            with patch.object(metar_service, "_scan_observations", wraps=metar_service._scan_observations) as mock_scan:
+                metar_service.get_daily_high("EGLC", EVENT_DAY)
+                mock_scan.assert_called_once()
+    
+    def test_cache_size_bounded(self, metar_service):
+        """The least recently used highs are evicted beyond the size limit."""
+        metar_service.DAILY_HIGH_CACHE_SIZE = 2
+        for day in (date(2025, 11, 11), date(2025, 11, 12), EVENT_DAY):
+            metar_service._store_daily_high(
+                ("EGLC", day.isoformat()), day, (), ObservationSummary(high=50.0, count=1)
+            )
+        
+        assert list(metar_service._daily_high_cache) == [
+            ("EGLC", "2025-11-12"),
+            ("EGLC", "2025-11-13"),
+        ]
+
+
+class TestCompareZeusVsMetar:
+    """Test Zeus vs METAR comparison."""
+    
+    def test_metar_snapshots_loaded_once(self, metar_service, tmp_path):
+        """The observation count comes from the same scan as the daily high."""
+        zeus_dir = tmp_path / "zeus" / "EGLC" / EVENT_DAY.isoformat()
+        zeus_dir.mkdir(parents=True)
+        (zeus_dir / "1200.json").write_text(json.dumps({
+            "timeseries": [{"time_utc": "2025-11-13T14:00:00Z", "temp_F": 58.6}],
+        }))
+        
+        snapshot_service = metar_service.snapshot_service
+        with patch.object(
+            snapshot_service, "get_metar_snapshots", wraps=snapshot_service.get_metar_snapshots
+        ) as mock_get:
+            comparison = metar_service.compare_zeus_vs_metar("EGLC", EVENT_DAY)
+            mock_get.assert_called_once()
+        
+        assert comparison["metar_actual_f"] == 59.1
+        assert comparison["metar_observation_count"] == 3
+    
+    def test_calibrated_zeus_high(self, metar_service, tmp_path):
+        """Calibration is applied to the Zeus points, skipping unparseable times."""
+        zeus_dir = tmp_path / "zeus" / "EGLC" / EVENT_DAY.isoformat()
+        zeus_dir.mkdir(parents=True)
+        (zeus_dir / "1200.json").write_text(json.dumps({
+            "timeseries": [
+                {"time_utc": "2025-11-13T14:00:00Z", "temp_F": 58.6},
+                {"time_utc": "2025-11-13T15:00:00", "temp_F": 57.2},
+                {"time_utc": "not a time", "temp_F": 70.0},
+            ],
+        }))
+        calibration_dir = tmp_path / "calibration"
+        calibration_dir.mkdir()
+        (calibration_dir / "station_calibration_EGLC.json").write_text(json.dumps({
+            "station": "EGLC",
+            "bias_model": {"bias_matrix_smoothed": [[1.0] * 24 for _ in range(12)]},
+            "elevation": {"elevation_offset_c": 0.0},
+        }))
+        
+        with patch(
+            "api.services.snapshot_service.get_feature_toggles",
+            return_value=FeatureToggles(station_calibration=False),
+        ), patch(
+            "api.services.metar_service.get_station_calibration",
+            return_value=StationCalibration(calibration_dir=calibration_dir),
+        ):
+            comparison = metar_service.compare_zeus_vs_metar(
+                "EGLC", EVENT_DAY, feature_toggles=FeatureToggles(station_calibration=True)
+            )
+        
+        # +1 °C bias on the 58.6 °F peak
+        assert comparison["zeus_prediction_f"] == 60.4
+
+
+class TestFindBracket:
+    """Test bracket lookup."""
+    
+    def test_find_bracket(self):
+        """Values map to the [lower, upper) bracket containing them."""
+        index = _build_bracket_index([
+            {"bracket": "60-61°F", "lower_f": 60, "upper_f": 62},
+            {"bracket": "58-59°F", "lower_f": 58, "upper_f": 60},
+            {"bracket": "<58°F", "lower_f": None, "upper_f": 58},
+        ])
+        
+        assert _find_bracket(index, 58.0) == "58-59°F"
+        assert _find_bracket(index, 59.9) == "58-59°F"
+        assert _find_bracket(index, 60.0) == "60-61°F"
+        assert _find_bracket(index, 57.9) is None
+        assert _find_bracket(index, 62.0) is None
+
+
+class TestMaxTempF:
+    """Test Zeus daily high extraction."""
+    
+    def test_max_temp_f(self):
+        """Points without temp_F are skipped."""
+        assert _max_temp_f([{"temp_F": 58.6}, {"temp_K": 290.0}, {"temp_F": 59.2}]) == 59.2
+        assert _max_temp_f([{"temp_K": 290.0}]) is None
+
+
+class TestObservationEpoch:
+    """Test observation times as epoch seconds."""
+    
+    def test_stored_epoch_used(self):
+        """Snapshots with observation_time_epoch aren't parsed."""
+        obs = {"observation_time_utc": "2025-11-13T12:00:00Z", "observation_time_epoch": 1763035200}
+        with patch("api.services.metar_service.parse_timestamp", side_effect=AssertionError("parsed")):
+            assert _observation_epoch(obs) == 1763035200
+    
+    def test_old_snapshot_parsed_once(self):
+        """The epoch of older snapshots is parsed once, without changing the snapshot."""
+        obs = {"observation_time_utc": "2025-11-13T12:00:00Z"}
+        assert _observation_epoch(obs) == 1763035200
+        assert obs == {"observation_time_utc": "2025-11-13T12:00:00Z"}
+        
+        with patch("api.services.metar_service.parse_timestamp", side_effect=AssertionError("parsed")):
+            assert _observation_epoch(obs) == 1763035200
+        
+        assert _observation_epoch({"observation_time_utc": "invalid"}) is None
@@ -1,5 +1,7 @@
 """Tests for API routes."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
@@ -186,3 +188,32 @@ class TestEdgeEndpoints:
             assert "total_edges" in data
             assert data["total_edges"] == 5
 
+
+
+class TestFeatureEndpoints:
+    """Test feature toggle endpoints."""
+    
+    def test_calibrations_endpoint_follows_files(self, tmp_path, monkeypatch):
+        """Test calibration status reports model files added after startup."""
+        monkeypatch.setattr("core.station_calibration.PROJECT_ROOT", tmp_path)
+        monkeypatch.setattr("core.station_calibration._calibration", None)
+        monkeypatch.setattr("core.feature_toggles.PROJECT_ROOT", tmp_path)
+        calibration_dir = tmp_path / "data" / "calibration"
+        calibration_dir.mkdir(parents=True)
+        
+        response = client.get("/api/features/calibrations")
+        assert response.status_code == 200
+        assert response.json()["stations_with_calibration"] == []
+        
+        model = {
+            "station": "EGLC",
+            "bias_model": {"bias_matrix_smoothed": [[0.0] * 24 for _ in range(12)]},
+            "elevation": {"elevation_offset_c": 0.0},
+        }
+        (calibration_dir / "station_calibration_EGLC.json").write_text(json.dumps(model))
+        
+        response = client.get("/api/features/calibrations")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["stations_with_calibration"] == ["EGLC"]
+        assert data["total_calibrations"] == 1
@@ -0,0 +1,91 @@
+"""Tests for snapshot service."""
+
+import json
+import os
+from datetime import date
+from unittest.mock import Mock, patch
+
+import pytest
+
+from api.services.snapshot_service import SnapshotService
+
+
+EVENT_DAY = date(2025, 11, 13)
+
+
+def write_decision(snapshots_dir, name, bracket):
+    """Write one decision snapshot."""
+    day_dir = snapshots_dir / "decisions" / "EGLC" / EVENT_DAY.isoformat()
+    day_dir.mkdir(parents=True, exist_ok=True)
+    (day_dir / name).write_text(json.dumps({"decisions": [{"bracket": bracket}]}))
+    return day_dir
+
+
+@pytest.fixture
+def snapshot_service(tmp_path):
+    """Create snapshot service reading from a temporary directory."""
+    service = SnapshotService()
+    service.snapshots_dir = tmp_path
+    service.SNAPSHOT_SETTLE_NS = 0
+    write_decision(tmp_path, "1200.json", "58-59°F")
+    return service
+
+
+class TestSnapshotCache:
+    """Test caching of snapshot listings."""
+    
+    def test_cached_until_snapshot_added(self, snapshot_service, tmp_path):
+        """Snapshots are reused until a new file is saved."""
+        first = snapshot_service.get_decision_snapshots("EGLC", EVENT_DAY)
+        assert [s["_filename"] for s in first] == ["1200.json"]
+        
+        with patch("api.services.snapshot_service.read_json_file_cached", side_effect=AssertionError("re-read")):
+            assert snapshot_service.get_decision_snapshots("EGLC", EVENT_DAY) == first
+        
+        write_decision(tmp_path, "1300.json", "60-61°F")
+        snapshots = snapshot_service.get_decision_snapshots("EGLC", EVENT_DAY)
+        assert [s["_filename"] for s in snapshots] == ["1300.json", "1200.json"]
+    
+    def test_cached_list_is_a_copy(self, snapshot_service):
+        """Reordering a returned list doesn't change the cached one."""
+        snapshot_service.get_decision_snapshots("EGLC", EVENT_DAY).clear()
+        assert len(snapshot_service.get_decision_snapshots("EGLC", EVENT_DAY)) == 1
+    
+    def test_recently_modified_not_cached(self, snapshot_service, tmp_path):
+        """Directories still being written to aren't cached."""
+        snapshot_service.SNAPSHOT_SETTLE_NS = 60 * 1_000_000_000
+        snapshot_service.get_decision_snapshots("EGLC", EVENT_DAY)
+        assert snapshot_service._snapshot_cache == {}
+        
+        # Once settled, the listing is cached
+        day_dir = write_decision(tmp_path, "1300.json", "60-61°F")
+        os.utime(day_dir, (0, 0))
+        snapshot_service.get_decision_snapshots("EGLC", EVENT_DAY)
+        assert len(snapshot_service._snapshot_cache) == 1
+    
+    def test_missing_directory_until_created(self, snapshot_service, tmp_path):
+        """A missing directory gives no snapshots until it's created."""
+        assert snapshot_service.get_polymarket_snapshots("London", EVENT_DAY) == []
+        
+        day_dir = tmp_path / "polymarket" / "London" / EVENT_DAY.isoformat()
+        day_dir.mkdir(parents=True)
+        (day_dir / "1200.json").write_text(json.dumps({"markets": []}))
+        snapshots = snapshot_service.get_polymarket_snapshots("London", EVENT_DAY)
+        assert [s["_filename"] for s in snapshots] == ["1200.json"]
+
+
+class TestApplyCalibration:
+    """Test calibration of Zeus snapshots."""
+    
+    def test_points_not_modified(self, snapshot_service):
+        """Calibrated points are copies; the parsed points are unchanged."""
+        points = [{"time_utc": "2025-11-13T12:00:00Z", "temp_K": 288.15}]
+        snapshot = {"timeseries": points}
+        calibration = Mock()
+        calibration.apply_batch.side_effect = lambda temps_c, station_code, timestamps: temps_c + 1.0
+        
+        calibrated = snapshot_service._apply_calibration_to_snapshot(snapshot, "EGLC", calibration)
+        
+        assert calibrated["timeseries"][0]["temp_K"] == pytest.approx(289.15)
+        assert calibrated["predicted_high_F"] == calibrated["timeseries"][0]["temp_F"]
+        assert points == [{"time_utc": "2025-11-13T12:00:00Z", "temp_K": 288.15}]
@@ -1,5 +1,6 @@
 """Tests for StatusService."""
 
+import os
 import pytest
 from pathlib import Path
 from datetime import datetime
@@ -31,13 +32,27 @@ class TestStatusService:
         
         with patch.object(Path, "exists", return_value=True):
             with patch.object(Path, "read_text", return_value="12345"):
-                with patch("subprocess.run") as mock_run:
-                    mock_run.return_value.returncode = 0
+                with patch("api.services.status_service.os.kill") as mock_kill:
                     assert service.check_trading_engine_running() is True
+                    mock_kill.assert_called_once_with(12345, 0)
                     
-                    mock_run.return_value.returncode = 1
+                    mock_kill.side_effect = PermissionError()
+                    assert service.check_trading_engine_running() is True
+                    
+                    mock_kill.side_effect = ProcessLookupError()
                     assert service.check_trading_engine_running() is False
     
+    def test_check_trading_engine_running_own_process(self, tmp_path):
+        """Test check against a real process ID."""
+        service = StatusService()
+        service.pid_file = tmp_path / "dynamic_paper.pid"
+        
+        service.pid_file.write_text(str(os.getpid()))
+        assert service.check_trading_engine_running() is True
+        
+        service.pid_file.write_text("0")
+        assert service.check_trading_engine_running() is False
+    
     def test_get_trading_engine_status_not_running(self):
         """Test status when engine is not running."""
         service = StatusService()
@@ -93,3 +108,65 @@ class TestStatusService:
                     assert "data_collection" in status
                     assert status["trading_engine"]["running"] is True
 
+    
+    def test_count_recent_snapshots(self, tmp_path):
+        """Test only snapshot files modified in the window are counted."""
+        service = StatusService()
+        day_dir = tmp_path / "zeus" / "EGLC" / "2025-11-13"
+        day_dir.mkdir(parents=True)
+        (day_dir / "recent.json").write_text("{}")
+        (day_dir / "notes.txt").write_text("")
+        old_file = day_dir / "old.json"
+        old_file.write_text("{}")
+        os.utime(old_file, (1000000000, 1000000000))
+        
+        since = datetime.now().timestamp() - 86400
+        assert service._count_recent_snapshots(str(tmp_path), since) == 1
+        assert service._count_recent_snapshots(str(tmp_path / "missing"), since) == 0
+    
+    def test_last_cycle_time_cached(self, tmp_path):
+        """Test decisions are only walked again after the TTL."""
+        service = StatusService()
+        day_dir = tmp_path / "data" / "snapshots" / "dynamic" / "decisions" / "EGLC" / "2025-11-13"
+        day_dir.mkdir(parents=True)
+        (day_dir / "2025-11-13_12-00-00.json").write_text("{}")
+        
+        with patch("api.services.status_service.PROJECT_ROOT", tmp_path):
+            assert service._get_last_cycle_time() == datetime(2025, 11, 13, 12)
+            
+            (day_dir / "2025-11-13_12-15-00.json").write_text("{}")
+            assert service._get_last_cycle_time() == datetime(2025, 11, 13, 12)
+            
+            _, _, expires_at = service._last_cycle_cache
+            with patch("api.services.status_service.time.monotonic", return_value=expires_at):
+                assert service._get_last_cycle_time() == datetime(2025, 11, 13, 12, 15)
+    
+    def test_scan_last_cycle_time_skips_other_files(self, tmp_path):
+        """Test only timestamp named snapshots count towards the last cycle."""
+        service = StatusService()
+        for station, name in [
+            ("EGLC", "2025-11-13_12-00-00.json"),
+            ("KLGA", "2025-11-13_12-15-00.json"),
+            ("KLGA", "zzz.json"),
+            ("KLGA", "2025-11-13_23-59-59.txt"),
+        ]:
+            day_dir = tmp_path / station / "2025-11-13"
+            day_dir.mkdir(parents=True, exist_ok=True)
+            (day_dir / name).write_text("{}")
+        
+        assert service._scan_last_cycle_time(tmp_path) == datetime(2025, 11, 13, 12, 15)
+    
+    def test_count_recent_snapshots_rewritten_in_place(self, tmp_path):
+        """Test files modified in the window count whatever their directory's mtime."""
+        service = StatusService()
+        old_dir = tmp_path / "polymarket" / "midpoint"
+        new_dir = tmp_path / "zeus" / "EGLC" / "2025-11-13"
+        old_dir.mkdir(parents=True)
+        new_dir.mkdir(parents=True)
+        (old_dir / "market1.json").write_text("{}")
+        (new_dir / "recent.json").write_text("{}")
+        for directory in (tmp_path, tmp_path / "polymarket", old_dir):
+            os.utime(directory, (1000000000, 1000000000))
+        
+        since = datetime.now().timestamp() - 86400
+        assert service._count_recent_snapshots(str(tmp_path), since) == 2
@@ -0,0 +1,58 @@
+"""Tests for strategy service."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from api.services.strategy_service import StrategyService
+
+
+@pytest.fixture
+def strategy_service(tmp_path):
+    """Create strategy service with files in a temporary directory."""
+    with patch("api.services.strategy_service.PROJECT_ROOT", tmp_path):
+        return StrategyService()
+
+
+class TestChangelogCache:
+    """Test caching of the parsed changelog."""
+    
+    def test_reused_until_file_changes(self, strategy_service):
+        """The changelog is only parsed again after the file changes."""
+        first = strategy_service._read_json(strategy_service.changelog_file)
+        
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+            assert strategy_service._read_json(strategy_service.changelog_file) is first
+        
+        strategy_service.changelog_file.write_text(json.dumps({"version": "2.0.0", "entries": []}))
+        os.utime(strategy_service.changelog_file, ns=(0, 0))
+        assert strategy_service.get_changelog()["version"] == "2.0.0"
+    
+    def test_entries_order_kept(self, strategy_service):
+        """Reading the changelog sorted doesn't reorder the saved entries."""
+        strategy_service.add_changelog_entry("First", "", "model")
+        strategy_service.add_changelog_entry("Second", "", "configuration")
+        strategy_service.get_changelog()
+        strategy_service.add_changelog_entry("Third", "", "model")
+        
+        saved = json.loads(strategy_service.changelog_file.read_text())
+        assert [e["title"] for e in saved["entries"]] == ["First", "Second", "Third"]
+        assert strategy_service.get_configuration_changelog()["total_entries"] == 1
+
+
+class TestWriteJson:
+    """Test writing strategy JSON files."""
+    
+    def test_write_without_orjson(self, strategy_service):
+        """Without orjson, files are written as json.dumps gives them."""
+        data = {"version": "1.0.0", "entries": [{"title": "Café", "changes": []}]}
+        
+        with patch("api.services.strategy_service.ORJSON_AVAILABLE", False):
+            strategy_service._write_json(strategy_service.docs_file, data)
+        
+        assert strategy_service.docs_file.read_text() == json.dumps(data, indent=2)
+        strategy_service._json_cache.clear()
+        assert strategy_service.get_strategy_documentation() == data
@@ -0,0 +1,73 @@
+"""Tests for trade service."""
+
+import csv
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from api.services.trade_service import TradeService
+
+
+FIELDS = ["timestamp", "station_code", "size_usd", "venue"]
+
+
+def write_trades(trades_dir, dir_name, rows):
+    """Write a paper trades CSV into a date directory."""
+    date_dir = trades_dir / dir_name
+    date_dir.mkdir(parents=True)
+    with open(date_dir / "paper_trades.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def trade_service(tmp_path):
+    """Create trade service reading trades from a temporary directory."""
+    service = TradeService()
+    service.trades_dir = tmp_path
+    write_trades(tmp_path, "2025-11-10", [
+        {"timestamp": "2025-11-10T12:00:00+00:00", "station_code": "EGLC", "size_usd": "10"},
+    ])
+    # Written late in the local day, after midnight UTC
+    write_trades(tmp_path, "2025-11-12", [
+        {"timestamp": "2025-11-13T01:00:00+00:00", "station_code": "KLGA", "size_usd": "20", "venue": "kalshi"},
+    ])
+    write_trades(tmp_path, "2025-11-13", [
+        {"timestamp": "2025-11-13T12:00:00+00:00", "station_code": "EGLC", "size_usd": "30"},
+        {"timestamp": "invalid", "station_code": "EGLC", "size_usd": "40"},
+    ])
+    return service
+
+
+class TestGetTrades:
+    """Test trade filters."""
+    
+    def test_date_range_uses_trade_timestamps(self, trade_service):
+        """Trades are selected by timestamp, not by directory name."""
+        trades = trade_service.get_trades(start_date=date(2025, 11, 13))
+        assert [t.size_usd for t in trades] == [30.0, 20.0]
+        
+        trades = trade_service.get_trades(end_date=date(2025, 11, 12))
+        assert [t.size_usd for t in trades] == [10.0]
+    
+    def test_venue_filter(self, trade_service):
+        """Trades without a venue count as Polymarket trades."""
+        assert [t.size_usd for t in trade_service.get_trades(venue="kalshi")] == [20.0]
+        assert len(trade_service.get_trades(venue="polymarket")) == 3
+    
+    def test_trades_reused_until_file_changes(self, trade_service, tmp_path):
+        """Trades of a CSV file are only built again after it changes."""
+        first = trade_service.get_trades(trade_date=date(2025, 11, 13))
+        assert sorted(t.size_usd for t in first) == [30.0, 40.0]
+        
+        with patch("api.services.trade_service.read_csv_file", side_effect=AssertionError("re-read")):
+            assert trade_service.get_trades(trade_date=date(2025, 11, 13)) == first
+        
+        with open(tmp_path / "2025-11-13" / "paper_trades.csv", "a", newline="") as f:
+            csv.DictWriter(f, fieldnames=FIELDS).writerow(
+                {"timestamp": "2025-11-13T13:00:00+00:00", "station_code": "EGLC", "size_usd": "50"}
+            )
+        trades = trade_service.get_trades(trade_date=date(2025, 11, 13))
+        assert sorted(t.size_usd for t in trades) == [30.0, 40.0, 50.0]
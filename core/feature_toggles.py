@@ -4,7 +4,7 @@ Allows toggling features on/off, such as station calibration.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 import json
 from pathlib import Path
 
@@ -90,3 +90,38 @@ class FeatureToggles:
         )
 
 
+# Global feature toggles, with the (path, mtime_ns, size) they were loaded at
+_toggles_cache: Optional[Tuple[tuple, FeatureToggles]] = None
+
+
+def get_feature_toggles(config_path: Optional[Path] = None) -> FeatureToggles:
+    """Get the feature toggles, reloading them only when the file changes.
+    
+    The instance is shared between callers and must not be modified; use
+    FeatureToggles.load() to update and save the toggles.
+    
+    Args:
+        config_path: Optional path to feature_toggles.json
+                    (defaults to data/config/feature_toggles.json)
+    
+    Returns:
+        FeatureToggles instance
+    """
+    global _toggles_cache
+    if config_path is None:
+        config_path = PROJECT_ROOT / "data" / "config" / "feature_toggles.json"
+    
+    try:
+        stat = config_path.stat()
+        signature = (config_path, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    
+    if signature is not None and _toggles_cache is not None and _toggles_cache[0] == signature:
+        return _toggles_cache[1]
+    
+    # A missing file is created by load(), and cached on the next call
+    toggles = FeatureToggles.load(config_path)
+    if signature is not None:
+        _toggles_cache = (signature, toggles)
+    return toggles
@@ -4,11 +4,12 @@ Coordinates the pipeline: pull → infer → decide → execute → log
 """
 
 import argparse
+import json
 import os
 from datetime import date, datetime
 from pathlib import Path
 
-from .config import config
+from .config import Config, config
 from .logger import logger
 
 
@@ -48,6 +49,11 @@ def main() -> None:
         type=str,
         help="End date for backtest mode (YYYY-MM-DD)",
     )
+    parser.add_argument(
+        "--config-file",
+        type=str,
+        help="Engine config JSON for dynamic-paper mode (written by the backend API)",
+    )
 
     args = parser.parse_args()
 
@@ -81,7 +87,7 @@ def main() -> None:
         if not args.stations:
             logger.error("--stations required for dynamic-paper mode")
             return
-        run_dynamic_paper(args.stations)
+        run_dynamic_paper(args.stations, config_file=args.config_file)
 
 
 def run_fetch(date_str: str, station: str) -> None:
@@ -444,7 +450,7 @@ def run_backtest(start_str: str, end_str: str, stations: list[str]) -> None:
         logger.error(f"Backtest failed: {e}", exc_info=True)
 
 
-def run_dynamic_paper(stations_str: str) -> None:
+def run_dynamic_paper(stations_str: str, config_file: str | None = None) -> None:
     """Run dynamic paper trading loop.
     
     Continuously evaluates markets and executes paper trades using
@@ -457,11 +463,13 @@ def run_dynamic_paper(stations_str: str) -> None:
     Uses fresh data every cycle to minimize staleness and improve
     edge calculation accuracy.
     
-    Configuration can be provided via environment variables (set by EngineService)
-    or will fall back to global config.
+    Configuration is read from the engine config file when one is given
+    (EngineService passes logs/engine_config.json), otherwise from
+    environment variables, falling back to global config.
     
     Args:
         stations_str: Comma-separated station codes (e.g., "EGLC,KLGA")
+        config_file: Optional path to engine config JSON
     """
     from agents.dynamic_trader.dynamic_engine import DynamicTradingEngine
     
@@ -470,27 +478,33 @@ def run_dynamic_paper(stations_str: str) -> None:
     logger.info(f"🚀 Launching dynamic paper trading")
     logger.info(f"Stations: {', '.join(stations)}")
     
-    # Get config from environment (set by EngineService) or use global config
-    interval_seconds = int(os.getenv("DYNAMIC_INTERVAL_SECONDS", str(config.dynamic_interval_seconds)))
-    lookahead_days = int(os.getenv("DYNAMIC_LOOKAHEAD_DAYS", str(config.dynamic_lookahead_days)))
-    
-    # Get trading config from environment or use global config
-    trading_config = {
-        "edge_min": float(os.getenv("EDGE_MIN", str(config.trading.edge_min))),
-        "fee_bp": int(os.getenv("FEE_BP", str(config.trading.fee_bp))),
-        "slippage_bp": int(os.getenv("SLIPPAGE_BP", str(config.trading.slippage_bp))),
-        "kelly_cap": float(os.getenv("KELLY_CAP", str(config.trading.kelly_cap))),
-        "per_market_cap": float(os.getenv("PER_MARKET_CAP", str(config.trading.per_market_cap))),
-        "liquidity_min_usd": float(os.getenv("LIQUIDITY_MIN_USD", str(config.trading.liquidity_min_usd))),
-        "daily_bankroll_cap": float(os.getenv("DAILY_BANKROLL_CAP", str(config.trading.daily_bankroll_cap))),
-    }
-    
-    # Get probability model config from environment or use global config
-    probability_model_config = {
-        "model_mode": os.getenv("MODEL_MODE", config.model_mode),
-        "zeus_likely_pct": float(os.getenv("ZEUS_LIKELY_PCT", str(config.zeus_likely_pct))),
-        "zeus_possible_pct": float(os.getenv("ZEUS_POSSIBLE_PCT", str(config.zeus_possible_pct))),
-    }
+    if config_file:
+        logger.info(f"Engine config: {config_file}")
+        interval_seconds, lookahead_days, trading_config, probability_model_config = (
+            _load_engine_config(Path(config_file))
+        )
+    else:
+        # Get config from environment or use global config
+        interval_seconds = int(os.getenv("DYNAMIC_INTERVAL_SECONDS", str(config.dynamic_interval_seconds)))
+        lookahead_days = int(os.getenv("DYNAMIC_LOOKAHEAD_DAYS", str(config.dynamic_lookahead_days)))
+        
+        # Get trading config from environment or use global config
+        trading_config = {
+            "edge_min": float(os.getenv("EDGE_MIN", str(config.trading.edge_min))),
+            "fee_bp": int(os.getenv("FEE_BP", str(config.trading.fee_bp))),
+            "slippage_bp": int(os.getenv("SLIPPAGE_BP", str(config.trading.slippage_bp))),
+            "kelly_cap": float(os.getenv("KELLY_CAP", str(config.trading.kelly_cap))),
+            "per_market_cap": float(os.getenv("PER_MARKET_CAP", str(config.trading.per_market_cap))),
+            "liquidity_min_usd": float(os.getenv("LIQUIDITY_MIN_USD", str(config.trading.liquidity_min_usd))),
+            "daily_bankroll_cap": float(os.getenv("DAILY_BANKROLL_CAP", str(config.trading.daily_bankroll_cap))),
+        }
+        
+        # Get probability model config from environment or use global config
+        probability_model_config = {
+            "model_mode": os.getenv("MODEL_MODE", config.model_mode),
+            "zeus_likely_pct": float(os.getenv("ZEUS_LIKELY_PCT", str(config.zeus_likely_pct))),
+            "zeus_possible_pct": float(os.getenv("ZEUS_POSSIBLE_PCT", str(config.zeus_possible_pct))),
+        }
     
     logger.info(f"Interval: {interval_seconds}s ({interval_seconds/60:.0f} minutes)")
     logger.info(f"Lookahead: {lookahead_days} days")
@@ -510,6 +524,84 @@ def run_dynamic_paper(stations_str: str) -> None:
     engine.run()
 
 
+# Engine config keys applied to the global config (and their sections)
+_ENGINE_TRADING_KEYS = (
+    "edge_min",
+    "fee_bp",
+    "slippage_bp",
+    "kelly_cap",
+    "per_market_cap",
+    "liquidity_min_usd",
+    "daily_bankroll_cap",
+)
+_ENGINE_PROBABILITY_KEYS = ("model_mode", "zeus_likely_pct", "zeus_possible_pct")
+
+# Probability models understood by the prob mapper
+_MODEL_MODES = ("spread", "bands")
+
+
+def _load_engine_config(config_path: Path) -> tuple[int, int, dict, dict]:
+    """Load dynamic trading settings from an engine config file.
+    
+    Values missing from the file fall back to global config. The values are
+    validated against the Config model (model_mode is lowercased, as
+    Config.load does for MODEL_MODE) and then applied to the global config
+    so modules that read it directly (e.g. snapshot metadata) see the same
+    settings.
+    
+    Args:
+        config_path: Path to engine config JSON
+        
+    Returns:
+        Tuple of (interval_seconds, lookahead_days, trading_config,
+        probability_model_config)
+        
+    Raises:
+        ValueError: If a value in the file is invalid
+    """
+    with open(config_path, "r") as f:
+        engine_config = json.load(f)
+    
+    trading = engine_config.get("trading") or {}
+    prob = engine_config.get("probability_model") or {}
+    
+    settings = config.model_dump()
+    settings["trading"].update(
+        {key: trading[key] for key in _ENGINE_TRADING_KEYS if key in trading}
+    )
+    settings.update({key: prob[key] for key in _ENGINE_PROBABILITY_KEYS if key in prob})
+    if "interval_seconds" in engine_config:
+        settings["dynamic_interval_seconds"] = engine_config["interval_seconds"]
+    if "lookahead_days" in engine_config:
+        settings["dynamic_lookahead_days"] = engine_config["lookahead_days"]
+    
+    # ValidationError is a ValueError
+    loaded = Config.model_validate(settings)
+    loaded.model_mode = loaded.model_mode.lower()
+    if loaded.model_mode not in _MODEL_MODES:
+        raise ValueError(
+            f"Invalid model_mode {loaded.model_mode!r} in {config_path} "
+            f"(expected one of {', '.join(_MODEL_MODES)})"
+        )
+    
+    trading_config = {key: getattr(loaded.trading, key) for key in _ENGINE_TRADING_KEYS}
+    probability_model_config = {key: getattr(loaded, key) for key in _ENGINE_PROBABILITY_KEYS}
+    
+    for key, value in trading_config.items():
+        setattr(config.trading, key, value)
+    for key, value in probability_model_config.items():
+        setattr(config, key, value)
+    config.dynamic_interval_seconds = loaded.dynamic_interval_seconds
+    config.dynamic_lookahead_days = loaded.dynamic_lookahead_days
+    
+    return (
+        loaded.dynamic_interval_seconds,
+        loaded.dynamic_lookahead_days,
+        trading_config,
+        probability_model_config,
+    )
+
+
 if __name__ == "__main__":
     main()
 
@@ -4,17 +4,41 @@ Loads calibration models from per-station JSON files and applies
 month/hour-specific bias corrections + elevation offsets to Zeus predictions.
 """
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from datetime import datetime
 import json
 from pathlib import Path
 import logging
 
+import numpy as np
+
 from .config import PROJECT_ROOT
 from .logger import logger
 
 logger = logging.getLogger(__name__)
 
+# Calibration model files in the calibration directory
+CALIBRATION_FILE_PATTERN = "station_calibration_*.json"
+
+
+def _calibration_files_signature(calibration_dir: Path) -> Tuple[tuple, ...]:
+    """Get the (name, mtime_ns, size) of each calibration model file.
+    
+    Args:
+        calibration_dir: Calibration directory
+        
+    Returns:
+        Sorted file signatures (empty if the directory doesn't exist)
+    """
+    signature = []
+    for calib_file in calibration_dir.glob(CALIBRATION_FILE_PATTERN):
+        try:
+            stat = calib_file.stat()
+        except OSError:
+            continue
+        signature.append((calib_file.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(signature))
+
 
 class StationCalibration:
     """Load and apply station-specific bias corrections from ERA5 analysis."""
@@ -30,7 +54,13 @@ class StationCalibration:
             calibration_dir = PROJECT_ROOT / "data" / "calibration"
         
         self.calibration_dir = calibration_dir
+        # Model files this instance was loaded from (taken before loading,
+        # so a file changed during the load is picked up next time)
+        self.signature = _calibration_files_signature(calibration_dir)
         self._models: Dict[str, dict] = {}
+        # Flattened month/hour correction tables (index (month - 1) * 24 +
+        # hour), built on first use per station
+        self._correction_tables: Dict[str, np.ndarray] = {}
         self._load_all()
     
     def _load_all(self) -> None:
@@ -43,8 +73,7 @@ class StationCalibration:
             return
         
         # Look for station_calibration_*.json files
-        pattern = "station_calibration_*.json"
-        calibration_files = list(self.calibration_dir.glob(pattern))
+        calibration_files = list(self.calibration_dir.glob(CALIBRATION_FILE_PATTERN))
         
         if not calibration_files:
             logger.warning(
@@ -207,6 +236,56 @@ class StationCalibration:
         
         return corrected_temp_c
     
+    def apply_batch(
+        self,
+        temps_c: np.ndarray,
+        station_code: str,
+        timestamps: list[datetime],
+    ) -> np.ndarray:
+        """Apply calibration to an array of temperature predictions.
+        
+        Gives the same results as calling apply() per element, but takes
+        the corrections from the station's precomputed month/hour table and
+        adds them all in one array operation.
+        
+        Args:
+            temps_c: Temperatures in Celsius (from Zeus/ERA5)
+            station_code: Station code
+            timestamps: Datetimes for month/hour lookup (same length as temps_c)
+            
+        Returns:
+            Corrected temperatures in Celsius
+        """
+        if not self.has_calibration(station_code):
+            return temps_c
+        
+        table = self._correction_table(station_code)
+        slots = [(ts.month - 1) * 24 + ts.hour for ts in timestamps]
+        return temps_c + table[slots]
+    
+    def _correction_table(self, station_code: str) -> np.ndarray:
+        """Get the corrections of every month/hour for a station.
+        
+        Args:
+            station_code: Station code with a calibration model
+            
+        Returns:
+            Array of 12 * 24 corrections in °C, indexed by
+            (month - 1) * 24 + hour
+        """
+        station_code = station_code.upper()
+        table = self._correction_tables.get(station_code)
+        if table is None:
+            table = np.zeros(12 * 24, dtype=np.float64)
+            for month in range(1, 13):
+                for hour in range(24):
+                    # Slots without a correction are left as they are
+                    correction = self.get_correction(station_code, month, hour)
+                    if correction is not None:
+                        table[(month - 1) * 24 + hour] = correction
+            self._correction_tables[station_code] = table
+        return table
+    
     def apply_to_forecast_timeseries(
         self,
         temps_k: list[float],
@@ -281,3 +360,34 @@ class StationCalibration:
         }
 
 
+# Global calibration instance
+_calibration: Optional[StationCalibration] = None
+
+
+def get_station_calibration() -> StationCalibration:
+    """Get global station calibration instance.
+    
+    Calibration models are loaded on first use and reloaded when a model
+    file in data/calibration/ is added, changed or removed.
+    
+    Returns:
+        StationCalibration singleton
+    """
+    global _calibration
+    if _calibration is not None:
+        signature = _calibration_files_signature(_calibration.calibration_dir)
+        if signature == _calibration.signature:
+            return _calibration
+    _calibration = StationCalibration()
+    return _calibration
+
+
+def reload_station_calibration() -> StationCalibration:
+    """Reload the global station calibration models from disk.
+    
+    Returns:
+        New StationCalibration singleton
+    """
+    global _calibration
+    _calibration = StationCalibration()
+    return _calibration
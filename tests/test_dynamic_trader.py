@@ -17,6 +17,7 @@ from agents.zeus_forecast import ZeusForecast
 from agents.dynamic_trader.fetchers import DynamicFetcher
 from agents.dynamic_trader.snapshotter import DynamicSnapshotter
 from agents.dynamic_trader.dynamic_engine import DynamicTradingEngine
+from venues.metar import MetarObservation
 
 
 @pytest.fixture
@@ -265,6 +266,32 @@ def test_snapshotter_save_decisions(tmp_path, mock_station, mock_brackets):
         assert data["decisions"][0]["edge"] == 0.15
 
 
+def test_snapshotter_save_metar(tmp_path, mock_station):
+    """Test METAR snapshots store the observation time as epoch seconds."""
+    with patch("agents.dynamic_trader.snapshotter.PROJECT_ROOT", tmp_path):
+        snapshotter = DynamicSnapshotter()
+        
+        event_day = date(2025, 11, 13)
+        observation = MetarObservation(
+            station_code="EGLC",
+            time=datetime(2025, 11, 13, 12, 20, tzinfo=ZoneInfo("UTC")),
+            temp_C=15.0,
+            temp_F=59.0,
+        )
+        
+        snapshotter._save_metar([observation], mock_station, event_day)
+        
+        snapshot_path = (
+            tmp_path / "data" / "snapshots" / "dynamic" / "metar" /
+            "EGLC" / "2025-11-13" / "2025-11-13_12-20-00.json"
+        )
+        with open(snapshot_path) as f:
+            data = json.load(f)
+        
+        assert data["observation_time_utc"] == "2025-11-13T12:20:00+00:00"
+        assert data["observation_time_epoch"] == 1763036400
+
+
 # DynamicTradingEngine Tests
 
 def test_engine_initialization():
@@ -0,0 +1,22 @@
+"""Tests for feature toggles."""
+
+import os
+from unittest.mock import patch
+
+from core.feature_toggles import FeatureToggles, get_feature_toggles
+
+
+def test_get_feature_toggles_cached(tmp_path) -> None:
+    """Test toggles are only reloaded after the file changes."""
+    config_path = tmp_path / "feature_toggles.json"
+    
+    # A missing file is created with the defaults
+    assert get_feature_toggles(config_path).station_calibration is False
+    toggles = get_feature_toggles(config_path)
+    
+    with patch.object(FeatureToggles, "load", side_effect=AssertionError("reloaded")):
+        assert get_feature_toggles(config_path) is toggles
+    
+    FeatureToggles(station_calibration=True).save(config_path)
+    os.utime(config_path, ns=(0, 0))
+    assert get_feature_toggles(config_path).station_calibration is True
@@ -0,0 +1,106 @@
+"""Tests for the orchestrator engine config loading."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from core.config import Config
+from core.orchestrator import _load_engine_config
+
+
+@pytest.fixture
+def global_config(monkeypatch) -> Config:
+    """Fresh global config (with defaults), replaced for the test only."""
+    config = Config()
+    monkeypatch.setattr("core.orchestrator.config", config)
+    return config
+
+
+def write_engine_config(tmp_path: Path, engine_config: dict) -> Path:
+    """Write an engine config file like EngineService does."""
+    config_path = tmp_path / "engine_config.json"
+    config_path.write_text(json.dumps(engine_config))
+    return config_path
+
+
+def test_load_engine_config_from_file(tmp_path: Path, global_config: Config) -> None:
+    """Test values in the file are returned and applied to global config."""
+    config_path = write_engine_config(tmp_path, {
+        "stations": ["EGLC"],
+        "interval_seconds": 300,
+        "lookahead_days": 1,
+        "trading": {"edge_min": 0.08, "fee_bp": 40, "daily_bankroll_cap": 1000},
+        "probability_model": {"model_mode": "bands", "zeus_likely_pct": 0.7},
+    })
+    
+    interval_seconds, lookahead_days, trading_config, probability_model_config = (
+        _load_engine_config(config_path)
+    )
+    
+    assert (interval_seconds, lookahead_days) == (300, 1)
+    assert trading_config["edge_min"] == 0.08
+    assert trading_config["fee_bp"] == 40
+    assert trading_config["daily_bankroll_cap"] == 1000.0
+    assert probability_model_config["model_mode"] == "bands"
+    assert probability_model_config["zeus_likely_pct"] == 0.7
+    
+    assert global_config.trading.edge_min == 0.08
+    assert global_config.model_mode == "bands"
+    assert global_config.dynamic_interval_seconds == 300
+    assert global_config.dynamic_lookahead_days == 1
+
+
+def test_load_engine_config_falls_back_to_global(tmp_path: Path, global_config: Config) -> None:
+    """Test values missing from the file come from global config."""
+    global_config.trading.kelly_cap = 0.2
+    global_config.zeus_possible_pct = 0.9
+    global_config.dynamic_interval_seconds = 600
+    config_path = write_engine_config(tmp_path, {"trading": {"edge_min": 0.08}})
+    
+    interval_seconds, lookahead_days, trading_config, probability_model_config = (
+        _load_engine_config(config_path)
+    )
+    
+    assert (interval_seconds, lookahead_days) == (600, 2)
+    assert trading_config == {
+        "edge_min": 0.08,
+        "fee_bp": 50,
+        "slippage_bp": 30,
+        "kelly_cap": 0.2,
+        "per_market_cap": 500.0,
+        "liquidity_min_usd": 1000.0,
+        "daily_bankroll_cap": 3000.0,
+    }
+    assert probability_model_config == {
+        "model_mode": "spread",
+        "zeus_likely_pct": 0.8,
+        "zeus_possible_pct": 0.9,
+    }
+
+
+def test_load_engine_config_normalizes_model_mode(tmp_path: Path, global_config: Config) -> None:
+    """Test model_mode is lowercased like MODEL_MODE is in Config.load."""
+    config_path = write_engine_config(tmp_path, {"probability_model": {"model_mode": "Bands"}})
+    
+    _, _, _, probability_model_config = _load_engine_config(config_path)
+    
+    assert probability_model_config["model_mode"] == "bands"
+    assert global_config.model_mode == "bands"
+
+
+@pytest.mark.parametrize("engine_config", [
+    {"probability_model": {"model_mode": "median"}},
+    {"trading": {"fee_bp": "lots"}},
+    {"interval_seconds": "soon"},
+])
+def test_load_engine_config_rejects_invalid(
+    tmp_path: Path, global_config: Config, engine_config: dict
+) -> None:
+    """Test invalid values raise and leave global config unchanged."""
+    config_path = write_engine_config(tmp_path, engine_config)
+    
+    with pytest.raises(ValueError):
+        _load_engine_config(config_path)
+    
+    assert global_config == Config()
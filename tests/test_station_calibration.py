@@ -0,0 +1,90 @@
+"""Tests for station calibration."""
+
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core.station_calibration import (
+    StationCalibration,
+    get_station_calibration,
+    reload_station_calibration,
+)
+
+
+@pytest.fixture
+def calibration(tmp_path) -> StationCalibration:
+    """Calibration with one station whose bias depends on month and hour."""
+    model = {
+        "station": "TEST",
+        "bias_model": {
+            "bias_matrix_smoothed": [
+                [month + hour / 100 for hour in range(24)] for month in range(12)
+            ],
+        },
+        "elevation": {"elevation_offset_c": 0.25},
+    }
+    (tmp_path / "station_calibration_TEST.json").write_text(json.dumps(model))
+    return StationCalibration(calibration_dir=tmp_path)
+
+
+def test_apply_batch_matches_apply(calibration: StationCalibration) -> None:
+    """Test batch calibration gives exactly the per-point results."""
+    timestamps = [datetime(2025, 11, 30, 12) + timedelta(hours=h) for h in range(36)]
+    temps_c = np.linspace(5.0, 12.0, len(timestamps))
+    
+    corrected = calibration.apply_batch(temps_c, "TEST", timestamps)
+    
+    assert corrected.tolist() == [
+        calibration.apply(temp_c, "TEST", ts)
+        for temp_c, ts in zip(temps_c.tolist(), timestamps)
+    ]
+
+
+def test_apply_batch_without_calibration(calibration: StationCalibration) -> None:
+    """Test stations without a calibration are returned unchanged."""
+    temps_c = np.array([5.0, 6.0])
+    timestamps = [datetime(2025, 11, 30, 12), datetime(2025, 11, 30, 13)]
+    
+    assert calibration.apply_batch(temps_c, "NONE", timestamps) is temps_c
+
+
+def test_station_calibration_singleton(tmp_path, monkeypatch) -> None:
+    """Test calibration models are loaded once until reloaded."""
+    monkeypatch.setattr("core.station_calibration.PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr("core.station_calibration._calibration", None)
+    (tmp_path / "data" / "calibration").mkdir(parents=True)
+    
+    calibration = get_station_calibration()
+    assert get_station_calibration() is calibration
+    
+    reloaded = reload_station_calibration()
+    assert reloaded is not calibration
+    assert get_station_calibration() is reloaded
+
+
+def test_station_calibration_reloads_changed_models(tmp_path, monkeypatch) -> None:
+    """Test the shared calibration follows model files being added or removed."""
+    monkeypatch.setattr("core.station_calibration.PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr("core.station_calibration._calibration", None)
+    calibration_dir = tmp_path / "data" / "calibration"
+    calibration_dir.mkdir(parents=True)
+    
+    calibration = get_station_calibration()
+    assert calibration.get_loaded_stations() == []
+    assert get_station_calibration() is calibration
+    
+    model = {
+        "station": "TEST",
+        "bias_model": {"bias_matrix_smoothed": [[0.5] * 24 for _ in range(12)]},
+        "elevation": {"elevation_offset_c": 0.0},
+    }
+    model_file = calibration_dir / "station_calibration_TEST.json"
+    model_file.write_text(json.dumps(model))
+    added = get_station_calibration()
+    assert added.get_loaded_stations() == ["TEST"]
+    assert get_station_calibration() is added
+    
+    model_file.unlink()
+    assert get_station_calibration().get_loaded_stations() == []